@@ -0,0 +1,117 @@
+"""
+Synthetic task graphs with the shapes that show up in practice.
+
+Every generator returns a graph and a list of output keys, and only uses
+functions from the standard library, so that benchmarks
+measure scheduling and optimization overhead rather than task run time.
+"""
+from operator import add
+
+from dask.blockwise import blockwise
+from dask.highlevelgraph import HighLevelGraph
+
+
+def inc(x):
+    return x + 1
+
+
+def total(*args):
+    return sum(args)
+
+
+def wide_map(width):
+    """ Independent chains of two tasks, like an elementwise map """
+    dsk = {}
+    for i in range(width):
+        dsk[("x", i)] = i
+        dsk[("y", i)] = (inc, ("x", i))
+    return dsk, [("y", i) for i in range(width)]
+
+
+def deep_chain(length):
+    """ A single linear chain of tasks """
+    dsk = {("x", 0): 0}
+    for i in range(1, length):
+        dsk[("x", i)] = (inc, ("x", i - 1))
+    return dsk, [("x", length - 1)]
+
+
+def tree_reduction(width, split_every=4):
+    """ A map followed by a tree reduction, like ``sum`` of an array """
+    dsk, keys = wide_map(width)
+    depth = 0
+    while len(keys) > 1:
+        depth += 1
+        new_keys = []
+        for j, i in enumerate(range(0, len(keys), split_every)):
+            key = ("reduce-%d" % depth, j)
+            dsk[key] = (total,) + tuple(keys[i : i + split_every])
+            new_keys.append(key)
+        keys = new_keys
+    return dsk, keys
+
+
+def shuffle(npartitions):
+    """ An all-to-all exchange between partitions, like a full shuffle """
+    dsk = {}
+    for i in range(npartitions):
+        dsk[("input", i)] = i
+        for j in range(npartitions):
+            dsk[("split", i, j)] = (add, ("input", i), j)
+    for j in range(npartitions):
+        dsk[("output", j)] = (total,) + tuple(
+            ("split", i, j) for i in range(npartitions)
+        )
+    return dsk, [("output", j) for j in range(npartitions)]
+
+
+def rechunk(n):
+    """ Rechunk an ``n x n`` array of blocks from rows to columns """
+    dsk = {}
+    for i in range(n):
+        dsk[("rows", i)] = i
+        for j in range(n):
+            dsk[("piece", i, j)] = (add, ("rows", i), j)
+    for j in range(n):
+        dsk[("columns", j)] = (tuple, [("piece", i, j) for i in range(n)])
+    return dsk, [("columns", j) for j in range(n)]
+
+
+def blockwise_chain(nblocks, depth):
+    """ A ``HighLevelGraph`` of ``depth`` elementwise operations """
+    layers = {"x-0": {("x-0", i): i for i in range(nblocks)}}
+    dependencies = {"x-0": set()}
+    for d in range(1, depth + 1):
+        name, dep = "x-%d" % d, "x-%d" % (d - 1)
+        layers[name] = blockwise(inc, name, "i", dep, "i", numblocks={dep: (nblocks,)})
+        dependencies[name] = {dep}
+    graph = HighLevelGraph(layers, dependencies)
+    return graph, [("x-%d" % depth, i) for i in range(nblocks)]
+
+
+generators = {
+    "wide": wide_map,
+    "chain": deep_chain,
+    "tree": tree_reduction,
+    "shuffle": shuffle,
+    "rechunk": rechunk,
+}
+
+
+def make_graph(kind, ntasks):
+    """Graph of the given kind with roughly ``ntasks`` tasks
+
+    Examples
+    --------
+    >>> dsk, keys = make_graph("tree", 1000)
+    """
+    if kind in ("shuffle", "rechunk"):
+        # These grow quadratically with the number of partitions
+        size = max(int(ntasks ** 0.5), 2)
+    elif kind == "wide":
+        size = max(ntasks // 2, 1)
+    elif kind == "tree":
+        size = max(ntasks * 3 // 7, 1)
+    else:
+        size = ntasks
+    return generators[kind](size)
@@ -0,0 +1,54 @@
+from dask.blockwise import optimize_blockwise
+from dask.optimization import cull, fuse
+
+from .graphs import blockwise_chain, make_graph
+
+kinds = ["wide", "chain", "tree", "shuffle", "rechunk"]
+
+
+class Cull:
+    params = (kinds, [1000, 100000])
+    param_names = ["graph", "ntasks"]
+
+    def setup(self, kind, ntasks):
+        self.dsk, self.keys = make_graph(kind, ntasks)
+
+    def time_cull(self, kind, ntasks):
+        cull(self.dsk, self.keys)
+
+
+class Fuse:
+    params = (kinds, [1000, 100000])
+    param_names = ["graph", "ntasks"]
+
+    def setup(self, kind, ntasks):
+        self.dsk, self.keys = make_graph(kind, ntasks)
+        self.dependencies = cull(self.dsk, self.keys)[1]
+
+    def time_fuse(self, kind, ntasks):
+        fuse(self.dsk, self.keys, dependencies=self.dependencies)
+
+    def peakmem_fuse(self, kind, ntasks):
+        fuse(self.dsk, self.keys, dependencies=self.dependencies)
+
+
+class Blockwise:
+    """ Symbolic high level graph passes on chains of elementwise operations """
+
+    params = ([100, 10000], [2, 20])
+    param_names = ["nblocks", "depth"]
+
+    def setup(self, nblocks, depth):
+        self.graph, self.keys = blockwise_chain(nblocks, depth)
+
+    def time_optimize_blockwise(self, nblocks, depth):
+        optimize_blockwise(self.graph, keys=self.keys)
+
+    def peakmem_optimize_blockwise(self, nblocks, depth):
+        optimize_blockwise(self.graph, keys=self.keys)
+
+    def time_highlevelgraph_cull(self, nblocks, depth):
+        self.graph.cull(set(self.keys[:1]))
+
+    def time_materialize(self, nblocks, depth):
+        dict(optimize_blockwise(self.graph, keys=self.keys))
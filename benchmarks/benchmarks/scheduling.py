@@ -0,0 +1,54 @@
+from timeit import default_timer
+
+from dask.local import get_sync
+from dask.order import order
+from dask.threaded import get as get_threaded
+
+from .graphs import make_graph
+
+kinds = ["wide", "chain", "tree", "shuffle", "rechunk"]
+
+
+class Order:
+    params = (kinds, [1000, 100000])
+    param_names = ["graph", "ntasks"]
+
+    def setup(self, kind, ntasks):
+        self.dsk, _ = make_graph(kind, ntasks)
+
+    def time_order(self, kind, ntasks):
+        order(self.dsk)
+
+    def peakmem_order(self, kind, ntasks):
+        order(self.dsk)
+
+
+class GetSync:
+    """ Per-task overhead of the local scheduler without parallelism """
+
+    params = (kinds, [1000, 20000])
+    param_names = ["graph", "ntasks"]
+    get = staticmethod(get_sync)
+
+    def setup(self, kind, ntasks):
+        self.dsk, self.keys = make_graph(kind, ntasks)
+
+    def time_get(self, kind, ntasks):
+        self.get(self.dsk, self.keys)
+
+    def peakmem_get(self, kind, ntasks):
+        self.get(self.dsk, self.keys)
+
+    def track_tasks_per_second(self, kind, ntasks):
+        start = default_timer()
+        self.get(self.dsk, self.keys)
+        return len(self.dsk) / (default_timer() - start)
+
+    track_tasks_per_second.unit = "tasks/second"
+
+
+class GetThreaded(GetSync):
+    """ Per-task overhead of the threaded scheduler """
+
+    params = (kinds, [1000, 20000])
+    get = staticmethod(get_threaded)
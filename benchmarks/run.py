@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+"""
+Run the benchmark suite without asv and write the results as JSON.
+
+Benchmarks follow the asv conventions: classes in the modules of the
+``benchmarks`` package with ``time_``, ``peakmem_`` and ``track_`` methods,
+optionally parametrized through ``params`` and ``param_names`` and prepared
+by ``setup``.  Raising ``NotImplementedError`` in ``setup`` skips a case.
+
+``time_`` benchmarks report the minimum wall time of several runs in
+seconds, ``peakmem_`` benchmarks the peak memory allocated by Python during
+one run in bytes (measured with ``tracemalloc``), and ``track_`` benchmarks
+their return value.
+
+Examples
+--------
+Run everything and write ``results.json``::
+
+    python benchmarks/run.py -o results.json
+
+Run only ordering benchmarks and compare against earlier results, failing
+if anything got more than 50% worse::
+
+    python benchmarks/run.py -b Order --compare results.json --factor 1.5
+"""
+import argparse
+import importlib
+import itertools
+import json
+import os
+import pkgutil
+import platform
+import re
+import sys
+import tracemalloc
+from timeit import default_timer
+
+here = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, here)
+
+prefixes = ("time_", "peakmem_", "track_")
+
+
+def discover(pattern=None):
+    """ Yield names and functions of all benchmark cases """
+    import benchmarks
+
+    for info in sorted(pkgutil.iter_modules(benchmarks.__path__), key=str):
+        module = importlib.import_module("benchmarks." + info.name)
+        for cls_name, cls in sorted(vars(module).items()):
+            if not isinstance(cls, type) or cls.__module__ != module.__name__:
+                continue
+            params = getattr(cls, "params", [])
+            if params and not isinstance(params[0], (list, tuple)):
+                params = [params]
+            for method in sorted(dir(cls)):
+                if not method.startswith(prefixes):
+                    continue
+                for args in itertools.product(*params):
+                    name = f"{info.name}.{cls_name}.{method}"
+                    if args:
+                        name += "(%s)" % ", ".join(map(str, args))
+                    if pattern is None or re.search(pattern, name):
+                        yield name, cls, method, args
+
+
+def measure(cls, method, args, repeat):
+    """ Run one benchmark case, returning ``None`` if it was skipped """
+    instance = cls()
+    try:
+        if hasattr(instance, "setup"):
+            instance.setup(*args)
+    except NotImplementedError:
+        return None
+    func = getattr(instance, method)
+    try:
+        if method.startswith("time_"):
+            func(*args)  # warm up
+            samples = []
+            for _ in range(repeat):
+                start = default_timer()
+                func(*args)
+                samples.append(default_timer() - start)
+            return {"value": min(samples), "unit": "seconds", "samples": samples}
+        elif method.startswith("peakmem_"):
+            tracemalloc.start()
+            try:
+                func(*args)
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            return {"value": peak, "unit": "bytes"}
+        else:
+            unit = getattr(func, "unit", "unit")
+            return {"value": func(*args), "unit": unit}
+    finally:
+        if hasattr(instance, "teardown"):
+            instance.teardown(*args)
+
+
+def machine_info():
+    import dask
+
+    return {
+        "dask": dask.__version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def compare(old, new, factor):
+    """ Names of benchmarks that got worse by more than ``factor`` """
+    worse = []
+    for name, result in sorted(new.items()):
+        if name not in old or not old[name]["value"] or not result["value"]:
+            continue
+        ratio = result["value"] / old[name]["value"]
+        if result["unit"].endswith("/second"):  # higher is better
+            ratio = 1 / ratio
+        if ratio > factor:
+            worse.append((name, ratio))
+    return worse
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("-b", "--bench", help="Regular expression of names to run")
+    parser.add_argument("-o", "--output", help="File to write JSON results to")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="Timed runs")
+    parser.add_argument("--compare", help="JSON results to compare against")
+    parser.add_argument(
+        "--factor", type=float, default=1.5, help="Ratio that counts as worse"
+    )
+    args = parser.parse_args(argv)
+
+    results = {}
+    for name, cls, method, params in discover(args.bench):
+        result = measure(cls, method, params, args.repeat)
+        if result is None:
+            print(f"{name:<70} skipped")
+            continue
+        results[name] = result
+        print(f"{name:<70} {result['value']:.6g} {result['unit']}")
+
+    output = {"version": 1, "machine": machine_info(), "results": results}
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(output, f, indent=1, sort_keys=True)
+            f.write("\n")
+
+    if args.compare:
+        with open(args.compare) as f:
+            old = json.load(f)["results"]
+        worse = compare(old, results, args.factor)
+        for name, ratio in worse:
+            print(f"{name} got worse by a factor of {ratio:.2f}")
+        return 1 if worse else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
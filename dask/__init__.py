@@ -12,6 +12,7 @@ try:
         visualize,
         annotate,
         compute,
+        compute_async,
         persist,
         optimize,
         is_dask_collection,
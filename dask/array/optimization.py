@@ -6,8 +6,9 @@ import numpy as np
 from .core import getter, getter_nofancy, getter_inline
 from .. import config
 from ..blockwise import optimize_blockwise, fuse_roots
-from ..core import flatten, reverse_dict
+from ..core import flatten, reverse_dict, toposort
 from ..optimization import fuse, inline_functions
+from ..sizeof import sizeof
 from ..utils import ensure_dict
 from ..highlevelgraph import HighLevelGraph
 
@@ -51,6 +52,8 @@ def optimize(
         return dsk
 
     dependencies = dsk.get_all_dependencies()
+    # Tasks that need resources, like IO, stay separate for the scheduler
+    resources = dsk.get_annotated_keys("resources")
     dsk = ensure_dict(dsk)
 
     # Low level task optimizations
@@ -59,11 +62,17 @@ def optimize(
 
     hold = hold_keys(dsk, dependencies)
 
+    if config.get("optimization.fuse.max-fused-bytes", None) is not None:
+        sizes = estimate_nbytes(dsk, dependencies)
+    else:
+        sizes = None
+
     dsk, dependencies = fuse(
         dsk,
-        hold + keys + (fuse_keys or []),
+        hold + keys + list(resources) + (fuse_keys or []),
         dependencies,
         rename_keys=rename_fused_keys,
+        sizes=sizes,
     )
     if inline_functions_fast_functions:
         dsk = inline_functions(
@@ -73,7 +82,12 @@ def optimize(
             fast_functions=inline_functions_fast_functions,
         )
 
-    return optimize_slices(dsk)
+    dsk = optimize_slices(dsk)
+    if resources:
+        dsk = HighLevelGraph.from_annotated(
+            "array-optimize", dsk, {"resources": resources.get}
+        )
+    return dsk
 
 
 def hold_keys(dsk, dependencies):
@@ -114,6 +128,65 @@ def hold_keys(dsk, dependencies):
     return hold_keys
 
 
+def estimate_nbytes(dsk, dependencies):
+    """Estimate the number of bytes of the results of tasks in an array graph
+
+    Data in the graph is measured with ``sizeof`` and slices of it taken by
+    get* functions from their indices.  Other tasks are assumed to produce
+    results as large as their largest dependency, like elementwise operations
+    on chunks.  Tasks without any estimate are left out.
+
+    Examples
+    --------
+    >>> x = np.ones((10, 10))
+    >>> dsk = {'x': x, 'a': (getter, 'x', (slice(0, 5), slice(0, 10))),
+    ...        'b': (np.negative, 'a')}
+    >>> dependencies = {'x': set(), 'a': {'x'}, 'b': {'a'}}
+    >>> sizes = estimate_nbytes(dsk, dependencies)
+    >>> sizes['a'], sizes['b']
+    (400, 400)
+    """
+    sizes = {}
+    for key in toposort(dsk, dependencies=dependencies):
+        task = dsk[key]
+        if type(task) is not tuple:
+            if type(task) is str and task in dsk:  # alias
+                if task in sizes:
+                    sizes[key] = sizes[task]
+            elif not dependencies[key]:
+                sizes[key] = sizeof(task)
+            continue
+        if (
+            task
+            and task[0] in GETTERS
+            and len(task) >= 3
+            and type(task[1]) is str
+            and task[1] in dsk
+        ):
+            nbytes = _getter_nbytes(dsk[task[1]], task[2])
+            if nbytes is not None:
+                sizes[key] = nbytes
+                continue
+        estimates = [sizes[dep] for dep in dependencies[key] if dep in sizes]
+        if estimates:
+            sizes[key] = max(estimates)
+    return sizes
+
+
+def _getter_nbytes(data, index):
+    """ Number of bytes of ``data[index]`` for tuples of slices, if known """
+    shape = getattr(data, "shape", None)
+    dtype = getattr(data, "dtype", None)
+    if shape is None or dtype is None or type(index) is not tuple:
+        return None
+    if len(index) != len(shape) or not all(type(i) is slice for i in index):
+        return None
+    nbytes = dtype.itemsize
+    for i, n in zip(index, shape):
+        nbytes *= len(range(*i.indices(n)))
+    return nbytes
+
+
 def optimize_slices(dsk):
     """Optimize slices
 
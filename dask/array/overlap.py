@@ -2,7 +2,7 @@ import warnings
 from operator import getitem
 from itertools import product
 from numbers import Integral
-from tlz import merge, pipe, concat, partial, get
+from tlz import concat, partial, get
 from tlz.curried import map
 
 from . import chunk
@@ -10,15 +10,13 @@ from .core import (
     Array,
     map_blocks,
     concatenate,
-    concatenate3,
     reshapelist,
     unify_chunks,
 )
 from .creation import empty_like, full_like
 from ..highlevelgraph import HighLevelGraph
+from ..layers import ArrayOverlapLayer
 from ..base import tokenize
-from ..core import flatten
-from ..utils import concrete
 
 
 def fractional_slice(task, axes):
@@ -130,28 +128,9 @@ def overlap_internal(x, axes):
     The axes input informs how many cells to overlap between neighboring blocks
     {0: 2, 2: 5} means share two cells in 0 axis, 5 cells in 2 axis
     """
-    dims = list(map(len, x.chunks))
-    expand_key2 = partial(expand_key, dims=dims, axes=axes)
-
-    # Make keys for each of the surrounding sub-arrays
-    interior_keys = pipe(
-        x.__dask_keys__(), flatten, map(expand_key2), map(flatten), concat, list
-    )
-
     name = "overlap-" + tokenize(x, axes)
     getitem_name = "getitem-" + tokenize(x, axes)
-    interior_slices = {}
-    overlap_blocks = {}
-    for k in interior_keys:
-        frac_slice = fractional_slice((x.name,) + k, axes)
-        if (x.name,) + k != frac_slice:
-            interior_slices[(getitem_name,) + k] = frac_slice
-        else:
-            interior_slices[(getitem_name,) + k] = (x.name,) + k
-            overlap_blocks[(name,) + k] = (
-                concatenate3,
-                (concrete, expand_key2((None,) + k, name=getitem_name)),
-            )
+    layer = ArrayOverlapLayer(name, getitem_name, x.name, x.numblocks, axes)
 
     chunks = []
     for i, bds in enumerate(x.chunks):
@@ -173,8 +152,7 @@ def overlap_internal(x, axes):
                 mid.append(bd + left_depth + right_depth)
             chunks.append(left + mid + right)
 
-    dsk = merge(interior_slices, overlap_blocks)
-    graph = HighLevelGraph.from_collections(name, dsk, dependencies=[x])
+    graph = HighLevelGraph.from_collections(name, layer, dependencies=[x])
 
     return Array(graph, name, chunks, meta=x)
 
@@ -11,17 +11,17 @@ from functools import reduce
 from typing import Tuple
 from warnings import warn
 
-from itertools import product, chain, count
-from operator import getitem, add, mul, itemgetter
+from itertools import product, chain
+from operator import add, mul, itemgetter
 
 import numpy as np
-import tlz as toolz
 from tlz import accumulate
 
 from ..base import tokenize
 from ..highlevelgraph import HighLevelGraph
+from ..layers import ArrayRechunkLayer
 from ..utils import parse_bytes
-from .core import concatenate3, Array, normalize_chunks
+from .core import Array, normalize_chunks
 from .utils import validate_axis
 from .wrap import empty
 from .. import config
@@ -560,57 +560,10 @@ def _compute_rechunk(x, chunks):
         # Special case for empty array, as the algorithm below does not behave correctly
         return empty(x.shape, chunks=chunks, dtype=x.dtype)
 
-    ndim = x.ndim
-    crossed = intersect_chunks(x.chunks, chunks)
-    x2 = dict()
-    intermediates = dict()
     token = tokenize(x, chunks)
     merge_name = "rechunk-merge-" + token
     split_name = "rechunk-split-" + token
-    split_name_suffixes = count()
-
-    # Pre-allocate old block references, to allow re-use and reduce the
-    # graph's memory footprint a bit.
-    old_blocks = np.empty([len(c) for c in x.chunks], dtype="O")
-    for index in np.ndindex(old_blocks.shape):
-        old_blocks[index] = (x.name,) + index
-
-    # Iterate over all new blocks
-    new_index = product(*(range(len(c)) for c in chunks))
-
-    for new_idx, cross1 in zip(new_index, crossed):
-        key = (merge_name,) + new_idx
-        old_block_indices = [[cr[i][0] for cr in cross1] for i in range(ndim)]
-        subdims1 = [len(set(old_block_indices[i])) for i in range(ndim)]
-
-        rec_cat_arg = np.empty(subdims1, dtype="O")
-        rec_cat_arg_flat = rec_cat_arg.flat
-
-        # Iterate over the old blocks required to build the new block
-        for rec_cat_index, ind_slices in enumerate(cross1):
-            old_block_index, slices = zip(*ind_slices)
-            name = (split_name, next(split_name_suffixes))
-            old_index = old_blocks[old_block_index][1:]
-            if all(
-                slc.start == 0 and slc.stop == x.chunks[i][ind]
-                for i, (slc, ind) in enumerate(zip(slices, old_index))
-            ):
-                rec_cat_arg_flat[rec_cat_index] = old_blocks[old_block_index]
-            else:
-                intermediates[name] = (getitem, old_blocks[old_block_index], slices)
-                rec_cat_arg_flat[rec_cat_index] = name
-
-        assert rec_cat_index == rec_cat_arg.size - 1
-
-        # New block is formed by concatenation of sliced old blocks
-        if all(d == 1 for d in rec_cat_arg.shape):
-            x2[key] = rec_cat_arg.flat[0]
-        else:
-            x2[key] = (concatenate3, rec_cat_arg.tolist())
-
-    del old_blocks, new_index
-
-    layer = toolz.merge(x2, intermediates)
+    layer = ArrayRechunkLayer(merge_name, split_name, x.name, x.chunks, chunks)
     graph = HighLevelGraph.from_collections(merge_name, layer, dependencies=[x])
     return Array(graph, merge_name, chunks, meta=x)
 
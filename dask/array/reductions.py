@@ -13,13 +13,13 @@ from tlz import compose, partition_all, get, accumulate, pluck, drop
 from . import chunk
 from .core import _concatenate2, Array, handle_out, implements
 from .blockwise import blockwise
-from ..blockwise import lol_tuples
 from .creation import arange, diagonal
 from .utils import full_like_safe, validate_axis, compute_meta, is_arraylike
 from .wrap import zeros, ones
 from .numpy_compat import ma_divide, divide as np_divide
 from ..base import tokenize
 from ..highlevelgraph import HighLevelGraph
+from ..layers import ArrayPartialReduceLayer
 from ..utils import (
     ignoring,
     funcname,
@@ -285,27 +285,17 @@ def partial_reduce(
     name = (
         (name or funcname(func)) + "-" + tokenize(func, x, split_every, keepdims, dtype)
     )
-    parts = [
-        list(partition_all(split_every.get(i, 1), range(n)))
-        for (i, n) in enumerate(x.numblocks)
-    ]
-    keys = product(*map(range, map(len, parts)))
     out_chunks = [
         tuple(1 for p in partition_all(split_every[i], c)) if i in split_every else c
         for (i, c) in enumerate(x.chunks)
     ]
     if not keepdims:
         out_axis = [i for i in range(x.ndim) if i not in split_every]
-        getter = lambda k: get(out_axis, k)
-        keys = map(getter, keys)
-        out_chunks = list(getter(out_chunks))
-    dsk = {}
-    for k, p in zip(keys, product(*parts)):
-        decided = dict((i, j[0]) for (i, j) in enumerate(p) if len(j) == 1)
-        dummy = dict(i for i in enumerate(p) if i[0] not in decided)
-        g = lol_tuples((x.name,), range(x.ndim), decided, dummy)
-        dsk[(name,) + k] = (func, g)
-    graph = HighLevelGraph.from_collections(name, dsk, dependencies=[x])
+        out_chunks = list(get(out_axis, out_chunks))
+    layer = ArrayPartialReduceLayer(
+        name, func, x.name, x.numblocks, split_every, keepdims
+    )
+    graph = HighLevelGraph.from_collections(name, layer, dependencies=[x])
 
     meta = x._meta
     if reduced_meta is not None:
@@ -9,7 +9,13 @@ from dask.highlevelgraph import HighLevelGraph
 from dask.optimization import fuse
 from dask.utils import SerializableLock
 from dask.array.core import getter, getter_nofancy
-from dask.array.optimization import getitem, optimize, optimize_slices, fuse_slice
+from dask.array.optimization import (
+    estimate_nbytes,
+    getitem,
+    optimize,
+    optimize_slices,
+    fuse_slice,
+)
 from dask.array.utils import assert_eq
 
 
@@ -432,3 +438,46 @@ def test_fuse_roots_annotations():
     assert {"foo": "bar"} in [l.annotations for l in hlg.layers.values()]
     za = da.Array(hlg, z.name, z.chunks, z.dtype)
     assert_eq(za, z)
+
+
+def test_fuse_roots_keeps_reductions():
+    x = da.ones((8, 8), chunks=(2, 2))
+    y = (x + 1).sum(axis=0, split_every=2)
+    z = y + da.zeros(8, chunks=(2,))
+
+    # Fusing the reduction into the four output tasks would lose parallelism
+    hlg = dask.blockwise.optimize_blockwise(z.dask)
+    fused = dask.blockwise.fuse_roots(
+        hlg, keys=list(dask.core.flatten(z.__dask_keys__()))
+    )
+    assert fused.layers.keys() == hlg.layers.keys()
+    assert len(dict(fused)) == len(dict(hlg))
+    assert_eq(z, np.full(8, 16.0))
+
+
+def test_estimate_nbytes():
+    x = np.ones((10, 10))
+    d = da.from_array(x, chunks=(5, 2))
+    y = (d + 1).sum(axis=0, split_every=2)
+    dsk = dict(y.__dask_graph__())
+    dependencies = y.__dask_graph__().get_all_dependencies()
+    sizes = estimate_nbytes(dsk, dependencies)
+    assert sizes[(d.name, 0, 0)] == 5 * 2 * 8
+    assert sizes[((d + 1).name, 1, 4)] == 5 * 2 * 8
+
+
+def test_optimize_max_fused_bytes():
+    x = np.ones((100, 100))
+    d = da.from_array(x, chunks=(10, 100))
+    y = (d + 1).sum(split_every=10)
+    keys = y.__dask_keys__()
+
+    with dask.config.set({"optimization.fuse.ave-width": 10}):
+        unlimited = optimize(y.__dask_graph__(), keys)
+        with dask.config.set({"optimization.fuse.max-fused-bytes": "10kB"}):
+            limited = optimize(y.__dask_graph__(), keys)
+    # Each chunk holds 8 kB, so fusing several of them into a reduction is
+    # not allowed
+    assert len(limited) > len(unlimited)
+    with dask.config.set({"optimization.fuse.max-fused-bytes": "10kB"}):
+        assert_eq(y, x.sum() + 100 * 100)
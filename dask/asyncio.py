@@ -0,0 +1,214 @@
+"""
+An asyncio scheduler for Dask graphs
+
+This scheduler walks the same state machine as ``dask.local.get_async`` but
+yields to the event loop while tasks run on a thread pool.  It is meant for
+programs that are already built on ``asyncio``, like web services, which
+would otherwise block the event loop with ``dask.compute``.
+
+Many computations can share one thread pool at the same time.  Each keeps at
+most ``num_workers`` tasks in flight, so tasks from concurrent graphs are
+interleaved in the pool's queue.  Cancelling the awaiting task cancels all
+tasks of that computation that have not started yet.
+
+See Also
+--------
+dask.compute_async
+"""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
+from . import config
+from .callbacks import local_callbacks, unpack_callbacks
+from .core import flatten, _execute_task
+from .local import (
+    execute_task,
+    finish_task,
+    identity,
+    nested_get,
+    prepare_graph,
+    reraise,
+    start_state_from_dask,
+)
+from .order import order
+from .system import CPU_COUNT
+from .threaded import _thread_get_id, pack_exception
+
+default_executor = None
+default_executor_lock = Lock()
+
+
+def get_default_executor():
+    """ Thread pool shared by all asyncio computations """
+    global default_executor
+    with default_executor_lock:
+        if default_executor is None:
+            default_executor = ThreadPoolExecutor(CPU_COUNT)
+        return default_executor
+
+
+async def get(
+    dsk,
+    result,
+    cache=None,
+    num_workers=None,
+    executor=None,
+    rerun_exceptions_locally=None,
+    raise_exception=reraise,
+    callbacks=None,
+    dependencies=None,
+    **kwargs
+):
+    """Asynchronous get function for use with asyncio
+
+    Parameters
+    ----------
+    dsk : dict
+        A dask dictionary specifying a workflow
+    result : key or list of keys
+        Keys corresponding to desired data
+    cache : dict-like, optional
+        Temporary storage of results
+    num_workers : int, optional
+        The number of tasks of this computation to run at any one time.
+        Defaults to the ``num_workers`` configuration value, or the number of
+        threads of the executor.
+    executor : concurrent.futures.Executor, optional
+        Executor to run tasks on.  Defaults to a thread pool shared by all
+        computations.
+    rerun_exceptions_locally : bool, optional
+        Whether to rerun failing tasks in the event loop's thread to enable
+        debugging (False by default)
+    raise_exception : callable, optional
+        Function that takes an exception and a traceback, and raises an error.
+    callbacks : tuple or list of tuples, optional
+        Callbacks are passed in as tuples of length 5. Multiple sets of
+        callbacks may be passed in as a list of tuples. For more information,
+        see the dask.diagnostics documentation.
+    dependencies : dict, optional
+        Mapping of each key in ``dsk`` to the set of keys it depends on, if
+        already known.
+
+    Examples
+    --------
+    >>> dsk = {'x': 1, 'y': 2, 'z': (inc, 'x'), 'w': (add, 'z', 'y')}  # doctest: +SKIP
+    >>> await get(dsk, 'w')  # doctest: +SKIP
+    4
+
+    See Also
+    --------
+    dask.local.get_async
+    """
+    loop = asyncio.get_running_loop()
+    executor = executor or get_default_executor()
+    num_workers = (
+        num_workers
+        or config.get("num_workers", None)
+        or getattr(executor, "_max_workers", None)
+        or CPU_COUNT
+    )
+
+    if isinstance(result, list):
+        result_flat = set(flatten(result))
+    else:
+        result_flat = set([result])
+    results = set(result_flat)
+
+    dsk = dict(dsk)
+    running = dict()  # {future: key}
+    with local_callbacks(callbacks) as callbacks:
+        _, _, pretask_cbs, posttask_cbs, _ = unpack_callbacks(callbacks)
+        started_cbs = []
+        succeeded = False
+        state = {}
+        try:
+            for cb in callbacks:
+                if cb[0]:
+                    cb[0](dsk)
+                started_cbs.append(cb)
+
+            dsk, dependencies = prepare_graph(
+                dsk, result_flat, cache, started_cbs, dependencies
+            )
+
+            keyorder = order(dsk, dependencies=dependencies)
+
+            state = start_state_from_dask(
+                dsk, cache=cache, sortkey=keyorder.get, dependencies=dependencies
+            )
+
+            for _, start_state, _, _, _ in callbacks:
+                if start_state:
+                    start_state(dsk, state)
+
+            if rerun_exceptions_locally is None:
+                rerun_exceptions_locally = config.get("rerun_exceptions_locally", False)
+
+            if state["waiting"] and not state["ready"]:
+                raise ValueError("Found no accessible jobs in dask")
+
+            def fire_task():
+                """ Submit a task to the executor """
+                key = state["ready"].pop()
+                state["running"].add(key)
+                for f in pretask_cbs:
+                    f(key, dsk, state)
+
+                data = dict(
+                    (dep, state["cache"][dep]) for dep in state["dependencies"][key]
+                )
+                future = loop.run_in_executor(
+                    executor,
+                    execute_task,
+                    key,
+                    (dsk[key], data),
+                    identity,
+                    identity,
+                    _thread_get_id,
+                    pack_exception,
+                )
+                running[future] = key
+
+            # Seed initial tasks into the executor
+            while state["ready"] and len(running) < num_workers:
+                fire_task()
+
+            # Main loop, wait on tasks to finish, insert new ones
+            while state["waiting"] or state["ready"] or state["running"]:
+                done, _ = await asyncio.wait(
+                    list(running), return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in sorted(done, key=lambda f: keyorder[running[f]]):
+                    del running[future]
+                    key, res_info, failed = future.result()
+                    if failed:
+                        exc, tb = res_info
+                        if rerun_exceptions_locally:
+                            data = dict(
+                                (dep, state["cache"][dep])
+                                for dep in state["dependencies"][key]
+                            )
+                            _execute_task(dsk[key], data)  # Re-execute locally
+                        else:
+                            raise_exception(exc, tb)
+                    res, worker_id = res_info
+                    state["cache"][key] = res
+                    finish_task(dsk, key, state, results, keyorder.get)
+                    for f in posttask_cbs:
+                        f(key, res, dsk, state, worker_id)
+
+                while state["ready"] and len(running) < num_workers:
+                    fire_task()
+
+            succeeded = True
+
+        finally:
+            # On errors and cancellation drop tasks that have not started yet
+            for future in running:
+                future.cancel()
+            for _, _, _, _, finish in started_cbs:
+                if finish:
+                    finish(dsk, state, not succeeded)
+
+    return nested_get(result, state["cache"])
@@ -38,6 +38,7 @@ from tlz import (
 from .. import config
 from .avro import to_avro
 from ..base import tokenize, dont_optimize, replace_name_in_key, DaskMethodsMixin
+from ..blockwise import fuse_roots
 from ..bytes import open_files
 from ..context import globalmethod
 from ..core import (
@@ -140,14 +141,26 @@ def inline_singleton_lists(dsk, keys, dependencies=None):
 
 def optimize(dsk, keys, fuse_keys=None, rename_fused_keys=None, **kwargs):
     """ Optimize a dask from a dask Bag. """
+    resources = {}
+    if isinstance(dsk, HighLevelGraph):
+        # Read paired inputs, like both sides of a zip, in the same task
+        dsk = fuse_roots(dsk, keys=keys + (fuse_keys or []))
+        # Tasks that need resources, like IO, stay separate for the scheduler
+        resources = dsk.get_annotated_keys("resources")
     dsk = ensure_dict(dsk)
     dsk2, dependencies = cull(dsk, keys)
     kwargs = {}
     if rename_fused_keys is not None:
         kwargs["rename_keys"] = rename_fused_keys
-    dsk3, dependencies = fuse(dsk2, keys + (fuse_keys or []), dependencies, **kwargs)
-    dsk4 = inline_singleton_lists(dsk3, keys, dependencies)
+    dsk3, dependencies = fuse(
+        dsk2, keys + (fuse_keys or []) + list(resources), dependencies, **kwargs
+    )
+    dsk4 = inline_singleton_lists(dsk3, keys + list(resources), dependencies)
     dsk5 = lazify(dsk4)
+    if resources:
+        dsk5 = HighLevelGraph.from_annotated(
+            "bag-optimize", dsk5, {"resources": resources.get}
+        )
     return dsk5
 
 
@@ -1426,6 +1426,31 @@ def test_optimize_fuse_keys():
     assert all(k in dsk for k in y.__dask_keys__())
 
 
+def test_optimize_fuse_roots():
+    x = db.range(10, npartitions=2).map(inc)
+    y = db.range(20, npartitions=2).filter(lambda i: i % 2)
+    z = db.zip(x, y)
+
+    # Both inputs of each zip partition are read in the same task
+    dsk = z.__dask_optimize__(z.__dask_graph__(), z.__dask_keys__())
+    tasks = {k: v for k, v in dsk.items() if not isinstance(v, tuple) or callable(v[0])}
+    assert len(tasks) == z.npartitions
+    assert list(z) == list(zip(range(1, 11), range(1, 20, 2)))
+
+
+def test_optimize_fuse_roots_nested():
+    a = db.from_sequence(range(4), npartitions=2)
+    b = db.from_sequence(range(4, 8), npartitions=2)
+    c = db.from_sequence(range(8, 12), npartitions=2)
+    z1 = db.zip(a, b)
+    z2 = db.zip(z1, c)
+
+    # The outer zip depends on the inner one once that has been fused
+    r1, r2 = dask.compute(z1, z2)
+    assert r1 == list(zip(range(4), range(4, 8)))
+    assert r2 == list(zip(r1, range(8, 12)))
+
+
 def test_reductions_are_lazy():
     current = [None]
 
@@ -10,6 +10,7 @@ import pickle
 import os
 import threading
 import uuid
+import weakref
 
 from tlz import merge, groupby, curry, identity
 from tlz.functoolz import Compose
@@ -17,8 +18,8 @@ from tlz.functoolz import Compose
 from .compatibility import is_dataclass, dataclass_fields
 from .context import thread_state
 from .core import flatten, quote, get as simple_get, literal
-from .hashing import hash_buffer_hex
-from .utils import Dispatch, ensure_dict, apply, key_split
+from .hashing import hash_buffer_hex, hash_buffer_chunked_hex
+from .utils import Dispatch, ensure_dict, apply, key_split, parse_bytes
 from . import config, local, threaded
 
 
@@ -27,6 +28,7 @@ __all__ = (
     "annotate",
     "is_dask_collection",
     "compute",
+    "compute_async",
     "persist",
     "optimize",
     "visualize",
@@ -343,6 +345,12 @@ def collections_to_dsk(collections, optimize_graph=True, optimizations=(), **kwa
             dsk = HighLevelGraph.merge(*graphs)
         else:
             dsk = merge(*map(ensure_dict, graphs))
+
+        if config.get("optimization.cse.active", False):
+            from .optimization import cse
+
+            keys = [v.__dask_keys__() for v in collections]
+            dsk, _ = cse(ensure_dict(dsk), keys)
     else:
         dsk, _ = _extract_graph_and_keys(collections)
 
@@ -561,10 +569,93 @@ def compute(*args, **kwargs):
         keys.append(x.__dask_keys__())
         postcomputes.append(x.__dask_postcompute__())
 
+    if schedule is threaded.get and "resources" not in kwargs:
+        resources = _annotated_resources(dsk, collections)
+        if resources:
+            kwargs["resources"] = resources
+
     results = schedule(dsk, keys, **kwargs)
     return repack([f(r, *a) for r, (f, a) in zip(results, postcomputes)])
 
 
+def _annotated_resources(dsk, collections):
+    """Resources that tasks need, from ``resources`` annotations
+
+    Low level optimizations return plain dicts, in which case we fall back to
+    the annotations of the unoptimized graphs of ``collections``.
+    """
+    from .highlevelgraph import HighLevelGraph
+
+    if isinstance(dsk, HighLevelGraph):
+        return dsk.get_annotated_keys("resources")
+    resources = {}
+    for c in collections:
+        graph = c.__dask_graph__()
+        if isinstance(graph, HighLevelGraph):
+            resources.update(graph.get_annotated_keys("resources"))
+    return resources
+
+
+async def compute_async(*args, **kwargs):
+    """Compute several dask collections at once without blocking asyncio
+
+    Like ``compute``, but a coroutine that runs the tasks on a thread pool
+    while yielding to the event loop.  Cancelling the awaiting task cancels
+    all tasks of the computation that have not started yet.
+
+    Parameters
+    ----------
+    args : object
+        Any number of objects. If it is a dask object, it's computed and the
+        result is returned. By default, python builtin collections are also
+        traversed to look for dask objects (for more information see the
+        ``traverse`` keyword). Non-dask arguments are passed through unchanged.
+    traverse : bool, optional
+        By default dask traverses builtin python collections looking for dask
+        objects passed to ``compute_async``. For large collections this can be
+        expensive. If none of the arguments contain any dask objects, set
+        ``traverse=False`` to avoid doing this traversal.
+    optimize_graph : bool, optional
+        If True [default], the optimizations for each collection are applied
+        before computation. Otherwise the graph is run as is. This can be
+        useful for debugging.
+    kwargs
+        Extra keywords to forward to ``dask.asyncio.get``, like ``executor``
+        or ``num_workers``.
+
+    Examples
+    --------
+    >>> import dask as d
+    >>> import dask.array as da
+    >>> a = da.arange(10, chunks=2).sum()
+    >>> b = da.arange(10, chunks=2).mean()
+    >>> await d.compute_async(a, b)  # doctest: +SKIP
+    (45, 4.5)
+
+    See Also
+    --------
+    compute
+    dask.asyncio.get
+    """
+    from .asyncio import get
+
+    traverse = kwargs.pop("traverse", True)
+    optimize_graph = kwargs.pop("optimize_graph", True)
+
+    collections, repack = unpack_collections(*args, traverse=traverse)
+    if not collections:
+        return args
+
+    dsk = collections_to_dsk(collections, optimize_graph, **kwargs)
+    keys, postcomputes = [], []
+    for x in collections:
+        keys.append(x.__dask_keys__())
+        postcomputes.append(x.__dask_postcompute__())
+
+    results = await get(dsk, keys, **kwargs)
+    return repack([f(r, *a) for r, (f, a) in zip(results, postcomputes)])
+
+
 def visualize(*args, **kwargs):
     """
     Visualize several dask graphs at once.
@@ -957,6 +1048,50 @@ def register_pandas():
         return normalize_token(dtype.name)
 
 
+array_token_cache = {}  # {id(array): (weakref to array, token)}
+
+
+def _is_read_only(x):
+    """Whether the buffer of a NumPy array can never change
+
+    Only arrays backed by an immutable buffer, like ``bytes`` or a read-only
+    ``mmap``, qualify.  Arrays that own their data do not, since they can be
+    made writeable again with ``setflags``.
+    """
+    import numpy as np
+
+    while isinstance(x, np.ndarray):
+        if x.flags.writeable:
+            return False
+        x = x.base
+    if x is None:
+        return False
+    try:
+        with memoryview(x) as buf:
+            return buf.readonly
+    except TypeError:
+        return False
+
+
+def _sample_buffer(buf, nsamples=64, sample_bytes=2 ** 16):
+    """ Evenly spaced blocks of a large contiguous buffer, for hashing """
+    buf = memoryview(buf).cast("B")
+    step = (buf.nbytes - sample_bytes) // (nsamples - 1)
+    blocks = [buf[i * step : i * step + sample_bytes] for i in range(nsamples)]
+    return str(buf.nbytes).encode() + b"".join(blocks)
+
+
+def _hash_array_buffer(x):
+    try:
+        buf = x.ravel(order="K").view("i1")
+    except (BufferError, AttributeError, ValueError):
+        buf = x.copy().ravel(order="K").view("i1")
+    threshold = config.get("tokenize.sample-threshold", None)
+    if threshold is not None and buf.nbytes > max(parse_bytes(threshold), 2 ** 23):
+        return "sample-" + hash_buffer_hex(_sample_buffer(buf))
+    return hash_buffer_chunked_hex(buf)
+
+
 @normalize_token.register_lazy("numpy")
 def register_numpy():
     import numpy as np
@@ -965,6 +1100,26 @@ def register_numpy():
     def normalize_array(x):
         if not x.shape:
             return (x.item(), x.dtype)
+        if not config.get("tokenize.cache", True) or not _is_read_only(x):
+            return _normalize_array(x)
+        # Arrays backed by immutable buffers can not change, so remember their
+        # token for as long as they live.  Repeated calls, like in from_array, are then free.
+        i = id(x)
+        try:
+            ref, token = array_token_cache[i]
+        except KeyError:
+            pass
+        else:
+            if ref() is x:
+                return token
+        token = _normalize_array(x)
+        array_token_cache[i] = (
+            weakref.ref(x, lambda _: array_token_cache.pop(i, None)),
+            token,
+        )
+        return token
+
+    def _normalize_array(x):
         if hasattr(x, "mode") and getattr(x, "filename", None):
             if hasattr(x.base, "ctypes"):
                 offset = (
@@ -1004,10 +1159,7 @@ def register_numpy():
                     # pickling not supported, use UUID4-based fallback
                     data = uuid.uuid4().hex
         else:
-            try:
-                data = hash_buffer_hex(x.ravel(order="K").view("i1"))
-            except (BufferError, AttributeError, ValueError):
-                data = hash_buffer_hex(x.copy().ravel(order="K").view("i1"))
+            data = _hash_array_buffer(x)
         return (data, x.dtype, x.shape, x.strides)
 
     @normalize_token.register(np.matrix)
@@ -4,7 +4,7 @@ import warnings
 import tlz as toolz
 
 from .compatibility import prod
-from .core import reverse_dict, flatten, keys_in_tasks
+from .core import reverse_dict, flatten, keys_in_tasks, get_dependencies, istask
 from .delayed import unpack_collections
 from .highlevelgraph import HighLevelGraph, Layer
 from .optimization import SubgraphCallable, fuse
@@ -890,6 +890,9 @@ def _optimize_blockwise(full_graph, keys=()):
         if isinstance(layers[layer], Blockwise):
             blockwise_layers = {layer}
             deps = set(blockwise_layers)
+            # Only layers that contract indices care about ``concatenate``
+            contracts = bool(_contracted_indices(layers[layer]))
+            concatenate = layers[layer].concatenate
             while deps:  # we gather as many sub-layers as we can
                 dep = deps.pop()
 
@@ -902,7 +905,12 @@ def _optimize_blockwise(full_graph, keys=()):
                 if dep != layer and dep in keep:
                     stack.append(dep)
                     continue
-                if layers[dep].concatenate != layers[layer].concatenate:
+                dep_contracts = bool(_contracted_indices(layers[dep]))
+                if (
+                    dep_contracts
+                    and contracts
+                    and layers[dep].concatenate != concatenate
+                ):
                     stack.append(dep)
                     continue
                 if (
@@ -921,24 +929,21 @@ def _optimize_blockwise(full_graph, keys=()):
 
                 # passed everything, proceed
                 blockwise_layers.add(dep)
+                if dep_contracts:
+                    contracts = True
+                    concatenate = layers[dep].concatenate
 
                 # traverse further to this child's children
                 for d in full_graph.dependencies.get(dep, ()):
                     # Don't allow reductions to proceed
-                    output_indices = set(layers[dep].output_indices)
-                    input_indices = {
-                        i for _, ind in layers[dep].indices if ind for i in ind
-                    }
-
-                    if len(dependents[d]) <= 1 and output_indices.issuperset(
-                        input_indices
-                    ):
+                    if len(dependents[d]) <= 1 and _is_elementwise(layers[dep]):
                         deps.add(d)
                     else:
                         stack.append(d)
 
             # Merge these Blockwise layers into one
             new_layer = rewrite_blockwise([layers[l] for l in blockwise_layers])
+            new_layer.concatenate = concatenate
             out[layer] = new_layer
 
             new_deps = set()
@@ -956,6 +961,38 @@ def _optimize_blockwise(full_graph, keys=()):
     return HighLevelGraph(out, dependencies)
 
 
+def _contracted_indices(layer):
+    """Indices of a Blockwise layer's inputs that are not in its output"""
+    return {i for _, ind in layer.indices if ind is not None for i in ind} - set(
+        layer.output_indices
+    )
+
+
+def _is_elementwise(layer):
+    """Whether each output block of a Blockwise layer depends on a single block
+    of every input
+
+    This holds when no indices are contracted, or when every contracted index
+    spans a single block and is concatenated away, as when a one-column-block
+    array becomes a dataframe.
+    """
+    contracted = _contracted_indices(layer)
+    if not contracted:
+        return True
+    if layer.concatenate is not True:
+        return False
+    for name, ind in layer.indices:
+        if ind is None:
+            continue
+        numblocks = layer.numblocks.get(name)
+        for i, n in zip(ind, numblocks or ()):
+            if i in contracted and n != 1:
+                return False
+        if numblocks is None and contracted.intersection(ind):
+            return False
+    return True
+
+
 def rewrite_blockwise(inputs):
     """Rewrite a stack of Blockwise expressions into a single blockwise expression
 
@@ -1185,6 +1222,29 @@ def _make_dims(indices, numblocks, new_axes):
     return dims
 
 
+def _exclusive_ancestors(deps, layers, dependencies, dependents):
+    """All layers upstream of ``deps``, if they feed nothing else
+
+    Returns ``None`` if any upstream layer has a dependent outside of this set
+    other than the layer that consumes ``deps``, or if any of them has fewer
+    tasks than its inputs, like a reduction or a contraction.  Fusing those
+    would collapse parallel branches into a few large tasks.
+    """
+    ancestors = set()
+    stack = list(deps)
+    while stack:
+        dep = stack.pop()
+        if dep in ancestors:
+            continue
+        if len(dependents[dep]) != 1:
+            return None
+        if len(layers[dep]) < sum(len(layers[d]) for d in dependencies[dep]):
+            return None
+        ancestors.add(dep)
+        stack.extend(dependencies[dep])
+    return ancestors
+
+
 def fuse_roots(graph: HighLevelGraph, keys: list):
     """
     Fuse nearby layers if they don't have dependencies
@@ -1203,7 +1263,15 @@ def fuse_roots(graph: HighLevelGraph, keys: list):
     concrete dicts, and then calls ``fuse`` on them, with a width equal to the
     number of layers like X, Y, and Z.
 
-    This is currently used within array and dataframe optimizations.
+    X, Y, and Z need not be single layers.  Any stack of layers that only
+    feeds into the consuming layer is included, which covers data loading
+    that spans several layers, like ``dask.bag.read_text``.  Stacks with
+    reductions are left alone, so that fusion keeps the number of parallel
+    tasks.  The consuming
+    layer need not be ``Blockwise`` either, so partition-aligned operations
+    like ``dask.bag.zip`` or aligned merges also qualify.
+
+    This is currently used within array, dataframe, and bag optimizations.
 
     Parameters
     ----------
@@ -1221,23 +1289,32 @@ def fuse_roots(graph: HighLevelGraph, keys: list):
     dependencies = ensure_dict(graph.dependencies, copy=True)
     dependents = reverse_dict(dependencies)
 
-    for name, layer in graph.layers.items():
-        deps = graph.dependencies[name]
-        if (
-            isinstance(layer, Blockwise)
-            and len(deps) > 1
-            and not any(dependencies[dep] for dep in deps)  # no need to fuse if 0 or 1
-            and all(len(dependents[dep]) == 1 for dep in deps)
-            and all(layer.annotations == graph.layers[dep].annotations for dep in deps)
+    for name in graph.layers:
+        if name not in layers:  # already fused into another layer
+            continue
+        deps = dependencies[name]
+        if len(deps) <= 1:  # no need to fuse if 0 or 1
+            continue
+        ancestors = _exclusive_ancestors(deps, layers, dependencies, dependents)
+        if ancestors is None or any(
+            graph.layers[name].annotations != graph.layers[dep].annotations
+            for dep in ancestors
         ):
-            new = toolz.merge(layer, *[layers[dep] for dep in deps])
-            new, _ = fuse(new, keys, ave_width=len(deps))
+            continue
+
+        new = toolz.merge(layers[name], *[layers[dep] for dep in ancestors])
+        # Like ``hold_keys`` for arrays, leave data that is already in the graph
+        # with its first consumer, which only needs to move a small piece of it
+        new_dependencies = {k: get_dependencies(new, k) for k in new}
+        data = {k for k, v in new.items() if not istask(v) and not new_dependencies[k]}
+        hold = [k for k, v in new_dependencies.items() if v & data]
+        new, _ = fuse(new, keys + hold, new_dependencies, ave_width=len(deps))
 
-            for dep in deps:
-                del layers[dep]
-                del dependencies[dep]
+        for dep in ancestors:
+            del layers[dep]
+            del dependencies[dep]
 
-            layers[name] = new
-            dependencies[name] = set()
+        layers[name] = new
+        dependencies[name] = set()
 
     return HighLevelGraph(layers, dependencies)
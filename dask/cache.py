@@ -1,14 +1,241 @@
 from .callbacks import Callback
+from .sizeof import sizeof
+from .spill import File
+from .utils import parse_bytes
+from collections import defaultdict
+from collections.abc import Mapping
 from timeit import default_timer
 from numbers import Number
+import heapq
+import itertools
+import pickle
 import sys
 
 overhead = sys.getsizeof(1.23) * 4 + sys.getsizeof(()) * 4
 
 
+def lru(cost, nbytes, hits, last_access):
+    """ Evict the least recently used result first """
+    return last_access
+
+
+def lfu(cost, nbytes, hits, last_access):
+    """ Evict the least frequently used result first """
+    return (hits, last_access)
+
+
+def cost_weighted(cost, nbytes, hits, last_access):
+    """ Evict the result that is cheapest to recompute per byte first """
+    return (cost * (hits + 1) / max(nbytes, 1), last_access)
+
+
+policies = {"lru": lru, "lfu": lfu, "cost": cost_weighted}
+
+
+class CacheStore:
+    """Store of results with a byte limit and pluggable eviction policy
+
+    Results are held in memory until ``available_bytes`` is exceeded, at which
+    point the result with the lowest score under ``policy`` is evicted.  If a
+    ``directory`` is given evicted results move to disk first, where they are
+    kept up to ``available_disk_bytes``.
+
+    Parameters
+    ----------
+    available_bytes : int or str
+        Number of bytes of memory to use, e.g. ``"2GB"``
+    policy : {"cost", "lru", "lfu"} or callable, optional
+        Eviction policy.  A callable gets the recomputation cost in seconds,
+        the number of bytes, the number of hits and a counter of the last
+        access of a result, and returns a score; lowest scores are evicted
+        first.  Defaults to ``"cost"``, which keeps results that are expensive
+        to recompute per byte and frequently used.
+    limit : float, optional
+        Minimum recomputation cost in seconds for a result to be stored
+    directory : str, optional
+        Directory for a disk tier of results evicted from memory
+    available_disk_bytes : int or str, optional
+        Number of bytes to use on disk, unlimited by default
+
+    Examples
+    --------
+    >>> store = CacheStore("1 GB", policy="lru")  # doctest: +SKIP
+    >>> store.put('x', 123, cost=1.5)  # doctest: +SKIP
+    >>> store.data['x']  # doctest: +SKIP
+    123
+    """
+
+    def __init__(
+        self,
+        available_bytes,
+        policy="cost",
+        limit=0,
+        directory=None,
+        available_disk_bytes=None,
+    ):
+        self.available_bytes = parse_bytes(available_bytes)
+        self.policy = policies[policy] if isinstance(policy, str) else policy
+        self.limit = limit
+        self.memory = dict()
+        self.disk = File(directory) if directory is not None else None
+        if available_disk_bytes is not None:
+            available_disk_bytes = parse_bytes(available_disk_bytes)
+        self.available_disk_bytes = available_disk_bytes
+        self.nbytes = dict()
+        self.cost = dict()
+        self.hits = defaultdict(int)
+        self.last_access = dict()
+        self.total_bytes = 0
+        self.total_disk_bytes = 0
+        self.data = CacheData(self)
+        self._scores = dict()
+        self._heaps = {"memory": [], "disk": []}
+        self._tick = 0
+        self._counter = itertools.count()
+
+    def put(self, key, value, cost, nbytes=None):
+        """ Store a result that takes ``cost`` seconds to compute """
+        if cost < self.limit:
+            return
+        if key in self.nbytes:
+            self.retire(key)
+        if nbytes is None:
+            nbytes = sizeof(value)
+        self.nbytes[key] = nbytes
+        self.cost[key] = cost
+        self._touch(key)
+        self.memory[key] = value
+        self.total_bytes += nbytes
+        self._push(key, "memory")
+        while self.total_bytes > self.available_bytes:
+            self._evict_memory()
+
+    def get(self, key, default=None):
+        """ Get a stored result, counting a hit """
+        if key in self.memory:
+            value = self.memory[key]
+        elif self.disk is not None and key in self.disk:
+            value = self.disk[key]
+        else:
+            return default
+        self.hits[key] += 1
+        self._touch(key)
+        self._push(key, "memory" if key in self.memory else "disk")
+        return value
+
+    def retire(self, key):
+        """ Remove a result """
+        if key in self.memory:
+            del self.memory[key]
+            self.total_bytes -= self.nbytes[key]
+        elif self.disk is not None and key in self.disk:
+            del self.disk[key]
+            self.total_disk_bytes -= self.nbytes[key]
+        for d in (self.nbytes, self.cost, self.hits, self.last_access, self._scores):
+            d.pop(key, None)
+
+    def clear(self):
+        for key in list(self.nbytes):
+            self.retire(key)
+
+    def _touch(self, key):
+        self._tick += 1
+        self.last_access[key] = self._tick
+
+    def _push(self, key, tier):
+        score = self.policy(
+            self.cost[key], self.nbytes[key], self.hits[key], self.last_access[key]
+        )
+        self._scores[key] = score
+        heap = self._heaps[tier]
+        heapq.heappush(heap, (score, next(self._counter), key))
+        if len(heap) > 2 * len(self.nbytes) + 100:
+            # Drop stale entries
+            held = self.memory if tier == "memory" else self.disk
+            heap[:] = [
+                item
+                for item in heap
+                if item[2] in held and self._scores.get(item[2]) == item[0]
+            ]
+            heapq.heapify(heap)
+
+    def _pop(self, tier):
+        """ Key with the lowest current score in a tier """
+        held = self.memory if tier == "memory" else self.disk
+        heap = self._heaps[tier]
+        while True:
+            score, _, key = heapq.heappop(heap)
+            if key in held and self._scores.get(key) == score:
+                return key
+
+    def _evict_memory(self):
+        key = self._pop("memory")
+        if not self._spill(key):
+            self.retire(key)
+
+    def _spill(self, key):
+        """ Move a result from memory to disk, if possible """
+        nbytes = self.nbytes[key]
+        limit = self.available_disk_bytes
+        if self.disk is None or (limit is not None and nbytes > limit):
+            return False
+        try:
+            self.disk[key] = self.memory[key]
+        except (pickle.PicklingError, AttributeError, TypeError):
+            return False
+        del self.memory[key]
+        self.total_bytes -= nbytes
+        self.total_disk_bytes += nbytes
+        self._push(key, "disk")
+        while limit is not None and self.total_disk_bytes > limit:
+            self.retire(self._pop("disk"))
+        return True
+
+    def close(self):
+        self.clear()
+        if self.disk is not None:
+            self.disk.close()
+
+
+class CacheData(Mapping):
+    """ Read-only view of all results in a ``CacheStore`` """
+
+    def __init__(self, store):
+        self.store = store
+
+    def __getitem__(self, key):
+        if key not in self.store.nbytes:
+            raise KeyError(key)
+        return self.store.get(key)
+
+    def __contains__(self, key):
+        return key in self.store.nbytes
+
+    def __iter__(self):
+        return iter(self.store.nbytes)
+
+    def __len__(self):
+        return len(self.store.nbytes)
+
+
 class Cache(Callback):
     """Use cache for computation
 
+    Results of tasks are stored opportunistically, preferring results that
+    are expensive to compute, cheap to store, and frequently used.  Later
+    computations that contain the same keys use the stored results, and the
+    tasks that only fed those keys are not run at all.
+
+    Parameters
+    ----------
+    cache : number, str or cache object
+        Number of bytes of memory to use, e.g. ``2e9`` or ``"2GB"``.
+        Alternatively an existing cache object with a ``data`` mapping and a
+        ``put`` method, like a ``CacheStore`` or a ``cachey.Cache``.
+    **kwargs
+        Passed to ``CacheStore`` when creating a new cache, e.g. ``policy``
+        or ``directory``
+
     Examples
     --------
 
@@ -25,28 +252,29 @@ class Cache(Callback):
 
     >>> cache.register()            # doctest: +SKIP
     >>> cache.unregister()          # doctest: +SKIP
+
+    Results evicted from memory can be kept on disk, and the eviction policy
+    can be chosen:
+
+    >>> cache = Cache("2GB", policy="lru", directory="/scratch/cache")  # doctest: +SKIP
     """
 
     def __init__(self, cache, *args, **kwargs):
-        try:
-            import cachey
-        except ImportError as ex:
-            raise ImportError(
-                'Cache requires cachey, "{ex}" problem ' "importing".format(ex=str(ex))
-            ) from ex
-        self._nbytes = cachey.nbytes
-        if isinstance(cache, Number):
-            cache = cachey.Cache(cache, *args, **kwargs)
+        if isinstance(cache, (Number, str)):
+            cache = CacheStore(cache, *args, **kwargs)
         else:
             assert not args and not kwargs
         self.cache = cache
         self.starttimes = dict()
+        self.durations = dict()
 
     def _start(self, dsk):
         self.durations = dict()
         overlap = set(dsk) & set(self.cache.data)
         for key in overlap:
             dsk[key] = self.cache.data[key]
+            if isinstance(self.cache, CacheStore):
+                self.durations[key] = self.cache.cost.get(key, 0)
 
     def _pretask(self, key, dsk, state):
         self.starttimes[key] = default_timer()
@@ -57,8 +285,14 @@ class Cache(Callback):
         if deps:
             duration += max(self.durations.get(k, 0) for k in deps)
         self.durations[key] = duration
-        nb = self._nbytes(value) + overhead + sys.getsizeof(key) * 4
-        self.cache.put(key, value, cost=duration / nb / 1e9, nbytes=nb)
+        if isinstance(self.cache, CacheStore):
+            nb = sizeof(value) + overhead + sys.getsizeof(key) * 4
+            self.cache.put(key, value, cost=duration, nbytes=nb)
+        else:
+            from cachey import nbytes
+
+            nb = nbytes(value) + overhead + sys.getsizeof(key) * 4
+            self.cache.put(key, value, cost=duration / nb / 1e9, nbytes=nb)
 
     def _finish(self, dsk, state, errored):
         self.starttimes.clear()
@@ -0,0 +1,176 @@
+"""
+Persist results of selected tasks to disk between sessions.
+
+Dask keys are deterministic: the same computation on the same inputs builds
+the same keys, also in a new process.  ``Checkpoint`` writes the results of
+selected keys to a directory, named by a token of the key, and later
+computations that contain those keys load the stored results instead of
+recomputing them, along with everything upstream of them.
+"""
+import os
+import pickle
+import uuid
+
+from .base import tokenize
+from .callbacks import Callback
+from .core import literal
+from .utils import parse_bytes
+
+
+def load_checkpoint(filename, key):
+    """ Load a result written by ``Checkpoint`` """
+    with open(filename, "rb") as f:
+        stored_key, value = pickle.load(f)
+    if stored_key != key:
+        raise KeyError(key)
+    return value
+
+
+class Checkpoint(Callback):
+    """Store results of tasks on disk and reuse them in later computations
+
+    Results of the selected keys are pickled to ``directory`` as they are
+    computed.  When a later computation, possibly in another process,
+    contains a stored key, the task is replaced by loading the stored result
+    and tasks that were only needed to compute it are not run.  Once the
+    stored results exceed ``available_bytes`` the least recently used ones
+    are removed.
+
+    Works with the synchronous, threaded and multiprocessing schedulers.
+    Keys that graph optimization fuses into other tasks are not seen by the
+    scheduler, and so are not stored.
+    Results are stored with pickle, so only use directories that you trust.
+
+    Parameters
+    ----------
+    directory : str
+        Directory in which to store results
+    keys : iterable or callable, optional
+        Keys to store, or a function that takes a key and returns whether to
+        store it
+    layers : iterable, optional
+        Names of layers to store, like ``x.name`` for a Dask collection
+        ``x``.  If neither ``keys`` nor ``layers`` are given all results are
+        stored.
+    available_bytes : int or str, optional
+        Number of bytes of disk to use, e.g. ``"100GB"``.  Unlimited by
+        default.
+
+    Examples
+    --------
+    >>> with Checkpoint("/scratch/checkpoints", layers=[df.name]):  # doctest: +SKIP
+    ...     df.sum().compute()
+
+    See Also
+    --------
+    dask.cache.Cache
+    """
+
+    def __init__(self, directory, keys=None, layers=None, available_bytes=None):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        if keys is not None and not callable(keys):
+            keys = set(keys)
+        self.keys = keys
+        self.layers = set(layers) if layers is not None else None
+        if available_bytes is not None:
+            available_bytes = parse_bytes(available_bytes)
+        self.available_bytes = available_bytes
+        self.loaded = set()
+
+    def selected(self, key):
+        """ Whether to store the result of ``key`` """
+        if self.keys is None and self.layers is None:
+            return True
+        if self.keys is not None:
+            if callable(self.keys):
+                if self.keys(key):
+                    return True
+            elif key in self.keys:
+                return True
+        if self.layers is not None:
+            layer = key[0] if isinstance(key, tuple) else key
+            return layer in self.layers
+        return False
+
+    def filename(self, key):
+        return os.path.join(self.directory, tokenize(key) + ".pkl")
+
+    def __contains__(self, key):
+        return os.path.exists(self.filename(key))
+
+    def __getitem__(self, key):
+        try:
+            return load_checkpoint(self.filename(key), key)
+        except FileNotFoundError:
+            raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        data = pickle.dumps((key, value), protocol=pickle.HIGHEST_PROTOCOL)
+        if self.available_bytes is not None and len(data) > self.available_bytes:
+            return
+        fn = self.filename(key)
+        # Write to a temporary file first so that concurrent readers never
+        # see a partial result
+        tmp = fn + "." + uuid.uuid4().hex + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, fn)
+        self.evict()
+
+    def __delitem__(self, key):
+        try:
+            os.remove(self.filename(key))
+        except FileNotFoundError:
+            raise KeyError(key)
+
+    def evict(self):
+        """ Remove least recently used results until under the byte limit """
+        if self.available_bytes is None:
+            return
+        files = []
+        total = 0
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".pkl"):
+                try:
+                    st = entry.stat()
+                except FileNotFoundError:
+                    continue
+                files.append((st.st_mtime, entry.path, st.st_size))
+                total += st.st_size
+        files.sort()
+        for _, fn, size in files:
+            if total <= self.available_bytes:
+                break
+            try:
+                os.remove(fn)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def clear(self):
+        """ Remove all stored results """
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".pkl"):
+                try:
+                    os.remove(entry.path)
+                except FileNotFoundError:
+                    pass
+
+    def _start(self, dsk):
+        self.loaded = set()
+        for key in dsk:
+            if not self.selected(key):
+                continue
+            fn = self.filename(key)
+            try:
+                os.utime(fn)  # mark as recently used
+            except FileNotFoundError:
+                continue
+            # Quote arguments so that they are not mistaken for keys
+            dsk[key] = (load_checkpoint, (literal(fn),), (literal(key),))
+            self.loaded.add(key)
+
+    def _posttask(self, key, value, dsk, state, id):
+        if key not in self.loaded and self.selected(key):
+            self[key] = value
@@ -0,0 +1,65 @@
+"""Implementation of Bloom filters over join keys
+
+This implements a Bloom filter with the double hashing scheme found in
+
+    Adam Kirsch and Michael Mitzenmacher. "Less Hashing, Same Performance:
+        Building a Better Bloom Filter". 2006 European Symposium on
+        Algorithms. Zurich, Switzerland (2006)
+
+The filter of a dataframe is a packed bit array of ``2 ** b`` bits, so
+filters of several partitions merge with a bitwise or.  Rows are hashed with
+``hash_object_dispatch``, as in the hash-based shuffle.
+"""
+import numpy as np
+
+from .utils import hash_object_dispatch
+
+
+def key_frame(df, on):
+    """The join keys of ``df`` as a dataframe
+
+    Keys are always hashed as a dataframe, so that a single column, a list
+    with one column and the index hash the same.  ``on=None`` selects the
+    index.
+    """
+    if on is None:
+        return df.index.to_frame(index=False)
+    if not isinstance(on, list):
+        on = [on]
+    return df[on]
+
+
+def bit_indices(obj, b, k):
+    """ The ``k`` bits set for each row of ``obj``, as an ``(k, n)`` array """
+    hashes = hash_object_dispatch(obj, index=False)
+    hashes = np.asarray(hashes).astype(np.uint64, copy=False)
+    h1 = hashes & np.uint64(0xFFFFFFFF)
+    h2 = (hashes >> np.uint64(32)) | np.uint64(1)
+    mask = np.uint64((1 << b) - 1)
+    return np.stack([(h1 + np.uint64(i) * h2) & mask for i in range(k)])
+
+
+def compute_bloom_array(df, on, b, k):
+    """ The Bloom filter of the keys of a partition """
+    bits = np.zeros(1 << (b - 3), dtype=np.uint8)
+    if len(df):
+        ind = bit_indices(key_frame(df, on), b, k).ravel()
+        shift = (ind & np.uint64(7)).astype(np.uint8)
+        np.bitwise_or.at(bits, ind >> np.uint64(3), np.uint8(1) << shift)
+    return bits
+
+
+def reduce_state(blooms, b):
+    # We concatenated the filters, now we need to union them
+    blooms = blooms.reshape(len(blooms) // (1 << (b - 3)), 1 << (b - 3))
+    return np.bitwise_or.reduce(blooms, axis=0)
+
+
+def filter_rows(df, bloom, on, b, k):
+    """ Rows of ``df`` whose keys may be present in the Bloom filter """
+    if not len(df):
+        return df
+    ind = bit_indices(key_frame(df, on), b, k)
+    shift = (ind & np.uint64(7)).astype(np.uint8)
+    present = (bloom[ind >> np.uint64(3)] >> shift) & np.uint8(1)
+    return df[present.all(axis=0).astype(bool)]
@@ -4168,6 +4168,9 @@ class DataFrame(_Frame):
         indicator=False,
         npartitions=None,
         shuffle=None,
+        bloom=False,
+        broadcast=None,
+        skew=False,
     ):
         """Merge the DataFrame with another DataFrame
 
@@ -4223,6 +4226,23 @@ class DataFrame(_Frame):
         shuffle: {'disk', 'tasks'}, optional
             Either ``'disk'`` for single-node operation or ``'tasks'`` for
             distributed operation.  Will be inferred by your current scheduler.
+        bloom: bool, optional
+            Whether to drop rows without a match on the other side before
+            shuffling, using a Bloom filter over the join keys.  This is only
+            used when performing a hash_join, and only for inner, left and
+            right joins.  It helps when few rows of one side find a match.
+        broadcast: bool, int or str, optional
+            Whether to avoid a shuffle by concatenating the smaller side and
+            joining it with every partition of the other side.  A number of
+            bytes like ``"100MB"`` broadcasts the smaller side if its memory
+            usage is below it, as estimated up front by computing its first
+            partition.  Defaults to the
+            ``dataframe.broadcast-join-threshold`` configuration value.
+        skew: bool, optional
+            Whether to spread the rows of keys that are too frequent for a
+            single partition over several partitions, and copy the matching
+            rows of the other side to each of them.  This is only used when
+            performing a hash_join, and not for outer joins.
 
         Notes
         -----
@@ -4264,6 +4284,9 @@ class DataFrame(_Frame):
             npartitions=npartitions,
             indicator=indicator,
             shuffle=shuffle,
+            bloom=bloom,
+            broadcast=broadcast,
+            skew=skew,
         )
 
     @derived_from(pd.DataFrame)  # doctest: +SKIP
@@ -113,6 +113,37 @@ class CSVSubgraph(Mapping):
         for i in range(len(self)):
             yield (self.name, i)
 
+    def project_columns(self, columns):
+        """Return a subgraph that only reads ``columns`` from the files
+
+        Passes ``usecols`` to the reader.  Returns ``None`` if the keyword
+        arguments of the reader refer to columns by themselves, or if no
+        column of the files is selected.
+        """
+        if any(self.kwargs.get(k) for k in ("usecols", "parse_dates", "converters")):
+            return None
+        file_columns = [c for c in self.columns if c in columns]
+        if not file_columns:
+            return None
+        head = self.head[[c for c in self.head.columns if c in columns]]
+        if self.colname in columns:
+            path = (self.colname, self.paths)
+        else:
+            path = None
+        return CSVSubgraph(
+            "read-csv-" + tokenize(self.name, file_columns, path),
+            self.reader,
+            self.blocks,
+            self.is_first,
+            head,
+            self.header,
+            dict(self.kwargs, usecols=file_columns),
+            {c: dtype for c, dtype in self.dtypes.items() if c in columns},
+            file_columns,
+            self.enforce,
+            path,
+        )
+
 
 def pandas_read_text(
     reader,
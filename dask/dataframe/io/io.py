@@ -11,12 +11,20 @@ from ...base import tokenize
 from ... import array as da
 from ...dataframe.core import new_dd_object
 from ...delayed import delayed
-
-from ..core import DataFrame, Series, Index, new_dd_object, has_parallel_type
+from ...highlevelgraph import HighLevelGraph
+
+from ..core import (
+    DataFrame,
+    Series,
+    Index,
+    new_dd_object,
+    has_parallel_type,
+    partitionwise_graph,
+)
 from ..shuffle import set_partition
 from ..utils import insert_meta_param_description, check_meta, make_meta, is_series_like
 
-from ...utils import M, ensure_dict
+from ...utils import M
 
 lock = Lock()
 
@@ -450,8 +458,8 @@ def from_dask_array(x, columns=None, index=None, meta=None):
     if x.ndim == 2 and len(x.chunks[1]) > 1:
         x = x.rechunk({1: x.shape[1]})
 
-    name = "from-dask-array" + tokenize(x, columns)
-    to_merge = []
+    name = "from-dask-array" + tokenize(x, columns, index)
+    graph_dependencies = [x]
 
     if index is not None:
         if not isinstance(index, Index):
@@ -463,32 +471,28 @@ def from_dask_array(x, columns=None, index=None, meta=None):
             )
             raise ValueError(msg)
         divisions = index.divisions
-        to_merge.append(ensure_dict(index.dask))
-        index = index.__dask_keys__()
+        graph_dependencies.append(index)
 
     elif np.isnan(sum(x.shape)):
         divisions = [None] * (len(x.chunks[0]) + 1)
-        index = [None] * len(x.chunks[0])
     else:
         divisions = [0]
         for c in x.chunks[0]:
             divisions.append(divisions[-1] + c)
-        index = [
-            (np.arange, a, b, 1, "i8") for a, b in zip(divisions[:-1], divisions[1:])
-        ]
+        index = da.arange(divisions[-1], chunks=(x.chunks[0],), dtype="i8")
+        graph_dependencies.append(index)
         divisions[-1] -= 1
 
-    dsk = {}
-    for i, (chunk, ind) in enumerate(zip(x.__dask_keys__(), index)):
-        if x.ndim == 2:
-            chunk = chunk[0]
-        if is_series_like(meta):
-            dsk[name, i] = (type(meta), chunk, ind, x.dtype, meta.name)
-        else:
-            dsk[name, i] = (type(meta), chunk, ind, meta.columns)
-
-    to_merge.extend([ensure_dict(x.dask), dsk])
-    return new_dd_object(merge(*to_merge), name, meta, divisions)
+    # Partitions map one-to-one to blocks of the array, so a blockwise layer
+    # lets the conversion fuse with the array operations before it
+    if is_series_like(meta):
+        layer = partitionwise_graph(type(meta), name, x, index, x.dtype, meta.name)
+    else:
+        layer = partitionwise_graph(type(meta), name, x, index, meta.columns)
+    graph = HighLevelGraph.from_collections(
+        name, layer, dependencies=graph_dependencies
+    )
+    return new_dd_object(graph, name, meta, divisions)
 
 
 def _link(token, result):
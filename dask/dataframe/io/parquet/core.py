@@ -53,6 +53,8 @@ class ParquetSubgraph(Layer):
         part_ids=None,
         common_kwargs=None,
         annotations=None,
+        statistics=None,
+        filters=None,
     ):
         super().__init__(annotations=annotations)
         self.name = name
@@ -71,6 +73,28 @@ class ParquetSubgraph(Layer):
         # `common_kwargs` = engine-gathered kwargs to be passed for all parts
         self.common_kwargs = common_kwargs if common_kwargs else {}
 
+        # `statistics` = row-group statistics of each part, if gathered
+        # `filters` = filters that parts must match to be read, see
+        #             `dask.dataframe.optimize.optimize_read_parquet_filters`
+        self.statistics = statistics
+        self.filters = filters
+
+    @property
+    def pruned_parts(self):
+        """Parts that cannot have any rows matching ``filters``
+
+        These parts are not read, but produce empty dataframes.
+        """
+        if not self.filters or not self.statistics:
+            return set()
+        try:
+            return self._pruned_parts
+        except AttributeError:
+            ids = list(range(len(self.parts)))
+            kept, _ = apply_filters(ids, self.statistics, self.filters)
+            self._pruned_parts = set(ids) - set(kept)
+            return self._pruned_parts
+
     def __repr__(self):
         return "ParquetSubgraph<name='{}', n_parts={}, columns={}>".format(
             self.name, len(self.part_ids), list(self.columns)
@@ -89,6 +113,9 @@ class ParquetSubgraph(Layer):
         if i not in self.part_ids:
             raise KeyError(key)
 
+        if i in self.pruned_parts:
+            return (empty_parquet_part, self.meta, self.columns, self.index)
+
         part = self.parts[i]
         if not isinstance(part, list):
             part = [part]
@@ -130,6 +157,8 @@ class ParquetSubgraph(Layer):
             part_ids={i for i in self.part_ids if (self.name, i) in keys},
             common_kwargs=self.common_kwargs,
             annotations=self.annotations,
+            statistics=self.statistics,
+            filters=self.filters,
         )
         return ret, ret.get_dependencies(all_hlg_keys)
 
@@ -336,7 +365,7 @@ def read_parquet(
         common_kwargs = parts[0].pop("common_kwargs", {})
 
     # Parse dataset statistics from metadata (if available)
-    parts, divisions, index, index_in_columns = process_statistics(
+    parts, divisions, index, index_in_columns, statistics = process_statistics(
         parts, statistics, filters, index, chunksize
     )
 
@@ -358,6 +387,7 @@ def read_parquet(
         parts,
         kwargs,
         common_kwargs=common_kwargs,
+        statistics=statistics,
     )
 
     # Set the index that was previously treated as a column
@@ -401,6 +431,19 @@ def read_parquet_part(fs, func, meta, part, columns, index, kwargs):
     return df
 
 
+def empty_parquet_part(meta, columns, index):
+    """Empty dataframe like those of `read_parquet_part`
+
+    Used for parts that are skipped due to their statistics."""
+    index = index or []
+    if index and set(index).issubset(meta.columns):
+        meta = meta.set_index(index)
+    df = meta[[c for c in columns or [] if c not in index]]
+    if index == [NONE_LABEL]:
+        df.index.name = None
+    return df
+
+
 def to_parquet(
     df,
     path,
@@ -965,6 +1008,11 @@ def apply_filters(parts, statistics, filters):
                     out_parts.append(part)
                     out_statistics.append(stats)
                 else:
+                    if min is None or max is None:
+                        # Statistics are missing, the part may match
+                        out_parts.append(part)
+                        out_statistics.append(stats)
+                        continue
                     if (
                         operator == "=="
                         and min <= value <= max
@@ -1001,6 +1049,9 @@ def apply_filters(parts, statistics, filters):
 def process_statistics(parts, statistics, filters, index, chunksize):
     """Process row-group column statistics in metadata
     Used in read_parquet.
+
+    Returns the parts, divisions, index, whether the index is among the
+    columns, and the statistics of the parts (or None if not gathered).
     """
     index_in_columns = False
     if statistics:
@@ -1065,7 +1116,7 @@ def process_statistics(parts, statistics, filters, index, chunksize):
     else:
         divisions = [None] * (len(parts) + 1)
 
-    return parts, divisions, index, index_in_columns
+    return parts, divisions, index, index_in_columns, statistics or None
 
 
 def set_index_columns(meta, index, columns, index_in_columns, auto_index_allowed):
@@ -432,6 +432,56 @@ def test_read_csv_include_path_column_as_str(dd_read, files):
         assert "2014-01-03.csv" in filenames
 
 
+def _read_csv_kwargs(dsk):
+    from dask.optimization import SubgraphCallable
+
+    def find(task):
+        if isinstance(task, SubgraphCallable):
+            return [kw for t in task.dsk.values() for kw in find(t)]
+        if type(task) is tuple and task:
+            if task[0] is pandas_read_text:
+                return [task[4]]
+            return [kw for t in task for kw in find(t)]
+        return []
+
+    return [kw for task in dict(dsk).values() for kw in find(task)]
+
+
+@pytest.mark.parametrize(
+    "dd_read,files", [(dd.read_csv, csv_files), (dd.read_table, tsv_files)]
+)
+@read_table_mark
+def test_read_csv_getitem_projection(dd_read, files):
+    from dask.dataframe.optimize import optimize
+
+    with filetexts(files, mode="b"):
+        df = dd_read("2014-01-*.csv")
+        expected = df.compute()
+
+        for columns in [["id", "name"], "amount"]:
+            result = df[columns]
+            dsk = optimize(result.dask, result.__dask_keys__())
+            kwargs = _read_csv_kwargs(dsk)
+            assert kwargs
+            for kw in kwargs:
+                assert set(kw["usecols"]) == set(
+                    [columns] if isinstance(columns, str) else columns
+                )
+            assert_eq(result, expected[columns], check_index=False)
+
+        # Filters and other uses of the full frame read all columns
+        result = df[df.amount > 200]
+        dsk = optimize(result.dask, result.__dask_keys__())
+        assert all("usecols" not in kw for kw in _read_csv_kwargs(dsk))
+        assert_eq(result, expected[expected.amount > 200], check_index=False)
+
+        df = dd_read("2014-01-*.csv", include_path_column=True)
+        result = df[["path", "id"]]
+        dsk = optimize(result.dask, result.__dask_keys__())
+        assert all(kw["usecols"] == ["id"] for kw in _read_csv_kwargs(dsk))
+        assert result.path.compute().str.endswith("2014-01-03.csv").sum() == 3
+
+
 @pytest.mark.parametrize(
     "dd_read,files", [(dd.read_csv, csv_files), (dd.read_table, tsv_files)]
 )
@@ -506,6 +506,25 @@ def test_from_dask_array_unknown_chunks():
         df = dd.from_dask_array(dx)
 
 
+def test_from_dask_array_blockwise_fusion():
+    from dask.blockwise import optimize_blockwise
+    from dask.core import flatten
+
+    x = da.random.random((20, 3), chunks=(5, 3))
+    df = dd.from_dask_array(x + 1, columns=["a", "b", "c"])
+    y = da.sqrt((df * 2).values)
+
+    # Array and dataframe elementwise operations fuse into a single layer
+    graph = optimize_blockwise(y.dask, keys=list(flatten(y.__dask_keys__())))
+    assert len(graph.layers) < len(y.dask.layers)
+    assert [k for k in graph.layers if k.startswith("from-dask-array")] == []
+    np.testing.assert_allclose(y.compute(), np.sqrt((x.compute() + 1) * 2))
+
+    # Multiple column blocks are rechunked first and still compute correctly
+    x = da.random.random((20, 4), chunks=(5, 2))
+    assert_eq(dd.from_dask_array(x + 1), pd.DataFrame(x.compute() + 1))
+
+
 def test_to_bag():
     pytest.importorskip("dask.bag")
     a = pd.DataFrame(
@@ -63,7 +63,8 @@ from pandas.api.types import is_dtype_equal, is_categorical_dtype, union_categor
 
 from ..base import tokenize, is_dask_collection
 from ..highlevelgraph import HighLevelGraph
-from ..utils import apply
+from .. import config
+from ..utils import apply, parse_bytes
 from ._compat import PANDAS_GT_100
 from .core import (
     _Frame,
@@ -76,10 +77,11 @@ from .core import (
     is_broadcastable,
     prefix_reduction,
     suffix_reduction,
+    apply_concat_apply as aca,
 )
 from .io import from_pandas
 from . import methods
-from .shuffle import shuffle, rearrange_by_divisions
+from .shuffle import shuffle, rearrange_by_divisions, heavy_hitters
 from .utils import (
     strip_unknown_categories,
     is_series_like,
@@ -317,19 +319,48 @@ def hash_join(
     suffixes=("_x", "_y"),
     shuffle=None,
     indicator=False,
+    bloom=False,
+    skew=False,
 ):
     """Join two DataFrames on particular columns with hash join
 
     This shuffles both datasets on the joined column and then performs an
     embarrassingly parallel join partition-by-partition
 
+    With ``bloom=True`` a Bloom filter over the join keys of one side is
+    built first, and rows of the other side that cannot have a match are
+    dropped before they are shuffled.  See ``bloom_prune``.
+
+    With ``skew=True`` keys that hold a large share of the rows of the left
+    side (the right side for right joins) are found up front.  Their rows are
+    spread over several partitions, and the matching rows of the other side
+    are copied to each of them.  Outer joins are not supported.  See
+    ``dask.dataframe.shuffle.heavy_hitters``.
+
     >>> hash_join(a, 'id', rhs, 'id', how='left', npartitions=10)  # doctest: +SKIP
     """
     if npartitions is None:
         npartitions = max(lhs.npartitions, rhs.npartitions)
 
-    lhs2 = shuffle_func(lhs, left_on, npartitions=npartitions, shuffle=shuffle)
-    rhs2 = shuffle_func(rhs, right_on, npartitions=npartitions, shuffle=shuffle)
+    if bloom and how != "outer":
+        lhs, left_on, rhs, right_on = bloom_prune(lhs, left_on, rhs, right_on, how)
+
+    lhs_skew = rhs_skew = {}
+    if skew and how in ("inner", "left"):
+        heavy = heavy_hitters(lhs, left_on, npartitions)
+        lhs_skew = {"heavy": heavy}
+        rhs_skew = {"heavy": heavy, "replicate": True}
+    elif skew and how == "right":
+        heavy = heavy_hitters(rhs, right_on, npartitions)
+        lhs_skew = {"heavy": heavy, "replicate": True}
+        rhs_skew = {"heavy": heavy}
+
+    lhs2 = shuffle_func(
+        lhs, left_on, npartitions=npartitions, shuffle=shuffle, **lhs_skew
+    )
+    rhs2 = shuffle_func(
+        rhs, right_on, npartitions=npartitions, shuffle=shuffle, **rhs_skew
+    )
 
     if isinstance(left_on, Index):
         left_on = None
@@ -377,6 +408,67 @@ def hash_join(
     return new_dd_object(graph, name, meta, divisions)
 
 
+def _bloom_on(on):
+    # Index keys are passed to the partition functions as None
+    return None if isinstance(on, Index) else on
+
+
+def bloom_prune(lhs, left_on, rhs, right_on, how="inner", b=23, k=3, split_every=None):
+    """Drop rows that have no match on the other side of a join
+
+    A Bloom filter of ``2 ** b`` bits over the join keys of one side is built
+    with a tree reduction, and rows of the other side whose keys are not in
+    the filter are removed partition by partition.  For inner joins the side
+    with fewer partitions builds the filter; for left and right joins it is
+    the side whose rows are all kept.  The filter has no false negatives, so
+    the join result is unchanged.
+
+    Returns
+    -------
+    lhs, left_on, rhs, right_on
+        Index keys refer to the new dataframes
+    """
+    from . import bloom  # here to avoid circular import issues
+
+    if how == "left" or (how == "inner" and lhs.npartitions <= rhs.npartitions):
+        small, small_on, large, large_on = lhs, left_on, rhs, right_on
+    elif how in ("right", "inner"):
+        small, small_on, large, large_on = rhs, right_on, lhs, left_on
+    else:
+        return lhs, left_on, rhs, right_on
+
+    keys = aca(
+        [small],
+        chunk=bloom.compute_bloom_array,
+        combine=bloom.reduce_state,
+        aggregate=bloom.reduce_state,
+        chunk_kwargs={"on": _bloom_on(small_on), "b": b, "k": k},
+        combine_kwargs={"b": b},
+        aggregate_kwargs={"b": b},
+        split_every=split_every,
+        meta=object,
+        token="bloom-filter",
+    )
+    pruned = map_partitions(
+        bloom.filter_rows,
+        large,
+        keys,
+        _bloom_on(large_on),
+        b,
+        k,
+        meta=large._meta,
+        token="bloom-prune",
+        enforce_metadata=False,
+    )
+    if isinstance(large_on, Index):
+        large_on = pruned.index
+
+    if large is lhs:
+        return pruned, large_on, rhs, right_on
+    else:
+        return lhs, left_on, pruned, large_on
+
+
 def single_partition_join(left, right, **kwargs):
     # if the merge is performed on_index, divisions can be kept, otherwise the
     # new index will not necessarily correspond with the current divisions
@@ -420,6 +512,62 @@ def single_partition_join(left, right, **kwargs):
     return new_dd_object(graph, name, meta, divisions)
 
 
+def broadcast_side(left, right, how, broadcast=None):
+    """Which side of a join to broadcast, ``"left"``, ``"right"`` or None
+
+    ``broadcast=True`` broadcasts the side with fewer partitions that the
+    join type allows, ``False`` never broadcasts.  A number or a string like
+    ``"100MB"`` is a threshold on the size of that side in memory, and
+    ``None`` takes the threshold from the ``dataframe.broadcast-join-threshold``
+    configuration value.  Checking a threshold estimates the size of the
+    candidate side from the memory usage of its first partition, computing
+    only that partition.  No partition is computed when the candidate side
+    has more partitions than the other side, since then it is not broadcast.
+    """
+    if broadcast is False:
+        return None
+    candidates = []
+    if how in allowed_left:
+        candidates.append(("right", right, left))
+    if how in allowed_right:
+        candidates.append(("left", left, right))
+    if not candidates:
+        return None
+    side, df, other = min(candidates, key=lambda c: c[1].npartitions)
+
+    if broadcast is True or df.npartitions == 1:
+        return side
+    if broadcast is None:
+        broadcast = config.get("dataframe.broadcast-join-threshold", None)
+        if broadcast is None:
+            return None
+    if df.npartitions > other.npartitions:
+        return None
+    threshold = parse_bytes(broadcast)
+    sample = df.get_partition(0).memory_usage_per_partition(deep=True)
+    nbytes = sample.compute().iloc[0] * df.npartitions
+    return side if nbytes <= threshold else None
+
+
+def broadcast_join(left, right, side, **kwargs):
+    """Join without shuffling by sending one side to every partition
+
+    The partitions of the ``side`` to broadcast are concatenated, and each
+    partition of the other side is joined with the result.  This is only
+    sensible when the broadcast side fits comfortably in memory.
+
+    See Also
+    --------
+    broadcast_side
+    single_partition_join
+    """
+    if side == "left":
+        left = left.repartition(npartitions=1)
+    else:
+        right = right.repartition(npartitions=1)
+    return single_partition_join(left, right, **kwargs)
+
+
 def warn_dtype_mismatch(left, right, left_on, right_on):
     """Checks for merge column dtype mismatches and throws a warning (#4574)"""
 
@@ -466,6 +614,9 @@ def merge(
     npartitions=None,
     shuffle=None,
     max_branch=None,
+    bloom=False,
+    broadcast=None,
+    skew=False,
 ):
     for o in [on, left_on, right_on]:
         if isinstance(o, _Frame):
@@ -521,6 +672,11 @@ def merge(
         right_index or right._contains_index_name(right_on)
     ) and right.known_divisions
 
+    if merge_indexed_left and merge_indexed_right:
+        side = None
+    else:
+        side = broadcast_side(left, right, how, broadcast)
+
     # Both sides indexed
     if merge_indexed_left and merge_indexed_right:  # Do indexed join
         return merge_indexed_dataframes(
@@ -555,6 +711,21 @@ def merge(
             indicator=indicator,
         )
 
+    # Broadcast a small side to all partitions of the other one
+    elif side is not None:
+        return broadcast_join(
+            left,
+            right,
+            side,
+            how=how,
+            right_on=right_on,
+            left_on=left_on,
+            left_index=left_index,
+            right_index=right_index,
+            suffixes=suffixes,
+            indicator=indicator,
+        )
+
     # One side is indexed, the other not
     elif (
         left_index
@@ -620,6 +791,8 @@ def merge(
             suffixes,
             shuffle=shuffle,
             indicator=indicator,
+            bloom=bloom,
+            skew=skew,
         )
 
 
@@ -1,10 +1,14 @@
 """ Dataframe optimizations """
+import numbers
 import operator
 
+import numpy as np
+import pandas as pd
+
 from dask.base import tokenize
 from ..optimization import cull, fuse
 from .. import config, core
-from ..highlevelgraph import HighLevelGraph
+from ..highlevelgraph import BasicLayer, HighLevelGraph
 from ..utils import ensure_dict
 from ..blockwise import optimize_blockwise, fuse_roots, Blockwise
 
@@ -17,7 +21,9 @@ def optimize(dsk, keys, **kwargs):
     if not isinstance(dsk, HighLevelGraph):
         dsk = HighLevelGraph.from_collections(id(dsk), dsk, dependencies=())
 
+    dsk = optimize_read_parquet_filters(dsk, keys=keys)
     dsk = optimize_read_parquet_getitem(dsk, keys=keys)
+    dsk = optimize_read_csv_getitem(dsk, keys=keys)
     dsk = optimize_blockwise(dsk, keys=keys)
     dsk = fuse_roots(dsk, keys=keys)
     dsk = dsk.cull(set(keys))
@@ -26,6 +32,8 @@ def optimize(dsk, keys, **kwargs):
         return dsk
 
     dependencies = dsk.get_all_dependencies()
+    # Tasks that need resources, like IO, stay separate for the scheduler
+    resources = dsk.get_annotated_keys("resources")
     dsk = ensure_dict(dsk)
 
     fuse_subgraphs = config.get("optimization.fuse.subgraphs")
@@ -33,57 +41,97 @@ def optimize(dsk, keys, **kwargs):
         fuse_subgraphs = True
     dsk, _ = fuse(
         dsk,
-        keys,
+        keys + list(resources),
         dependencies=dependencies,
         fuse_subgraphs=fuse_subgraphs,
     )
     dsk, _ = cull(dsk, keys)
+    if resources:
+        dsk = HighLevelGraph.from_annotated(
+            "dataframe-optimize", dsk, {"resources": resources.get}
+        )
     return dsk
 
 
-def optimize_read_parquet_getitem(dsk, keys):
-    # find the keys to optimize
-    from .io.parquet.core import ParquetSubgraph
+def _getitem_columns(dsk, name, keys):
+    """Columns selected from an IO layer by the layers that depend on it
 
-    read_parquets = [k for k, v in dsk.layers.items() if isinstance(v, ParquetSubgraph)]
+    Returns the set of columns and the dependent layers, or ``None`` if not
+    all dependents are a ``getitem`` of columns, or if the output keys of the
+    IO layer are requested, since then its name can't change anymore.
+    """
+    columns = set()
+    blocks = {}
+    for dep in dsk.dependents[name]:
+        block = dsk.layers[dep]
 
-    layers = dsk.layers.copy()
-    dependencies = dsk.dependencies.copy()
+        # Check if we're a read_parquet followed by a getitem
+        if not isinstance(block, Blockwise):
+            # getitem are Blockwise...
+            return None
 
-    for k in read_parquets:
-        columns = set()
-        update_blocks = {}
+        if len(block.dsk) != 1:
+            # ... with a single item...
+            return None
 
-        for dep in dsk.dependents[k]:
-            block = dsk.layers[dep]
+        if list(block.dsk.values())[0][0] != operator.getitem:
+            # ... where this value is __getitem__...
+            return None
 
-            # Check if we're a read_parquet followed by a getitem
-            if not isinstance(block, Blockwise):
-                # getitem are Blockwise...
-                return dsk
+        if any(name == x[0] for x in keys if isinstance(x, tuple)):
+            # ... but bail on the optimization if the read_parquet layer is in
+            # the requested keys, because we cannot change the name anymore.
+            # These keys are structured like [('getitem-<token>', 0), ...]
+            # so we check for the first item of the tuple.
+            # See https://github.com/dask/dask/issues/5893
+            return None
 
-            if len(block.dsk) != 1:
-                # ... with a single item...
-                return dsk
+        block_columns = block.indices[1][0]
+        if isinstance(block_columns, str):
+            block_columns = [block_columns]
 
-            if list(block.dsk.values())[0][0] != operator.getitem:
-                # ... where this value is __getitem__...
-                return dsk
+        columns |= set(block_columns)
+        blocks[dep] = block
+    return columns, blocks
+
+
+def _rename_getitem_inputs(blocks, old, new, layers, dependencies):
+    """ Point the getitem layers ``blocks`` to the IO layer ``new`` """
+    for block_key, block in blocks.items():
+        # (('read-parquet-old', (.,)), ( ... )) ->
+        # (('read-parquet-new', (.,)), ( ... ))
+        layers[block_key] = _rename_blockwise_input(block, old, new)
+        dependencies[block_key] = {new}
+    dependencies[new] = dependencies.pop(old)
+
+
+def _rename_blockwise_input(block, old, new):
+    """ Copy of the Blockwise layer ``block`` reading ``new`` instead of ``old`` """
+    return Blockwise(
+        block.output,
+        block.output_indices,
+        block.dsk,
+        tuple((new if name == old else name, ind) for name, ind in block.indices),
+        {new if name == old else name: n for name, n in block.numblocks.items()},
+        block.concatenate,
+        block.new_axes,
+    )
+
+
+def optimize_read_parquet_getitem(dsk, keys):
+    # find the keys to optimize
+    from .io.parquet.core import ParquetSubgraph
 
-            if any(layers[k].name == x[0] for x in keys if isinstance(x, tuple)):
-                # ... but bail on the optimization if the read_parquet layer is in
-                # the requested keys, because we cannot change the name anymore.
-                # These keys are structured like [('getitem-<token>', 0), ...]
-                # so we check for the first item of the tuple.
-                # See https://github.com/dask/dask/issues/5893
-                return dsk
+    read_parquets = [k for k, v in dsk.layers.items() if isinstance(v, ParquetSubgraph)]
 
-            block_columns = block.indices[1][0]
-            if isinstance(block_columns, str):
-                block_columns = [block_columns]
+    layers = dsk.layers.copy()
+    dependencies = dsk.dependencies.copy()
 
-            columns |= set(block_columns)
-            update_blocks[dep] = block
+    for k in read_parquets:
+        projection = _getitem_columns(dsk, k, keys)
+        if projection is None:
+            return dsk
+        columns, update_blocks = projection
 
         old = layers[k]
 
@@ -92,24 +140,7 @@ def optimize_read_parquet_getitem(dsk, keys):
             meta = old.meta[columns]
             name = "read-parquet-" + tokenize(old.name, columns)
             assert len(update_blocks)
-
-            for block_key, block in update_blocks.items():
-                # (('read-parquet-old', (.,)), ( ... )) ->
-                # (('read-parquet-new', (.,)), ( ... ))
-                new_indices = ((name, block.indices[0][1]), block.indices[1])
-                numblocks = {name: block.numblocks[old.name]}
-                new_block = Blockwise(
-                    block.output,
-                    block.output_indices,
-                    block.dsk,
-                    new_indices,
-                    numblocks,
-                    block.concatenate,
-                    block.new_axes,
-                )
-                layers[block_key] = new_block
-                dependencies[block_key] = {name}
-            dependencies[name] = dependencies.pop(k)
+            _rename_getitem_inputs(update_blocks, old.name, name, layers, dependencies)
 
         else:
             # Things like df[df.A == 'a'], where the argument to
@@ -128,6 +159,9 @@ def optimize_read_parquet_getitem(dsk, keys):
             old.parts,
             old.kwargs,
             common_kwargs=old.common_kwargs,
+            annotations=old.annotations,
+            statistics=old.statistics,
+            filters=old.filters,
         )
         layers[name] = new
         if name != old.name:
@@ -135,3 +169,248 @@ def optimize_read_parquet_getitem(dsk, keys):
 
     new_hlg = HighLevelGraph(layers, dependencies)
     return new_hlg
+
+
+_comparisons = {
+    operator.eq: ("==", "=="),
+    operator.gt: (">", "<"),
+    operator.ge: (">=", "<="),
+    operator.lt: ("<", ">"),
+    operator.le: ("<=", ">="),
+}
+
+# Don't expand masks into disjunctions with more conjunctions than this
+_max_conjunctions = 64
+
+
+def _mask_filters(dsk, name, input_name, layers):
+    """Filters in disjunctive normal form equivalent to a boolean mask
+
+    Supports comparisons of columns of ``input_name`` with scalars, ``isin``
+    with a list of values, and their combinations with ``&`` and ``|``.
+    Adds the names of all layers of the mask to ``layers``.  Returns
+    ``None`` if the mask is anything else.
+    """
+    block = dsk.layers.get(name)
+    if not isinstance(block, Blockwise) or len(block.dsk) != 1:
+        return None
+    task = list(block.dsk.values())[0]
+    if len(task) != 3 or len(block.indices) != 2:
+        return None
+    func = task[0]
+    (a, a_ind), (b, b_ind) = block.indices
+    layers.add(name)
+
+    if func in (operator.and_, operator.or_):
+        if a_ind is None or b_ind is None:
+            return None
+        left = _mask_filters(dsk, a, input_name, layers)
+        right = _mask_filters(dsk, b, input_name, layers)
+        if left is None or right is None:
+            return None
+        if func is operator.or_:
+            filters = left + right
+        else:
+            filters = [x + y for x in left for y in right]
+        return filters if len(filters) <= _max_conjunctions else None
+
+    if func in _comparisons:
+        op, flipped = _comparisons[func]
+        if a_ind is None:
+            (a, a_ind), (b, b_ind), op = (b, b_ind), (a, a_ind), flipped
+        if b_ind is not None or b in dsk.layers:
+            return None
+        value = b
+    elif getattr(func, "method", None) == "isin":
+        # The values are a separate layer with the list as its only task
+        if a_ind is None or b_ind is not None or b not in dsk.layers:
+            return None
+        values = dict(dsk.layers[b])
+        if len(values) != 1 or type(values.get(b)) not in (list, set):
+            return None
+        op, value = "in", list(values[b])
+        layers.add(b)
+    else:
+        return None
+
+    # The compared series must be a column of the input
+    column = dsk.layers.get(a)
+    if (
+        not isinstance(column, Blockwise)
+        or len(column.dsk) != 1
+        or list(column.dsk.values())[0][0] is not operator.getitem
+        or len(column.indices) != 2
+        or column.indices[0][0] != input_name
+        or column.indices[1][1] is not None
+        or not isinstance(column.indices[1][0], str)
+    ):
+        return None
+    layers.add(a)
+    return [[(column.indices[1][0], op, value)]]
+
+
+def _coerce_filters(filters, meta):
+    """Convert the values in ``filters`` to the dtypes of the columns
+
+    Returns None if a value does not fit the dtype of its column, like a
+    string compared with a numeric column.
+    """
+    dtypes = dict(meta.dtypes.items())
+    if meta.index.name is not None:
+        dtypes[meta.index.name] = meta.index.dtype
+
+    def coerce(value, dtype):
+        if dtype.kind in "iufb":
+            if not isinstance(value, (numbers.Number, np.bool_)):
+                raise TypeError(value)
+            return value
+        if dtype.kind in "mM":
+            return pd.Series([value]).astype(dtype).iloc[0]
+        return value
+
+    out = []
+    try:
+        for conjunction in filters:
+            new = []
+            for column, op, value in conjunction:
+                dtype = dtypes.get(column)
+                if dtype is None or not isinstance(dtype, np.dtype):
+                    pass
+                elif op == "in":
+                    value = [coerce(v, dtype) for v in value]
+                else:
+                    value = coerce(value, dtype)
+                new.append((column, op, value))
+            out.append(new)
+    except (TypeError, ValueError):
+        return None
+    return out
+
+
+def optimize_read_parquet_filters(dsk, keys):
+    """Skip reading parts of Parquet datasets that filters rule out
+
+    Recognizes ``df[mask]`` right after ``read_parquet``, where the mask
+    compares columns of ``df`` with scalars or uses ``isin``, possibly
+    combined with ``&`` and ``|``.  Parts whose row-group statistics show
+    that they have no matching rows produce empty dataframes instead of
+    being read, so the number of partitions stays the same.  Only applies
+    if all uses of the dataset are part of the filter.
+    """
+    from .io.parquet.core import ParquetSubgraph
+
+    read_parquets = [
+        k
+        for k, v in dsk.layers.items()
+        if isinstance(v, ParquetSubgraph) and v.statistics and not v.filters
+    ]
+    if not read_parquets:
+        return dsk
+
+    layers = dsk.layers.copy()
+    dependencies = dsk.dependencies.copy()
+    requested = {x[0] if isinstance(x, tuple) else x for x in keys}
+
+    for k in read_parquets:
+        # Find the getitem with a mask, the other dependents select columns
+        candidates = [
+            dep
+            for dep in dsk.dependents[k]
+            if isinstance(dsk.layers[dep], Blockwise)
+            and len(dsk.layers[dep].dsk) == 1
+            and list(dsk.layers[dep].dsk.values())[0][0] is operator.getitem
+            and len(dsk.layers[dep].indices) == 2
+            and dsk.layers[dep].indices[0][0] == k
+            and dsk.layers[dep].indices[1][1] is not None
+        ]
+        if len(candidates) != 1:
+            continue
+        getitem = candidates[0]
+        block = dsk.layers[getitem]
+
+        mask_layers = set()
+        filters = _mask_filters(dsk, block.indices[1][0], k, mask_layers)
+        if filters:
+            filters = _coerce_filters(filters, layers[k].meta)
+        if not filters:
+            continue
+
+        # All uses of the dataset and of the mask must be part of the filter
+        inside = mask_layers | {getitem}
+        if k in requested or requested & mask_layers:
+            continue
+        if not dsk.dependents[k] <= inside or any(
+            not dsk.dependents[layer] <= inside for layer in mask_layers
+        ):
+            continue
+
+        old = layers[k]
+        new = ParquetSubgraph(
+            "read-parquet-" + tokenize(old.name, filters),
+            old.engine,
+            old.fs,
+            old.meta,
+            old.columns,
+            old.index,
+            old.parts,
+            old.kwargs,
+            part_ids=old.part_ids,
+            common_kwargs=old.common_kwargs,
+            annotations=old.annotations,
+            statistics=old.statistics,
+            filters=filters,
+        )
+        try:
+            if not new.pruned_parts:
+                continue
+        except (TypeError, ValueError):
+            # Values that cannot be compared with the statistics
+            continue
+
+        for dep in dsk.dependents[k]:
+            layers[dep] = _rename_blockwise_input(layers[dep], k, new.name)
+            dependencies[dep] = {new.name if d == k else d for d in dependencies[dep]}
+        layers[new.name] = new
+        dependencies[new.name] = dependencies.pop(k)
+        del layers[k]
+
+    return HighLevelGraph(layers, dependencies)
+
+
+def optimize_read_csv_getitem(dsk, keys):
+    """Only read the columns of CSV files that are selected with getitem
+
+    Like ``optimize_read_parquet_getitem``, but for ``read_csv`` and
+    ``read_table``, which skip the other columns through ``usecols``.
+    """
+    from .io.csv import CSVSubgraph
+
+    read_csvs = [
+        k
+        for k, v in dsk.layers.items()
+        if isinstance(getattr(v, "mapping", None), CSVSubgraph)
+    ]
+    if not read_csvs:
+        return dsk
+
+    layers = dsk.layers.copy()
+    dependencies = dsk.dependencies.copy()
+
+    for k in read_csvs:
+        projection = _getitem_columns(dsk, k, keys)
+        if projection is None:
+            continue
+        columns, update_blocks = projection
+
+        old = layers[k]
+        if not columns or not columns < set(old.mapping.head.columns):
+            continue
+        subgraph = old.mapping.project_columns(columns)
+        if subgraph is None:
+            continue
+
+        _rename_getitem_inputs(update_blocks, k, subgraph.name, layers, dependencies)
+        layers[subgraph.name] = BasicLayer(subgraph, annotations=old.annotations)
+        del layers[k]
+
+    return HighLevelGraph(layers, dependencies)
@@ -1,9 +1,14 @@
+import atexit
 import contextlib
 from collections import defaultdict
 import logging
 import math
+import os
+import pickle
 import shutil
+import struct
 import operator
+import threading
 import uuid
 import tempfile
 
@@ -18,7 +23,14 @@ from ..core import keys_in_tasks
 from ..base import tokenize, compute, compute_as_if_collection, is_dask_collection
 from ..highlevelgraph import HighLevelGraph, Layer
 from ..sizeof import sizeof
-from ..utils import digit, insert, M, stringify, stringify_collection_keys
+from ..utils import (
+    digit,
+    insert,
+    M,
+    parse_bytes,
+    stringify,
+    stringify_collection_keys,
+)
 from .utils import hash_object_dispatch, group_split_dispatch
 from . import methods
 
@@ -52,6 +64,12 @@ class SimpleShuffleLayer(Layer):
         List of required output-partition indices.
     annotations : dict (optional)
         Layer annotations
+    packed : bool, default False
+        Split each input into a single ``ShuffleSplits`` object that output
+        partitions slice directly, rather than into a dict of pieces that
+        are extracted by one ``getitem`` task each.  This saves tasks when
+        results are shared in memory, but each output partition then depends
+        on the full split of every input.
     """
 
     def __init__(
@@ -65,6 +83,7 @@ class SimpleShuffleLayer(Layer):
         meta_input,
         parts_out=None,
         annotations=None,
+        packed=False,
     ):
         super().__init__(annotations=annotations)
         self.name = name
@@ -75,6 +94,7 @@ class SimpleShuffleLayer(Layer):
         self.name_input = name_input
         self.meta_input = meta_input
         self.parts_out = parts_out or range(npartitions)
+        self.packed = packed
 
     def get_output_keys(self):
         return {(self.name, part) for part in self.parts_out}
@@ -117,6 +137,7 @@ class SimpleShuffleLayer(Layer):
             "meta_input",
             "parts_out",
             "annotations",
+            "packed",
         ]
         return (SimpleShuffleLayer, tuple(getattr(self, attr) for attr in attrs))
 
@@ -133,6 +154,7 @@ class SimpleShuffleLayer(Layer):
             "meta_input": to_serialize(self.meta_input),
             "parts_out": list(self.parts_out),
             "annotations": self.pack_annotations(),
+            "packed": self.packed,
         }
 
     @classmethod
@@ -199,6 +221,7 @@ class SimpleShuffleLayer(Layer):
             self.name_input,
             self.meta_input,
             parts_out=parts_out,
+            packed=self.packed,
         )
 
     def cull(self, keys, all_keys):
@@ -224,6 +247,30 @@ class SimpleShuffleLayer(Layer):
         shuffle_split_name = "split-" + self.name
 
         dsk = {}
+        if self.packed:
+            for part_in in range(self.npartitions_input):
+                dsk[(shuffle_group_name, part_in)] = (
+                    shuffle_group_packed,
+                    (self.name_input, part_in),
+                    self.column,
+                    0,
+                    self.npartitions,
+                    self.npartitions,
+                    self.ignore_index,
+                    self.npartitions,
+                )
+            for part_out in self.parts_out:
+                dsk[(self.name, part_out)] = (
+                    concat_splits,
+                    [
+                        (shuffle_group_name, part_in)
+                        for part_in in range(self.npartitions_input)
+                    ],
+                    part_out,
+                    self.ignore_index,
+                )
+            return dsk
+
         for part_out in self.parts_out:
             _concat_list = [
                 (shuffle_split_name, part_out, part_in)
@@ -286,6 +333,9 @@ class ShuffleLayer(SimpleShuffleLayer):
         List of required output-partition indices.
     annotations : dict (optional)
         Layer annotations
+    packed : bool, default False
+        Slice pieces out of ``ShuffleSplits`` without ``getitem`` tasks, see
+        ``SimpleShuffleLayer``.
     """
 
     def __init__(
@@ -302,6 +352,7 @@ class ShuffleLayer(SimpleShuffleLayer):
         meta_input,
         parts_out=None,
         annotations=None,
+        packed=False,
     ):
         super().__init__(
             name,
@@ -313,6 +364,7 @@ class ShuffleLayer(SimpleShuffleLayer):
             meta_input,
             parts_out=parts_out or range(len(inputs)),
             annotations=annotations,
+            packed=packed,
         )
         self.inputs = inputs
         self.stage = stage
@@ -337,6 +389,7 @@ class ShuffleLayer(SimpleShuffleLayer):
             "meta_input",
             "parts_out",
             "annotations",
+            "packed",
         ]
 
         return (ShuffleLayer, tuple(getattr(self, attr) for attr in attrs))
@@ -380,6 +433,7 @@ class ShuffleLayer(SimpleShuffleLayer):
             self.name_input,
             self.meta_input,
             parts_out=parts_out,
+            packed=self.packed,
         )
 
     def _construct_graph(self):
@@ -401,15 +455,25 @@ class ShuffleLayer(SimpleShuffleLayer):
                 _idx = out[self.stage]
                 _concat_list.append((shuffle_split_name, _idx, _inp))
 
-            # concatenate those pieces together, with their friends
-            dsk[(self.name, part)] = (_concat, _concat_list, self.ignore_index)
+            if self.packed:
+                # slice the pieces out of the splits directly
+                dsk[(self.name, part)] = (
+                    concat_splits,
+                    [(shuffle_group_name, _inp) for _, _, _inp in _concat_list],
+                    out[self.stage],
+                    self.ignore_index,
+                )
+            else:
+                # concatenate those pieces together, with their friends
+                dsk[(self.name, part)] = (_concat, _concat_list, self.ignore_index)
 
             for _, _idx, _inp in _concat_list:
-                dsk[(shuffle_split_name, _idx, _inp)] = (
-                    operator.getitem,
-                    (shuffle_group_name, _inp),
-                    _idx,
-                )
+                if not self.packed:
+                    dsk[(shuffle_split_name, _idx, _inp)] = (
+                        operator.getitem,
+                        (shuffle_group_name, _inp),
+                        _idx,
+                    )
 
                 if (shuffle_group_name, _inp) not in dsk:
 
@@ -428,7 +492,7 @@ class ShuffleLayer(SimpleShuffleLayer):
 
                     # Convert partition into dict of dataframe pieces
                     dsk[(shuffle_group_name, _inp)] = (
-                        shuffle_group,
+                        shuffle_group_packed if self.packed else shuffle_group,
                         input_key,
                         self.column,
                         self.stage,
@@ -585,7 +649,8 @@ def set_partition(
     shuffle: str (optional)
         Either 'disk' for an on-disk shuffle or 'tasks' to use the task
         scheduling framework.  Use 'disk' if you are on a single machine
-        and 'tasks' if you are on a distributed cluster.
+        and 'tasks' if you are on a distributed cluster.  'file' is an
+        on-disk shuffle that does not use partd.
     max_branch: int (optional)
         If using the task-based shuffle, the amount of splitting each
         partition undergoes.  Increase this for fewer copies but more
@@ -662,6 +727,8 @@ def shuffle(
     max_branch=32,
     ignore_index=False,
     compute=None,
+    heavy=None,
+    replicate=False,
 ):
     """Group DataFrame by index
 
@@ -673,14 +740,22 @@ def shuffle(
     This does not preserve a meaningful index/partitioning scheme. This is not
     deterministic if done in parallel.
 
+    Skewed data, where a few keys hold many rows, can be handled with
+    ``heavy``, a dict from ``heavy_hitters`` or ``True`` to compute one.  The
+    rows of these heavy keys are then spread over several partitions, which
+    breaks the guarantee above for them.  With ``replicate=True`` these rows
+    are instead copied to each of those partitions, which is what the other
+    side of a join needs.
+
     See Also
     --------
     set_index
     set_partition
     shuffle_disk
+    heavy_hitters
     """
     list_like = pd.api.types.is_list_like(index) and not is_dask_collection(index)
-    if shuffle == "tasks" and (isinstance(index, str) or list_like):
+    if shuffle == "tasks" and not heavy and (isinstance(index, str) or list_like):
         # Avoid creating the "_partitions" column if possible.
         # We currently do this if the user is passing in
         # specific column names (and shuffle == "tasks").
@@ -700,16 +775,30 @@ def shuffle(
                 compute=compute,
             )
 
-    if not isinstance(index, _Frame):
-        index = df._select_columns_or_index(index)
+    index = _shuffle_keys(df, index)
 
-    partitions = index.map_partitions(
-        partitioning_index,
-        npartitions=npartitions or df.npartitions,
-        meta=df._meta._constructor_sliced([0]),
-        transform_divisions=False,
-    )
-    df2 = df.assign(_partitions=partitions)
+    if heavy is True:
+        heavy = heavy_hitters(df, index, npartitions or df.npartitions)
+
+    if heavy and replicate:
+        df2 = map_partitions(
+            replicate_heavy,
+            df,
+            index,
+            npartitions or df.npartitions,
+            heavy=heavy,
+            meta=df._meta.assign(_partitions=np.int64(0)),
+            transform_divisions=False,
+        )
+    else:
+        partitions = index.map_partitions(
+            partitioning_index,
+            npartitions=npartitions or df.npartitions,
+            heavy=heavy,
+            meta=df._meta._constructor_sliced([0]),
+            transform_divisions=False,
+        )
+        df2 = df.assign(_partitions=partitions)
     df2._meta.index.name = df._meta.index.name
     df3 = rearrange_by_column(
         df2,
@@ -758,6 +847,8 @@ def rearrange_by_column(
     shuffle = shuffle or config.get("shuffle", None) or "disk"
     if shuffle == "disk":
         return rearrange_by_column_disk(df, col, npartitions, compute=compute)
+    elif shuffle == "file":
+        return rearrange_by_column_file(df, col, npartitions, compute=compute)
     elif shuffle == "tasks":
         df2 = rearrange_by_column_tasks(
             df, col, max_branch, npartitions, ignore_index=ignore_index
@@ -875,6 +966,254 @@ def rearrange_by_column_disk(df, column, npartitions=None, compute=False):
     return DataFrame(graph, name, df._meta, divisions)
 
 
+def _shuffle_compression(name):
+    """Get ``(compress, decompress)`` functions for a compression name"""
+    if name is None:
+        return None
+    key = name.lower()
+    try:
+        if key == "zlib":
+            import zlib as mod
+        elif key == "bz2":
+            import bz2 as mod
+        elif key == "lzma":
+            import lzma as mod
+        elif key == "snappy":
+            import snappy as mod
+        elif key == "lz4":
+            import lz4.frame as mod
+        else:
+            raise ValueError(
+                "Unknown shuffle compression %r, expected one of "
+                "'zlib', 'bz2', 'lzma', 'snappy' or 'lz4'" % name
+            )
+    except ImportError as e:
+        raise ImportError("Not able to import %s for shuffle compression" % name) from e
+    return mod.compress, mod.decompress
+
+
+_shuffle_dirs = set()
+
+
+@atexit.register
+def _cleanup_shuffle_dirs():
+    for path in list(_shuffle_dirs):
+        shutil.rmtree(path, ignore_errors=True)
+
+
+class FileShuffle:
+    """Shuffled partitions in one file per output partition
+
+    Fragments of a partition are appended to its file in a single write, as
+    a pickle whose array buffers are stored raw rather than pickled, and
+    possibly compressed.  Fragments are kept in memory until ``buffer_size``
+    bytes are pending.  Buffering is turned off once the object is
+    serialized, e.g. to be sent to another process, since then there is no
+    single buffer anymore that could be flushed.
+
+    Parameters
+    ----------
+    path: str
+        Directory holding the files
+    buffer_size: int
+        Number of bytes of fragments to hold in memory before writing them
+    compression: str, optional
+        Compression of the fragments like ``"zlib"`` or ``"lz4"``
+
+    See Also
+    --------
+    rearrange_by_column_file
+    """
+
+    def __init__(self, path, buffer_size=0, compression=None):
+        self.path = path
+        self.buffer_size = buffer_size
+        self.compression = compression
+        self._codec = _shuffle_compression(compression)
+        self._buffer = defaultdict(list)
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    def __reduce__(self):
+        return (FileShuffle, (self.path, 0, self.compression))
+
+    def _filename(self, part):
+        return os.path.join(self.path, str(part))
+
+    def _encode(self, df):
+        buffers = []
+        if pickle.HIGHEST_PROTOCOL >= 5:
+            header = pickle.dumps(df, protocol=5, buffer_callback=buffers.append)
+            buffers = [b.raw() for b in buffers]
+        else:  # pragma: no cover
+            header = pickle.dumps(df, protocol=pickle.HIGHEST_PROTOCOL)
+        frames = [header] + buffers
+        if self._codec is not None:
+            frames = [self._codec[0](frame) for frame in frames]
+        sizes = [memoryview(frame).nbytes for frame in frames]
+        prefix = struct.pack("<Q", len(sizes)) + struct.pack(
+            "<%dQ" % len(sizes), *sizes
+        )
+        return b"".join([prefix] + frames)
+
+    def _decode(self, data):
+        """ Decode all fragments in the contents of a file """
+        out = []
+        view = memoryview(data)
+        start = 0
+        while start < len(view):
+            (n,) = struct.unpack_from("<Q", view, start)
+            sizes = struct.unpack_from("<%dQ" % n, view, start + 8)
+            start += 8 * (n + 1)
+            frames = []
+            for size in sizes:
+                frames.append(view[start : start + size])
+                start += size
+            if self._codec is not None:
+                frames = [bytearray(self._codec[1](frame)) for frame in frames]
+            header, buffers = frames[0], frames[1:]
+            out.append(pickle.loads(header, buffers=buffers))
+        return out
+
+    def _write(self, part, records):
+        # A single appending write keeps fragments of concurrent writers apart.
+        # Writes are only cut short beyond about 2 GiB, so loop for the rest.
+        data = memoryview(b"".join(records))
+        fd = os.open(self._filename(part), os.O_WRONLY | os.O_APPEND | os.O_CREAT)
+        try:
+            while data:
+                data = data[os.write(fd, data) :]
+        finally:
+            os.close(fd)
+
+    def append(self, data):
+        """Add a fragment to each partition of a ``{partition: df}`` dict"""
+        encoded = {part: self._encode(df) for part, df in data.items()}
+        to_write = {}
+        with self._lock:
+            for part, record in encoded.items():
+                self._buffer[part].append(record)
+                self._nbytes += len(record)
+            if self._nbytes > self.buffer_size:
+                # Write the largest partitions until half the buffer is free
+                parts = sorted(
+                    self._buffer,
+                    key=lambda part: sum(map(len, self._buffer[part])),
+                    reverse=True,
+                )
+                for part in parts:
+                    records = self._buffer.pop(part)
+                    self._nbytes -= sum(map(len, records))
+                    to_write[part] = records
+                    if self._nbytes <= self.buffer_size // 2:
+                        break
+        for part, records in to_write.items():
+            self._write(part, records)
+
+    def flush(self):
+        """ Write all buffered fragments to disk """
+        with self._lock:
+            buffer, self._buffer = self._buffer, defaultdict(list)
+            self._nbytes = 0
+        for part, records in buffer.items():
+            self._write(part, records)
+
+    def get(self, part):
+        """ All fragments of a partition, as a list of dataframes """
+        try:
+            with open(self._filename(part), "rb") as f:
+                data = bytearray(os.fstat(f.fileno()).st_size)
+                f.readinto(data)
+        except FileNotFoundError:
+            return []
+        return self._decode(data)
+
+    def drop(self):
+        """ Remove all data """
+        with self._lock:
+            self._buffer.clear()
+            self._nbytes = 0
+        shutil.rmtree(self.path, ignore_errors=True)
+        _shuffle_dirs.discard(self.path)
+
+
+def _file_shuffle(tempdir, buffer_size, compression):
+    path = tempfile.mkdtemp(suffix=".shuffle", dir=tempdir)
+    _shuffle_dirs.add(path)
+    return FileShuffle(path, buffer_size=buffer_size, compression=compression)
+
+
+def rearrange_by_column_file(df, column, npartitions=None, compute=False):
+    """Shuffle using local disk, without partd
+
+    Like ``rearrange_by_column_disk``, but each output partition gets its own
+    file that the fragments of all input partitions are appended to.  Array
+    buffers are written raw, fragments are buffered in memory up to the
+    ``dataframe.shuffle-buffer-size`` configuration value, and are compressed
+    according to ``dataframe.shuffle-file-compression``.
+
+    See Also
+    --------
+    rearrange_by_column_disk:
+        Same function, but using partd
+    """
+    if npartitions is None:
+        npartitions = df.npartitions
+
+    token = tokenize(df, column, npartitions)
+    always_new_token = uuid.uuid1().hex
+
+    compression = config.get("dataframe.shuffle-file-compression", None)
+    _shuffle_compression(compression)  # fail early on unknown algorithms
+    buffer_size = parse_bytes(config.get("dataframe.shuffle-buffer-size", "64MiB"))
+    tempdir = config.get("temporary_directory", None)
+
+    p = ("zfile-shuffle-" + always_new_token,)
+    dsk1 = {p: (_file_shuffle, tempdir, buffer_size, compression)}
+
+    # Partition data on disk
+    name = "shuffle-partition-" + always_new_token
+    dsk2 = {
+        (name, i): (shuffle_group_file, key, column, p)
+        for i, key in enumerate(df.__dask_keys__())
+    }
+
+    dependencies = []
+    if compute:
+        graph = HighLevelGraph.merge(df.dask, dsk1, dsk2)
+        keys = [p, sorted(dsk2)]
+        pp, values = compute_as_if_collection(DataFrame, graph, keys)
+        dsk1 = {p: pp}
+        dsk2 = dict(zip(sorted(dsk2), values))
+    else:
+        dependencies.append(df)
+
+    # Barrier, which also writes out what is still buffered
+    barrier_token = "barrier-" + always_new_token
+    dsk3 = {barrier_token: (flush_file_shuffle, p, list(dsk2))}
+
+    # Collect groups
+    name1 = "shuffle-collect-1" + token
+    dsk4 = {
+        (name1, i): (collect_file, p, i, df._meta, barrier_token)
+        for i in range(npartitions)
+    }
+    cleanup_token = "cleanup-" + always_new_token
+    barrier_token2 = "barrier2-" + always_new_token
+    # A task that depends on `cleanup-`, but has a small output
+    dsk5 = {(barrier_token2, i): (barrier, part) for i, part in enumerate(dsk4)}
+    # This indirectly depends on `cleanup-` and so runs after we're done using the disk
+    dsk6 = {cleanup_token: (cleanup_shuffle_files, p, list(dsk5))}
+
+    name = "shuffle-collect-2" + token
+    dsk7 = {(name, i): (_noop, (name1, i), cleanup_token) for i in range(npartitions)}
+    divisions = (None,) * (npartitions + 1)
+
+    layer = toolz.merge(dsk1, dsk2, dsk3, dsk4, dsk5, dsk6, dsk7)
+    graph = HighLevelGraph.from_collections(name, layer, dependencies=dependencies)
+    return DataFrame(graph, name, df._meta, divisions)
+
+
 def _noop(x, cleanup_token):
     """
     A task that does nothing.
@@ -883,7 +1222,7 @@ def _noop(x, cleanup_token):
 
 
 def rearrange_by_column_tasks(
-    df, column, max_branch=32, npartitions=None, ignore_index=False
+    df, column, max_branch=32, npartitions=None, ignore_index=False, packed=None
 ):
     """Order divisions of DataFrame so that all values within column(s) align
 
@@ -929,6 +1268,12 @@ def rearrange_by_column_tasks(
         number of full-dataset transfers that we have to make.
     npartitions: Optional[int]
         The desired number of output partitions
+    packed: Optional[bool]
+        Whether to split each partition into a single ``ShuffleSplits``
+        object that is sliced by the tasks of the next stage, without one
+        task per piece.  This suits the single-machine schedulers, where
+        results are shared rather than sent between workers.  Defaults to
+        the ``dataframe.shuffle-packed`` configuration value.
 
     Returns
     -------
@@ -942,12 +1287,14 @@ def rearrange_by_column_tasks(
     """
 
     max_branch = max_branch or 32
+    if packed is None:
+        packed = config.get("dataframe.shuffle-packed", False)
 
     if (npartitions or df.npartitions) <= max_branch:
         # We are creating a small number of output partitions.
         # No need for staged shuffling. Staged shuffling will
         # sometimes require extra work/communication in this case.
-        token = tokenize(df, column, npartitions)
+        token = tokenize(df, column, npartitions, packed)
         shuffle_name = f"simple-shuffle-{token}"
         npartitions = npartitions or df.npartitions
         shuffle_layer = SimpleShuffleLayer(
@@ -958,6 +1305,7 @@ def rearrange_by_column_tasks(
             ignore_index,
             df._name,
             df._meta,
+            packed=packed,
         )
         graph = HighLevelGraph.from_collections(
             shuffle_name, shuffle_layer, dependencies=[df]
@@ -974,7 +1322,7 @@ def rearrange_by_column_tasks(
     inputs = [tuple(digit(i, j, k) for j in range(stages)) for i in range(k ** stages)]
 
     npartitions_orig = df.npartitions
-    token = tokenize(df, stages, column, n, k)
+    token = tokenize(df, stages, column, n, k, packed)
     for stage in range(stages):
         stage_name = f"shuffle-{stage}-{token}"
         stage_layer = ShuffleLayer(
@@ -988,6 +1336,7 @@ def rearrange_by_column_tasks(
             ignore_index,
             df._name,
             df._meta,
+            packed=packed,
         )
         graph = HighLevelGraph.from_collections(
             stage_name, stage_layer, dependencies=[df]
@@ -1036,24 +1385,117 @@ def rearrange_by_column_tasks(
 ########################################################
 
 
-def partitioning_index(df, npartitions):
+def partitioning_index(df, npartitions, heavy=None):
     """
     Computes a deterministic index mapping each record to a partition.
 
-    Identical rows are mapped to the same partition.
+    Identical rows are mapped to the same partition, unless they are listed
+    in ``heavy``.
 
     Parameters
     ----------
     df : DataFrame/Series/Index
     npartitions : int
         The number of partitions to group into.
+    heavy : dict, optional
+        Maps hashes of keys to the number of consecutive partitions that
+        their rows are spread over, round robin.  See ``heavy_hitters``.
 
     Returns
     -------
     partitions : ndarray
         An array of int64 values mapping each record to a partition.
     """
-    return hash_object_dispatch(df, index=False) % int(npartitions)
+    hashes = hash_object_dispatch(df, index=False)
+    if not heavy:
+        return hashes % int(npartitions)
+    splits = _heavy_splits(hashes, heavy)
+    offsets = np.arange(len(splits)) % splits
+    partitions = (hashes % int(npartitions)).astype(np.int64)
+    return (partitions + offsets) % int(npartitions)
+
+
+def _heavy_splits(hashes, heavy):
+    """ The number of partitions for each hash, 1 for keys that are not heavy """
+    ind = pd.Index(np.fromiter(heavy, dtype=np.uint64, count=len(heavy)))
+    ind = ind.get_indexer(np.asarray(hashes, dtype=np.uint64))
+    # Keys that are not found get index -1, the trailing 1
+    splits = np.array(list(heavy.values()) + [1], dtype=np.int64)
+    return splits[ind]
+
+
+def replicate_heavy(df, index, npartitions, heavy):
+    """Assign partitions to rows, with copies of rows that have heavy keys
+
+    Rows whose key is listed in ``heavy`` are repeated once for each of the
+    partitions that ``partitioning_index`` spreads the key over, so that they
+    meet all rows of that key from the other side of a join.  The partitions
+    are stored in a ``_partitions`` column.
+    """
+    hashes = np.asarray(hash_object_dispatch(index, index=False), dtype=np.uint64)
+    splits = _heavy_splits(hashes, heavy)
+    positions = np.repeat(np.arange(len(df)), splits)
+    offsets = np.arange(len(positions)) - np.repeat(np.cumsum(splits) - splits, splits)
+    base = (hashes % np.uint64(npartitions)).astype(np.int64)
+    partitions = (base[positions] + offsets) % npartitions
+    df = df.iloc[positions]
+    return df.assign(_partitions=partitions)
+
+
+def key_counts(df, top):
+    """ Counts of the ``top`` most frequent key hashes in a partition """
+    hashes = hash_object_dispatch(df, index=False)
+    return pd.Series(np.asarray(hashes)).value_counts().iloc[:top]
+
+
+def _shuffle_keys(df, index):
+    """ The keys that ``shuffle`` hashes to find the partition of each row """
+    if isinstance(index, _Frame):
+        return index
+    return df._select_columns_or_index(index)
+
+
+def heavy_hitters(df, index, npartitions, top=100):
+    """Find keys that hold more rows than fit in an output partition
+
+    The most frequent keys of every input partition are counted, and keys
+    with more than ``1 / npartitions`` of all rows are spread over as many
+    output partitions as their share requires.  Keys are identified by their
+    hash as computed by ``partitioning_index``.  This computes ``index``.
+
+    Parameters
+    ----------
+    df : DataFrame
+    index : str, list of str, or Series/DataFrame/Index
+        The keys of a shuffle, as passed to ``shuffle``
+    npartitions : int
+        The number of output partitions
+    top : int
+        The number of most frequent keys to count in each input partition
+
+    Returns
+    -------
+    heavy : dict
+        Maps hashes of heavy keys to their number of output partitions
+
+    See Also
+    --------
+    partitioning_index
+    """
+    index = _shuffle_keys(df, index)
+    counts = index.map_partitions(
+        key_counts,
+        top,
+        meta=pd.Series([], dtype="i8"),
+        enforce_metadata=False,
+        transform_divisions=False,
+    )
+    total = index.reduction(len, np.sum, token="len", meta=int, split_every=False)
+    counts, total = base.compute(counts, total)
+    counts = counts.groupby(level=0).sum()
+    splits = np.minimum(np.ceil(counts * npartitions / max(total, 1)), npartitions)
+    splits = splits[splits > 1]
+    return {int(h): int(n) for h, n in splits.items()}
 
 
 def barrier(args):
@@ -1088,6 +1530,34 @@ def cleanup_partd_files(p, keys):
         shutil.rmtree(path, ignore_errors=True)
 
 
+def cleanup_shuffle_files(p, keys):
+    """
+    Cleanup the files of a ``FileShuffle``.
+
+    Parameters
+    ----------
+    p : FileShuffle
+    keys: List
+        Just for scheduling purposes, not actually used.
+    """
+    p.drop()
+
+
+def flush_file_shuffle(p, keys):
+    with ensure_cleanup_on_exception(p):
+        p.flush()
+    return 0
+
+
+def collect_file(p, part, meta, barrier_token):
+    """ Collect a partition from a ``FileShuffle`` """
+    with ensure_cleanup_on_exception(p):
+        dfs = p.get(part)
+        if not dfs:
+            return meta
+        return _concat(dfs) if len(dfs) > 1 else dfs[0]
+
+
 def collect(p, part, meta, barrier_token):
     """ Collect partitions from partd, yield dataframes """
     with ensure_cleanup_on_exception(p):
@@ -1157,6 +1627,12 @@ def shuffle_group(df, cols, stage, k, npartitions, ignore_index, nfinal):
         A dictionary mapping integers in {0..k} to dataframes such that the
         hash values of ``df[col]`` are well partitioned.
     """
+    c = _shuffle_group_index(df, cols, stage, k, npartitions, nfinal)
+    return group_split_dispatch(df, c, k, ignore_index=ignore_index)
+
+
+def _shuffle_group_index(df, cols, stage, k, npartitions, nfinal):
+    """ The group in ``{0..k}`` of each row, see ``shuffle_group`` """
     if isinstance(cols, str):
         cols = [cols]
 
@@ -1173,8 +1649,62 @@ def shuffle_group(df, cols, stage, k, npartitions, ignore_index, nfinal):
     c = np.mod(c, npartitions).astype(typ, copy=False)
     np.floor_divide(c, k ** stage, out=c)
     np.mod(c, k, out=c)
+    return c
 
-    return group_split_dispatch(df, c, k, ignore_index=ignore_index)
+
+class ShuffleSplits:
+    """The rows of a partition, sorted by their group in a shuffle
+
+    Group ``i`` is the slice ``offsets[i]:offsets[i + 1]`` of ``df``, which
+    is cut out only when requested with ``splits[i]``.
+
+    See Also
+    --------
+    shuffle_group_packed
+    """
+
+    __slots__ = ("df", "offsets")
+
+    def __init__(self, df, offsets):
+        self.df = df
+        self.offsets = offsets
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        return self.df.iloc[self.offsets[i] : self.offsets[i + 1]]
+
+    def __reduce__(self):
+        return (ShuffleSplits, (self.df, self.offsets))
+
+
+@sizeof.register(ShuffleSplits)
+def sizeof_shuffle_splits(splits):
+    return sizeof(splits.df) + sizeof(splits.offsets)
+
+
+def shuffle_group_packed(df, cols, stage, k, npartitions, ignore_index, nfinal):
+    """Splits dataframe into groups, as one ``ShuffleSplits`` object
+
+    Like ``shuffle_group``, but the rows are only sorted by their group, in a
+    single pass, without building a dataframe for every group.
+
+    See Also
+    --------
+    shuffle_group
+    concat_splits
+    """
+    c = _shuffle_group_index(df, cols, stage, k, npartitions, nfinal)
+    order = np.argsort(c, kind="stable")
+    offsets = np.zeros(k + 1, dtype=np.int64)
+    np.cumsum(np.bincount(c, minlength=k), out=offsets[1:])
+    return ShuffleSplits(df.take(order), offsets)
+
+
+def concat_splits(splits, i, ignore_index):
+    """ Concatenate group ``i`` of several ``ShuffleSplits`` """
+    return _concat([s[i] for s in splits], ignore_index=ignore_index)
 
 
 @contextlib.contextmanager
@@ -1204,6 +1734,15 @@ def shuffle_group_3(df, col, npartitions, p):
         p.append(d, fsync=True)
 
 
+def shuffle_group_file(df, col, p):
+    with ensure_cleanup_on_exception(p):
+        if not len(df):
+            return
+        ind = df[col].values.astype(np.intp, copy=False)
+        groups = group_split_dispatch(df, ind, ind.max() + 1)
+        p.append({i: g for i, g in groups.items() if len(g)})
+
+
 def set_index_post_scalar(df, index_name, drop, column_dtype):
     df2 = df.drop("_partitions", axis=1).set_index(index_name, drop=drop)
     df2.columns = df2.columns.astype(column_dtype)
@@ -4427,6 +4427,19 @@ def test_fuse_roots():
     hlg.validate()
 
 
+def test_fuse_roots_stacked_inputs():
+    pdf = pd.DataFrame({"a": range(10), "b": range(10, 20)})
+    ddf1 = dd.from_pandas(pdf[["a"]], 2) + 1
+    ddf2 = dd.from_pandas(pdf[["b"]], 2) * 2
+
+    # Inputs that are several layers deep feed a non-blockwise layer
+    res = ddf1.merge(ddf2, left_index=True, right_index=True)
+    hlg = fuse_roots(res.__dask_graph__(), keys=res.__dask_keys__())
+    hlg.validate()
+    assert len(hlg.layers) == 1
+    assert_eq(res, pd.concat([pdf[["a"]] + 1, pdf[["b"]] * 2], axis=1))
+
+
 @pytest.mark.skipif(not dd._compat.PANDAS_GT_100, reason="attrs introduced in 1.0.0")
 def test_attrs_dataframe():
     df = pd.DataFrame({"A": [1, 2], "B": [3, 4], "C": [5, 6]})
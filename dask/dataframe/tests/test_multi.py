@@ -1,5 +1,6 @@
 import warnings
 
+import dask
 import dask.dataframe as dd
 import numpy as np
 import pandas as pd
@@ -12,6 +13,7 @@ from dask.dataframe.multi import (
     align_partitions,
     merge_indexed_dataframes,
     hash_join,
+    bloom_prune,
     concat_indexed_dataframes,
     _maybe_align_partitions,
 )
@@ -257,6 +259,123 @@ def test_hash_join(how, shuffle):
     )
 
 
+@pytest.mark.parametrize("how", ["inner", "left", "right", "outer"])
+def test_hash_join_bloom(how):
+    A = pd.DataFrame({"x": range(100), "y": np.arange(100) % 20})
+    a = dd.from_pandas(A, npartitions=5)
+
+    B = pd.DataFrame({"y": [1, 3, 3, 25], "z": [6, 5, 4, 3]})
+    b = dd.from_pandas(B, npartitions=2)
+
+    c = hash_join(a, "y", b, "y", how, bloom=True)
+    list_eq(c.compute(), pd.merge(A, B, how, "y"))
+    if how != "outer":
+        assert c._name != hash_join(a, "y", b, "y", how)._name
+
+    a = a.set_index("x").clear_divisions()
+    b = b.clear_divisions()
+    c = dd.merge(a, b, how=how, left_index=True, right_index=True, bloom=True)
+    expected = pd.merge(A.set_index("x"), B, how=how, left_index=True, right_index=True)
+    list_eq(c, expected)
+
+
+def test_bloom_prune():
+    A = pd.DataFrame({"x": range(1000), "y": np.arange(1000) % 100})
+    a = dd.from_pandas(A, npartitions=10)
+
+    B = pd.DataFrame({"y": [1, 2, 2], "w": [1.0, 2.0, 3.0]}, index=[7, 8, 9])
+    b = dd.from_pandas(B, npartitions=1)
+
+    # The side with fewer partitions builds the filter in inner joins
+    a2, left_on, b2, right_on = bloom_prune(a, "y", b, "y", how="inner", b=16)
+    assert b2 is b and (left_on, right_on) == ("y", "y")
+    result = a2.compute()
+    assert set(A.y[A.y.isin(B.y)]) == set(result.y)
+    assert len(result) < len(A) / 10  # few false positives
+
+    # Index keys refer to the pruned dataframe
+    b2, b_on, a2, a_on = bloom_prune(b, b.index, a, "x", how="right")
+    assert a2 is a and b_on._name == b2.index._name
+    assert_eq(b2, B.loc[[7, 8, 9]])
+    assert bloom_prune(a, "y", b, "y", how="outer")[0] is a
+
+
+@pytest.mark.parametrize("how", ["inner", "left", "right", "outer"])
+def test_merge_broadcast(how):
+    A = pd.DataFrame({"x": range(100), "y": np.arange(100) % 20})
+    a = dd.from_pandas(A, npartitions=5)
+
+    B = pd.DataFrame({"y": [1, 3, 3, 25], "z": [6, 5, 4, 3]})
+    b = dd.from_pandas(B, npartitions=2)
+
+    c = dd.merge(a, b, how=how, on="y", broadcast=True)
+    list_eq(c, pd.merge(A, B, how=how, on="y"))
+    if how in ("inner", "left"):
+        # The smaller right side is broadcast, the left one is not shuffled
+        assert c.npartitions == a.npartitions
+        assert not any("shuffle" in k for k in c.dask.layers)
+    elif how == "outer":
+        assert c.npartitions == a.npartitions
+        assert any("shuffle" in k for k in c.dask.layers)
+
+    # Thresholds on memory usage
+    for threshold in [10 ** 6, "1MB"]:
+        c = dd.merge(a, b, how="inner", on="y", broadcast=threshold)
+        assert not any("shuffle" in k for k in c.dask.layers)
+    c = dd.merge(a, b, how="inner", on="y", broadcast=10)
+    assert any("shuffle" in k for k in c.dask.layers)
+
+    with dask.config.set({"dataframe.broadcast-join-threshold": "1MB"}):
+        c = dd.merge(a, b, how="inner", on="y")
+        assert not any("shuffle" in k for k in c.dask.layers)
+        c = dd.merge(a, b, how="inner", on="y", broadcast=False)
+        assert any("shuffle" in k for k in c.dask.layers)
+    list_eq(c, pd.merge(A, B, how="inner", on="y"))
+
+
+def test_merge_broadcast_threshold_computes_one_partition():
+    A = pd.DataFrame({"x": range(100), "y": np.arange(100) % 20})
+    a = dd.from_pandas(A, npartitions=5)
+    B = pd.DataFrame({"y": range(8), "z": range(8)})
+    computed = []
+
+    def record(df):
+        computed.append(len(df))
+        return df
+
+    b = dd.from_pandas(B, npartitions=4).map_partitions(record)
+    del computed[:]  # meta inference
+
+    c = dd.merge(a, b, how="inner", on="y", broadcast="1MB")
+    assert computed == [2]
+    assert not any("shuffle" in k for k in c.dask.layers)
+
+    # The right side has more partitions than the left, it is never broadcast
+    del computed[:]
+    c = dd.merge(a.repartition(npartitions=2), b, how="left", on="y", broadcast="1MB")
+    assert not computed
+    assert any("shuffle" in k for k in c.dask.layers)
+
+
+@pytest.mark.parametrize("how", ["inner", "left", "right", "outer"])
+@pytest.mark.parametrize("shuffle", ["disk", "tasks"])
+def test_hash_join_skew(how, shuffle):
+    A = pd.DataFrame({"x": range(200), "y": [0] * 150 + list(range(50))})
+    a = dd.from_pandas(A, npartitions=5)
+
+    B = pd.DataFrame({"y": [0, 0, 1, 3, 60], "z": [6, 5, 4, 3, 2]})
+    b = dd.from_pandas(B, npartitions=2)
+
+    c = hash_join(a, "y", b, "y", how, npartitions=5, shuffle=shuffle, skew=True)
+    list_eq(c.compute(), pd.merge(A, B, how, "y"))
+    if how in ("inner", "left"):
+        sizes = c.map_partitions(len).compute()
+        assert max(sizes) < 150
+
+    c = dd.merge(b, a, how=how, on="y", shuffle=shuffle, skew=True)
+    list_eq(c.compute(), pd.merge(B, A, how, "y"))
+
+
 def test_sequential_joins():
     # Pandas version of multiple inner joins
     df1 = pd.DataFrame(
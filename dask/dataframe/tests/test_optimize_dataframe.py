@@ -37,3 +37,126 @@ def test_optimize_blockwise():
     graph = optimize_blockwise(ddf.dask)
 
     assert len(graph) <= 4
+
+
+class StatisticsEngine:
+    @staticmethod
+    def read_partition(fs, piece, columns, index, **kwargs):
+        return piece[columns]
+
+
+def read_parquet_from_frames(dfs, statistics=None):
+    """ A read_parquet collection of ``dfs`` with row-group statistics """
+    from dask.dataframe.core import new_dd_object
+    from dask.dataframe.io.parquet.core import ParquetSubgraph
+
+    if statistics is None:
+        statistics = [
+            {
+                "num-rows": len(df),
+                "columns": [
+                    {"name": c, "min": df[c].min(), "max": df[c].max()} for c in df
+                ],
+            }
+            for df in dfs
+        ]
+    subgraph = ParquetSubgraph(
+        "read-parquet-x",
+        StatisticsEngine,
+        None,
+        dfs[0].iloc[:0],
+        list(dfs[0].columns),
+        None,
+        [{"piece": df} for df in dfs],
+        {},
+        statistics=statistics,
+    )
+    divisions = [None] * (len(dfs) + 1)
+    return new_dd_object(subgraph, "read-parquet-x", dfs[0].iloc[:0], divisions)
+
+
+def pruned_parts(result):
+    from dask.dataframe.io.parquet.core import ParquetSubgraph
+    from dask.dataframe.optimize import optimize_read_parquet_filters
+
+    hlg = optimize_read_parquet_filters(result.dask, result.__dask_keys__())
+    [layer] = [l for l in hlg.layers.values() if isinstance(l, ParquetSubgraph)]
+    return layer.pruned_parts
+
+
+def test_optimize_read_parquet_filters():
+    from dask.dataframe.io.parquet.core import ParquetSubgraph
+    from dask.dataframe.optimize import optimize_read_parquet_filters
+
+    ddf = read_parquet_from_frames(dfs)
+    full = pd.concat(dfs)
+
+    for mask, expected_filters, pruned in [
+        (ddf.a > 6, [[("a", ">", 6)]], {0, 1}),
+        ((ddf.a <= 3) | ddf.b.isin([3]), [[("a", "<=", 3)], [("b", "in", [3])]], {2}),
+        ((ddf.a > 3) & (ddf.b > 2), [[("a", ">", 3), ("b", ">", 2)]], {0, 2}),
+    ]:
+        result = ddf[mask]
+        hlg = optimize_read_parquet_filters(result.dask, result.__dask_keys__())
+        [layer] = [l for l in hlg.layers.values() if isinstance(l, ParquetSubgraph)]
+        assert layer.filters == expected_filters
+        assert layer.pruned_parts == pruned
+        assert result.npartitions == 3
+        dd.utils.assert_eq(result, full[mask.compute()])
+
+    # Other uses of the data prevent skipping parts
+    result = ddf[ddf.a > 6]
+    total = ddf.b.sum()
+    hlg = optimize_read_parquet_filters(
+        dask.base.collections_to_dsk([result, total], optimize_graph=False),
+        result.__dask_keys__() + [total.key],
+    )
+    assert all(
+        not l.filters for l in hlg.layers.values() if isinstance(l, ParquetSubgraph)
+    )
+    assert dask.compute(result.a.sum(), total) == (24, 21)
+
+
+def test_optimize_read_parquet_filters_missing_statistics():
+    ddf = read_parquet_from_frames(dfs)
+    statistics = ddf.dask.layers[ddf._name].statistics
+    statistics[2]["columns"][0].update(min=None, max=None)
+
+    # Parts without statistics for a column are always read
+    result = ddf[ddf.a > 6]
+    assert pruned_parts(result) == {0, 1}
+    result = ddf[ddf.a < 2]
+    assert pruned_parts(result) == {1}
+    dd.utils.assert_eq(result, dfs[0].iloc[:1])
+
+
+def test_optimize_read_parquet_filters_coerce_values():
+    t = pd.date_range("2020-01-01", periods=9)
+    frames = [
+        pd.DataFrame({"t": t[i : i + 3], "a": range(i, i + 3)}) for i in (0, 3, 6)
+    ]
+    ddf = read_parquet_from_frames(frames)
+    full = pd.concat(frames)
+
+    # Strings compared with datetimes are converted first
+    result = ddf[ddf.t > "2020-01-07"]
+    assert pruned_parts(result) == {0, 1}
+    dd.utils.assert_eq(result, full[full.t > "2020-01-07"])
+
+    # Values that do not fit a column skip the optimization
+    result = ddf[ddf.t.isin(["2020-01-02", "x"])]
+    assert pruned_parts(result) == set()
+
+
+def test_optimize_keeps_resources():
+    df = pd.DataFrame({"x": range(10)})
+    with dask.annotate(resources={"io": 1}):
+        ddf = dd.from_pandas(df, npartitions=5).map_partitions(lambda d: d)
+    s = (ddf.x + 1).sum()
+
+    # Annotated tasks are not fused away and keep their resources
+    dsk = s.__dask_optimize__(s.dask, s.__dask_keys__())
+    resources = dsk.get_annotated_keys("resources")
+    io_keys = {k for k, v in resources.items() if v}
+    assert io_keys == set(ddf.__dask_graph__().keys())
+    assert dask.get(dsk, s.__dask_keys__()) == (sum(range(1, 11)),)
@@ -25,6 +25,9 @@ from dask.dataframe.shuffle import (
     rearrange_by_divisions,
     maybe_buffered_partd,
     remove_nans,
+    FileShuffle,
+    heavy_hitters,
+    replicate_heavy,
 )
 from dask.dataframe.utils import assert_eq, make_meta
 from dask.dataframe._compat import PANDAS_GT_120
@@ -45,7 +48,7 @@ if dd._compat.PANDAS_GT_110:
 shuffle_func = shuffle  # conflicts with keyword argument
 
 
-@pytest.mark.parametrize("shuffle", ["disk", "tasks"])
+@pytest.mark.parametrize("shuffle", ["disk", "tasks", "file"])
 def test_shuffle(shuffle):
     s = shuffle_func(d, d.b, shuffle=shuffle)
     assert isinstance(s, dd.DataFrame)
@@ -64,6 +67,58 @@ def test_default_partitions():
     assert shuffle(d, d.b).npartitions == d.npartitions
 
 
+@pytest.mark.parametrize("npartitions", [None, 17])
+@pytest.mark.parametrize("max_branch", [32, 4])
+@pytest.mark.parametrize("ignore_index", [False, True])
+def test_shuffle_packed(npartitions, max_branch, ignore_index):
+    df = pd.DataFrame({"x": np.random.randint(0, 50, size=200), "y": range(200)})
+    ddf = dd.from_pandas(df, npartitions=10)
+
+    with dask.config.set({"dataframe.shuffle-packed": True}):
+        s = shuffle(
+            ddf,
+            "x",
+            shuffle="tasks",
+            npartitions=npartitions,
+            max_branch=max_branch,
+            ignore_index=ignore_index,
+        )
+    expected = shuffle(
+        ddf,
+        "x",
+        shuffle="tasks",
+        npartitions=npartitions,
+        max_branch=max_branch,
+        ignore_index=ignore_index,
+    )
+    assert s._name != expected._name
+    assert len(s.dask) < len(expected.dask)
+    assert not any(isinstance(k, tuple) and k[0].startswith("split-") for k in s.dask)
+
+    result = s.compute(scheduler="sync")
+    assert sorted(result.y) == list(range(200))
+    for a, b in zip(s.to_delayed(), expected.to_delayed()):
+        a, b = dask.compute(a, b, scheduler="sync")
+        assert sorted(a.y) == sorted(b.y)
+    if not ignore_index:
+        assert_eq(result.sort_values("y"), df, check_index=True)
+
+
+def test_shuffle_splits():
+    from dask.dataframe.shuffle import shuffle_group, shuffle_group_packed
+    from dask.sizeof import sizeof
+
+    df = pd.DataFrame({"x": [3, 1, 0, 3, 1], "y": range(5)})
+    splits = shuffle_group_packed(df, "x", 0, 4, 4, False, 4)
+    groups = shuffle_group(df, "x", 0, 4, 4, False, 4)
+    assert len(splits) == 4
+    for i in range(4):
+        tm.assert_frame_equal(splits[i], groups[i])
+    splits2 = pickle.loads(pickle.dumps(splits))
+    tm.assert_frame_equal(splits2[3], groups[3])
+    assert sizeof(splits) == sizeof(splits.df) + sizeof(splits.offsets)
+
+
 def test_shuffle_npartitions_task():
     df = pd.DataFrame({"x": np.random.random(100)})
     ddf = dd.from_pandas(df, npartitions=10)
@@ -77,14 +132,14 @@ def test_shuffle_npartitions_task():
     assert set(map(tuple, sc.values.tolist())) == set(map(tuple, df.values.tolist()))
 
 
-@pytest.mark.parametrize("method", ["disk", "tasks"])
+@pytest.mark.parametrize("method", ["disk", "tasks", "file"])
 def test_index_with_non_series(method):
     from dask.dataframe.tests.test_multi import list_eq
 
     list_eq(shuffle(d, d.b, shuffle=method), shuffle(d, "b", shuffle=method))
 
 
-@pytest.mark.parametrize("method", ["disk", "tasks"])
+@pytest.mark.parametrize("method", ["disk", "tasks", "file"])
 def test_index_with_dataframe(method):
     res1 = shuffle(d, d[["b"]], shuffle=method).compute()
     res2 = shuffle(d, ["b"], shuffle=method).compute()
@@ -94,7 +149,7 @@ def test_index_with_dataframe(method):
     assert sorted(res1.values.tolist()) == sorted(res3.values.tolist())
 
 
-@pytest.mark.parametrize("method", ["disk", "tasks"])
+@pytest.mark.parametrize("method", ["disk", "tasks", "file"])
 def test_shuffle_from_one_partition_to_one_other(method):
     df = pd.DataFrame({"x": [1, 2, 3]})
     a = dd.from_pandas(df, 1)
@@ -104,7 +159,7 @@ def test_shuffle_from_one_partition_to_one_other(method):
         assert len(a.compute(scheduler="sync")) == len(b.compute(scheduler="sync"))
 
 
-@pytest.mark.parametrize("method", ["disk", "tasks"])
+@pytest.mark.parametrize("method", ["disk", "tasks", "file"])
 def test_shuffle_empty_partitions(method):
     df = pd.DataFrame({"x": [1, 2, 3] * 10})
     ddf = dd.from_pandas(df, npartitions=3)
@@ -162,6 +217,45 @@ def test_partitioning_index_categorical_on_values():
     assert (res == res2).all()
 
 
+def test_partitioning_index_heavy():
+    df = pd.DataFrame({"a": [0] * 90 + list(range(1, 11))})
+    ddf = dd.from_pandas(df, npartitions=4)
+
+    heavy = heavy_hitters(ddf, ddf.a, 10)
+    [(h, n)] = heavy.items()
+    assert n == 9
+    assert h == pd.util.hash_pandas_object(df.a, index=False)[0]
+
+    res = partitioning_index(df.a, 10, heavy=heavy)
+    assert res.dtype == np.int64
+    assert res[:90].value_counts().tolist() == [10] * 9
+    assert (res[90:] == partitioning_index(df.a, 10)[90:]).all()
+
+    res = replicate_heavy(df.iloc[85:95], df.a.iloc[85:95], 10, heavy)
+    assert len(res) == 5 * 9 + 5
+    parts = set(partitioning_index(df.a, 10, heavy=heavy)[:90])
+    assert set(res._partitions[:9]) == set(res._partitions[:45]) == parts
+
+
+def test_shuffle_heavy():
+    df = pd.DataFrame({"a": [0] * 900 + list(range(100)), "b": range(1000)})
+    ddf = dd.from_pandas(df, npartitions=10)
+
+    s = shuffle(ddf, "a", npartitions=10, heavy=True)
+    assert s.npartitions == 10
+    assert_eq(s.compute().sort_values("b"), df, check_index=False)
+    sizes = s.map_partitions(len).compute()
+    assert max(sizes) < 200
+
+    # Copies of heavy rows for the other side of a join
+    other = dd.from_pandas(pd.DataFrame({"a": [0, 1]}), npartitions=1)
+    # Key 0 holds 901 of 1000 rows
+    heavy = heavy_hitters(ddf, "a", 10)
+    assert list(heavy.values()) == [10]
+    o = shuffle(other, "a", npartitions=10, heavy=heavy, replicate=True).compute()
+    assert (o.a == 0).sum() == 10 and (o.a == 1).sum() == 1
+
+
 @pytest.mark.parametrize(
     "npartitions", [1, 4, 7, pytest.param(23, marks=pytest.mark.slow)]
 )
@@ -296,6 +390,22 @@ def test_rearrange_cleanup():
     assert len(os.listdir(tmpdir)) == 0
 
 
+def test_rearrange_file_cleanup():
+    df = pd.DataFrame({"x": np.random.random(10)})
+    ddf = dd.from_pandas(df, npartitions=4)
+    ddf2 = ddf.assign(_partitions=ddf.x % 4)
+
+    tmpdir = tempfile.mkdtemp()
+
+    with dask.config.set(temporary_directory=str(tmpdir)):
+        result = rearrange_by_column(ddf2, "_partitions", shuffle="file")
+        out = result.compute(scheduler="processes")
+
+    assert sorted(out.x) == sorted(df.x)
+
+    assert len(os.listdir(tmpdir)) == 0
+
+
 def mock_shuffle_group_3(df, col, npartitions, p):
     raise ValueError("Mock exception!")
 
@@ -342,6 +452,39 @@ def test_maybe_buffered_partd():
     assert isinstance(p2.partd, partd.File)
 
 
+def test_file_shuffle(tmpdir):
+    df = pd.DataFrame({"x": range(10), "y": list("abcdefghij")})
+    p = FileShuffle(str(tmpdir), buffer_size=10 ** 6)
+    p.append({0: df.iloc[:5], 1: df.iloc[5:]})
+    p.append({0: df.iloc[5:]})
+    assert not os.listdir(str(tmpdir))  # everything is still buffered
+
+    p2 = pickle.loads(pickle.dumps(p))
+    assert p2.buffer_size == 0
+    p2.append({2: df})
+    assert os.listdir(str(tmpdir)) == ["2"]
+
+    p.flush()
+    assert sorted(os.listdir(str(tmpdir))) == ["0", "1", "2"]
+    [a, b] = p.get(0)
+    tm.assert_frame_equal(a, df.iloc[:5])
+    tm.assert_frame_equal(b, df.iloc[5:])
+    assert p.get(3) == []
+
+    p.drop()
+    assert not os.path.exists(str(tmpdir))
+
+
+def test_file_shuffle_partial_writes(tmpdir):
+    df = pd.DataFrame({"x": range(100)})
+    write = os.write
+    p = FileShuffle(str(tmpdir))
+    with mock.patch("os.write", lambda fd, data: write(fd, data[:7])):
+        p.append({0: df})
+    [a] = p.get(0)
+    tm.assert_frame_equal(a, df)
+
+
 def test_set_index_with_explicit_divisions():
     df = pd.DataFrame({"x": [4, 1, 2, 5]}, index=[10, 20, 30, 40])
 
@@ -984,6 +1127,24 @@ def test_disk_shuffle_with_unknown_compression(compression):
             test_shuffle("disk")
 
 
+@pytest.mark.parametrize("compression", [None, "ZLib", "bz2"])
+def test_file_shuffle_with_compression_option(compression):
+    with dask.config.set({"dataframe.shuffle-file-compression": compression}):
+        test_shuffle("file")
+
+
+def test_file_shuffle_with_unknown_compression():
+    with dask.config.set({"dataframe.shuffle-file-compression": "UNKNOWN"}):
+        with pytest.raises(ValueError, match="Unknown shuffle compression"):
+            shuffle(d, d.b, shuffle="file")
+
+
+def test_file_shuffle_ignores_partd_compression():
+    # Partd codecs like blosc configure shuffle="disk" only
+    with dask.config.set({"dataframe.shuffle-compression": "BLOSC"}):
+        test_shuffle("file")
+
+
 def test_disk_shuffle_check_actual_compression():
     # test if the compression switch is really respected by testing the size of the actual partd-data on disk
     def generate_raw_partd_file(compression):
@@ -1,5 +1,7 @@
 import binascii
 import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 
 hashers = []  # In decreasing performance order
@@ -97,3 +99,33 @@ def hash_buffer_hex(buf, hasher=None):
     h = hash_buffer(buf, hasher)
     s = binascii.b2a_hex(h)
     return s.decode()
+
+
+_chunk_bytes = 2 ** 24
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            from .system import CPU_COUNT
+
+            _pool = ThreadPoolExecutor(CPU_COUNT)
+        return _pool
+
+
+def hash_buffer_chunked_hex(buf, hasher=None, chunksize=_chunk_bytes):
+    """
+    Same as hash_buffer_hex, but hashes buffers larger than *chunksize* bytes
+    as separate chunks in parallel threads, and then hashes the digests of
+    the chunks.  The result only depends on the contents of *buf* and
+    *chunksize*, not on the number of threads.  *buf* must be contiguous.
+    """
+    buf = memoryview(buf).cast("B")
+    if buf.nbytes <= chunksize:
+        return hash_buffer_hex(buf, hasher)
+    chunks = [buf[i : i + chunksize] for i in range(0, buf.nbytes, chunksize)]
+    digests = _get_pool().map(lambda chunk: hash_buffer(chunk, hasher), chunks)
+    return hash_buffer_hex(b"".join(digests), hasher)
@@ -572,6 +572,26 @@ class HighLevelGraph(Mapping):
 
         return cls(layers, deps)
 
+    @classmethod
+    def from_annotated(cls, name, dsk, annotations):
+        """Wrap a low level graph as a single layer with annotations
+
+        Low level optimizations like ``fuse`` return plain dicts without any
+        layers, so the annotations of the original layers are lost.  This
+        keeps annotations, like the ``resources`` of tasks, visible to the
+        scheduler.
+
+        Parameters
+        ----------
+        name : str
+            The name of the layer
+        dsk : Mapping
+            The low level graph
+        annotations : dict
+            Annotations of the layer, values may be callables of the key
+        """
+        return cls({name: BasicLayer(dsk, annotations=annotations)}, {name: set()})
+
     def __getitem__(self, key):
         # Attempt O(1) direct access first, under the assumption that layer names match
         # either the keys (Scalar, Item, Delayed) or the first element of the key tuples
@@ -670,6 +690,33 @@ class HighLevelGraph(Mapping):
                     self.key_dependencies[k] = layer.get_dependencies(k, all_keys)
         return self.key_dependencies
 
+    def get_annotated_keys(self, annotation: str) -> Dict[Hashable, Any]:
+        """Get the value of an annotation for all annotated keys
+
+        Callable annotations are evaluated for each key.  This materializes
+        all annotated layers.
+
+        Parameters
+        ----------
+        annotation: str
+            The name of the annotation, like ``"resources"``
+
+        Returns
+        -------
+        map: dict
+            A map from each key in a layer with this annotation to its value
+        """
+        out = {}
+        for layer in self.layers.values():
+            if not layer.annotations or annotation not in layer.annotations:
+                continue
+            value = layer.annotations[annotation]
+            if callable(value):
+                out.update((k, value(k)) for k in layer)
+            else:
+                out.update(dict.fromkeys(layer, value))
+        return out
+
     @property
     def dependents(self):
         return reverse_dict(self.dependencies)
@@ -0,0 +1,374 @@
+"""
+Symbolic high level graph layers for array operations
+
+These layers describe their tasks through a few parameters, like the chunks
+of the input and output arrays, and only generate the tasks when they are
+materialized.  Culling a layer to some of its output blocks creates a new
+symbolic layer for just those blocks, so graph construction and culling of
+arrays with many chunks do not build a task for every chunk up front.
+"""
+import operator
+from functools import reduce
+from itertools import product
+
+from .highlevelgraph import Layer
+
+
+class ArrayBlockLayer(Layer):
+    """Base class of symbolic layers that produce the blocks of an array
+
+    Output keys are ``(name, i, j, ...)`` for all blocks in ``numblocks``, or
+    only for ``output_blocks`` once culled.  Subclasses implement
+    ``_construct_block`` to build the tasks and dependencies of one output
+    block, including any intermediate tasks that only it needs, and
+    ``_block_dependencies`` to find just those dependencies for culling.
+
+    Parameters
+    ----------
+    name : str
+        Name of the output array
+    numblocks : tuple of int
+        Number of blocks of the output array along each dimension
+    output_blocks : set of tuples, optional
+        Indices of the output blocks to produce, all by default
+    annotations : dict, optional
+        Layer annotations
+    """
+
+    def __init__(self, name, numblocks, output_blocks=None, annotations=None):
+        super().__init__(annotations=annotations)
+        self.name = name
+        self.numblocks = tuple(numblocks)
+        self.output_blocks = output_blocks
+
+    def __repr__(self):
+        return "{}<name='{}', numblocks={}>".format(
+            type(self).__name__, self.name, self.numblocks
+        )
+
+    def _output_blocks(self):
+        if self.output_blocks is not None:
+            return self.output_blocks
+        return product(*map(range, self.numblocks))
+
+    def get_output_keys(self):
+        return {(self.name,) + idx for idx in self._output_blocks()}
+
+    def is_materialized(self):
+        return hasattr(self, "_cached_dict")
+
+    @property
+    def _dict(self):
+        """Materialize full dict representation"""
+        if not hasattr(self, "_cached_dict"):
+            dsk, dependencies = {}, {}
+            for idx in self._output_blocks():
+                self._construct_block(idx, dsk, dependencies)
+            self._cached_dict = dsk
+            self._cached_dependencies = dependencies
+        return self._cached_dict
+
+    def __getitem__(self, key):
+        return self._dict[key]
+
+    def __iter__(self):
+        return iter(self._dict)
+
+    def __len__(self):
+        return len(self._dict)
+
+    def get_dependencies(self, key, all_hlg_keys):
+        self._dict
+        return self._cached_dependencies[key]
+
+    def _construct_block(self, idx, dsk, dependencies):
+        """ Add the tasks for output block ``idx`` and their dependencies """
+        raise NotImplementedError
+
+    def _block_dependencies(self, idx):
+        """ Dependencies of the tasks of output block ``idx``, without tasks """
+        raise NotImplementedError
+
+    def cull(self, keys, all_hlg_keys):
+        """Cull the layer to the output blocks of ``keys``
+
+        The culled layer is again symbolic, only its dependencies are
+        generated, and only for the remaining blocks.
+        """
+        blocks = {
+            key[1:]
+            for key in keys
+            if type(key) is tuple and key and key[0] == self.name
+        }
+        if self.output_blocks is None:
+            unchanged = len(blocks) == reduce(operator.mul, self.numblocks, 1)
+        else:
+            unchanged = blocks == set(self.output_blocks)
+        if unchanged:
+            culled = self
+        else:
+            culled = self.__copy__()
+            culled.output_blocks = blocks
+            culled.__dict__.pop("_cached_dict", None)
+            culled.__dict__.pop("_cached_dependencies", None)
+        dependencies = {}
+        if culled.is_materialized():
+            dependencies.update(culled._cached_dependencies)
+        else:
+            for idx in blocks:
+                dependencies.update(culled._block_dependencies(idx))
+        return culled, dependencies
+
+
+class ArrayRechunkLayer(ArrayBlockLayer):
+    """Rechunk an array by splitting and concatenating its blocks
+
+    Each new block either refers to an old block directly, or concatenates
+    slices ``(split_name, *new_index, i)`` of all old blocks it intersects.
+
+    Parameters
+    ----------
+    name : str
+        Name of the rechunked array
+    split_name : str
+        Name of the intermediate slices of old blocks
+    input_name : str
+        Name of the array to rechunk
+    old_chunks : tuple of tuples
+        Chunks of the array to rechunk
+    new_chunks : tuple of tuples
+        Chunks of the rechunked array
+    """
+
+    def __init__(
+        self,
+        name,
+        split_name,
+        input_name,
+        old_chunks,
+        new_chunks,
+        output_blocks=None,
+        annotations=None,
+    ):
+        super().__init__(
+            name, tuple(map(len, new_chunks)), output_blocks, annotations=annotations
+        )
+        self.split_name = split_name
+        self.input_name = input_name
+        self.old_chunks = old_chunks
+        self.new_chunks = new_chunks
+
+    @property
+    def _old_to_new(self):
+        try:
+            return self._cached_old_to_new
+        except AttributeError:
+            from .array.rechunk import _old_to_new
+
+            self._cached_old_to_new = _old_to_new(self.old_chunks, self.new_chunks)
+            return self._cached_old_to_new
+
+    def _block_pieces(self, idx):
+        """The pieces of new block ``idx``
+
+        Yields the old key and its slices for each piece, and whether the
+        piece is the whole old block.
+        """
+        pieces = [o2n[i] for o2n, i in zip(self._old_to_new, idx)]
+        for ind_slices in product(*pieces):
+            old_index, slices = zip(*ind_slices)
+            whole = all(
+                slc.start == 0 and slc.stop == self.old_chunks[i][ind]
+                for i, (slc, ind) in enumerate(zip(slices, old_index))
+            )
+            yield (self.input_name,) + old_index, slices, whole
+
+    def _construct_block(self, idx, dsk, dependencies):
+        import numpy as np
+
+        from .array.core import concatenate3
+
+        key = (self.name,) + idx
+        shape = [len(o2n[i]) for o2n, i in zip(self._old_to_new, idx)]
+        args = np.empty(shape, dtype="O")
+        args_flat = args.flat
+        for j, (old_key, slices, whole) in enumerate(self._block_pieces(idx)):
+            if whole:
+                args_flat[j] = old_key
+            else:
+                split_key = (self.split_name,) + idx + (j,)
+                dsk[split_key] = (operator.getitem, old_key, slices)
+                dependencies[split_key] = {old_key}
+                args_flat[j] = split_key
+
+        if args.size == 1:
+            dsk[key] = args.flat[0]
+        else:
+            dsk[key] = (concatenate3, args.tolist())
+        dependencies[key] = set(args.flat)
+
+    def _block_dependencies(self, idx):
+        dependencies = {}
+        deps = set()
+        for j, (old_key, _, whole) in enumerate(self._block_pieces(idx)):
+            if whole:
+                deps.add(old_key)
+            else:
+                split_key = (self.split_name,) + idx + (j,)
+                dependencies[split_key] = {old_key}
+                deps.add(split_key)
+        dependencies[(self.name,) + idx] = deps
+        return dependencies
+
+
+class ArrayOverlapLayer(ArrayBlockLayer):
+    """Share boundaries between neighboring blocks of an array
+
+    Each output block concatenates the matching input block with slices
+    ``(getitem_name, *index)`` of its neighbors, where the index of a slice
+    is the fractional index of ``dask.array.overlap.expand_key``.
+
+    Parameters
+    ----------
+    name : str
+        Name of the output array
+    getitem_name : str
+        Name of the intermediate slices of neighboring blocks
+    input_name : str
+        Name of the input array
+    numblocks : tuple of int
+        Number of blocks of the input and output arrays
+    axes : dict
+        The size of the shared boundary per axis
+    """
+
+    def __init__(
+        self,
+        name,
+        getitem_name,
+        input_name,
+        numblocks,
+        axes,
+        output_blocks=None,
+        annotations=None,
+    ):
+        super().__init__(name, numblocks, output_blocks, annotations=annotations)
+        self.getitem_name = getitem_name
+        self.input_name = input_name
+        self.axes = axes
+
+    def _construct_block(self, idx, dsk, dependencies):
+        from .array.core import concatenate3
+        from .array.overlap import expand_key, fractional_slice
+        from .core import flatten
+        from .utils import concrete
+
+        keys = expand_key(
+            (None,) + idx, dims=self.numblocks, name=self.getitem_name, axes=self.axes
+        )
+        for k in flatten(keys):
+            task = fractional_slice((self.input_name,) + k[1:], self.axes)
+            dsk[k] = task
+            if task[0] is operator.getitem:
+                dependencies[k] = {task[1]}
+            else:  # the whole input block
+                dependencies[k] = {task}
+
+        key = (self.name,) + idx
+        dsk[key] = (concatenate3, (concrete, keys))
+        dependencies[key] = set(flatten(keys))
+
+    def _block_dependencies(self, idx):
+        from .array.overlap import expand_key
+        from .core import flatten
+
+        keys = expand_key(
+            (None,) + idx, dims=self.numblocks, name=self.getitem_name, axes=self.axes
+        )
+        keys = list(flatten(keys))
+        # Each slice is taken from the input block nearest to its index
+        dependencies = {
+            k: {(self.input_name,) + tuple(int(round(i)) for i in k[1:])} for k in keys
+        }
+        dependencies[(self.name,) + idx] = set(keys)
+        return dependencies
+
+
+class ArrayPartialReduceLayer(ArrayBlockLayer):
+    """One level of a tree reduction of an array
+
+    Each output block applies ``func`` to a nested list of up to
+    ``split_every[i]`` neighboring input blocks along each reduced axis ``i``.
+
+    Parameters
+    ----------
+    name : str
+        Name of the output array
+    func : callable
+        Function applied to the nested list of input blocks
+    input_name : str
+        Name of the input array
+    input_numblocks : tuple of int
+        Number of blocks of the input array
+    split_every : dict
+        Maximum number of blocks to combine along each reduced axis
+    keepdims : bool
+        Whether the reduced axes are kept in the output
+    """
+
+    def __init__(
+        self,
+        name,
+        func,
+        input_name,
+        input_numblocks,
+        split_every,
+        keepdims,
+        output_blocks=None,
+        annotations=None,
+    ):
+        self.input_numblocks = tuple(input_numblocks)
+        self.split_every = split_every
+        self.keepdims = keepdims
+        numblocks = [
+            -(-n // split_every[i]) if i in split_every else n
+            for i, n in enumerate(self.input_numblocks)
+        ]
+        if not keepdims:
+            numblocks = [n for i, n in enumerate(numblocks) if i not in split_every]
+        super().__init__(name, numblocks, output_blocks, annotations=annotations)
+        self.func = func
+        self.input_name = input_name
+
+    def _input_parts(self, idx):
+        """ Indices of the input blocks along each axis for output block ``idx`` """
+        if not self.keepdims:
+            # Reduced axes have a single block after the final aggregation
+            it = iter(idx)
+            idx_full = [
+                0 if i in self.split_every else next(it)
+                for i in range(len(self.input_numblocks))
+            ]
+        else:
+            idx_full = idx
+        parts = []
+        for i, (j, n) in enumerate(zip(idx_full, self.input_numblocks)):
+            s = self.split_every.get(i, 1)
+            parts.append(range(j * s, min((j + 1) * s, n)))
+        return parts
+
+    def _construct_block(self, idx, dsk, dependencies):
+        from .blockwise import lol_tuples
+
+        parts = self._input_parts(idx)
+        decided = {i: p[0] for i, p in enumerate(parts) if len(p) == 1}
+        dummy = {i: p for i, p in enumerate(parts) if i not in decided}
+        g = lol_tuples((self.input_name,), range(len(parts)), decided, dummy)
+
+        dsk[(self.name,) + idx] = (self.func, g)
+        dependencies.update(self._block_dependencies(idx))
+
+    def _block_dependencies(self, idx):
+        parts = self._input_parts(idx)
+        deps = {(self.input_name,) + i for i in product(*parts)}
+        return {(self.name,) + idx: deps}
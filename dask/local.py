@@ -109,8 +109,10 @@ from queue import Queue, Empty
 
 from . import config
 from .core import flatten, reverse_dict, get_dependencies, has_tasks, _execute_task
+from .optimization import cull
 from .order import order
 from .callbacks import unpack_callbacks, local_callbacks
+from .spill import SpillBuffer
 from .utils_test import add, inc  # noqa: F401
 
 
@@ -136,9 +138,22 @@ else:
 DEBUG = False
 
 
-def start_state_from_dask(dsk, cache=None, sortkey=None):
+def start_state_from_dask(dsk, cache=None, sortkey=None, dependencies=None):
     """Start state from a dask
 
+    Parameters
+    ----------
+    dsk : dict
+        A dask dictionary specifying a workflow
+    cache : dict-like, optional
+        Temporary storage of results, may already hold results of some keys
+    sortkey : callable, optional
+        Priority of each key, defaults to ``order(dsk).get``
+    dependencies : dict, optional
+        Mapping of each key to the set of keys it depends on.  Providing this
+        avoids walking all tasks again if it is already known, e.g. from
+        ``order``.  Only valid if ``cache`` holds no data yet.
+
     Examples
     --------
 
@@ -156,22 +171,26 @@ def start_state_from_dask(dsk, cache=None, sortkey=None):
      'waiting_data': {'x': {'z'}, 'y': {'w'}, 'z': {'w'}}}
     """
     if sortkey is None:
-        sortkey = order(dsk).get
+        sortkey = order(dsk, dependencies=dependencies).get
     if cache is None:
         cache = config.get("cache", None)
     if cache is None:
         cache = dict()
-    data_keys = set()
-    for k, v in dsk.items():
-        if not has_tasks(dsk, v):
-            cache[k] = v
-            data_keys.add(k)
 
-    dsk2 = dsk.copy()
-    dsk2.update(cache)
+    if dependencies is None:
+        if cache:
+            dsk2 = dsk.copy()
+            dsk2.update(cache)
+        else:
+            dsk2 = dsk
+        dependencies = {k: get_dependencies(dsk2, k) for k in dsk}
 
-    dependencies = {k: get_dependencies(dsk2, k) for k in dsk}
-    waiting = {k: v.copy() for k, v in dependencies.items() if k not in data_keys}
+    waiting = dict()
+    for k, v in dsk.items():
+        if has_tasks(dsk, v):
+            waiting[k] = dependencies[k].copy()
+        else:
+            cache[k] = v
 
     dependents = reverse_dict(dependencies)
     for a in cache:
@@ -179,8 +198,7 @@ def start_state_from_dask(dsk, cache=None, sortkey=None):
             waiting[b].remove(a)
     waiting_data = dict((k, v.copy()) for k, v in dependents.items() if v)
 
-    ready_set = set([k for k, v in waiting.items() if not v])
-    ready = sorted(ready_set, key=sortkey, reverse=True)
+    ready = sorted([k for k, v in waiting.items() if not v], key=sortkey, reverse=True)
     waiting = dict((k, v) for k, v in waiting.items() if v)
 
     state = {
@@ -229,6 +247,13 @@ def execute_task(key, task_info, dumps, loads, get_id, pack_exception):
     return key, result, failed
 
 
+def batch_execute_tasks(it):
+    """
+    Batch computing of multiple tasks with `execute_task`
+    """
+    return [execute_task(*a) for a in it]
+
+
 def release_data(key, state, delete=True):
     """Remove data from temporary storage
 
@@ -254,12 +279,16 @@ def finish_task(
 
     Mutates.  This should run atomically (with a lock).
     """
-    for dep in sorted(state["dependents"][key], key=sortkey, reverse=True):
+    ready = []
+    for dep in state["dependents"][key]:
         s = state["waiting"][dep]
         s.remove(key)
         if not s:
             del state["waiting"][dep]
-            state["ready"].append(dep)
+            ready.append(dep)
+    if len(ready) > 1:
+        ready.sort(key=sortkey, reverse=True)
+    state["ready"].extend(ready)
 
     for dep in state["dependencies"][key]:
         if dep in state["waiting_data"]:
@@ -345,6 +374,26 @@ The main function of the scheduler.  Get is the main entry point.
 """
 
 
+def prepare_graph(dsk, result_flat, cache, started_cbs, dependencies=None):
+    """Prepare a graph for execution after the start callbacks ran
+
+    Walks the tasks for their dependencies at most once, reusing the given
+    ``dependencies`` when possible.  Returns the graph and the dependencies
+    of its tasks, or ``None`` for them if the ``cache`` already holds data
+    that may stand in for some tasks.
+    """
+    if cache:
+        return dsk, None
+    if any(cb[0] for cb in started_cbs):
+        # Start callbacks may have replaced tasks with data, e.g. from a
+        # cache.  Drop the tasks that are no longer needed.
+        dsk, dependencies = cull(dsk, list(result_flat))
+        return dsk, {k: set(v) for k, v in dependencies.items()}
+    if dependencies is None:
+        dependencies = {k: get_dependencies(dsk, k) for k in dsk}
+    return dsk, dependencies
+
+
 def get_async(
     apply_async,
     num_workers,
@@ -358,6 +407,13 @@ def get_async(
     callbacks=None,
     dumps=identity,
     loads=identity,
+    memory_limit=None,
+    chunksize=None,
+    dependencies=None,
+    resources=None,
+    io_apply_async=None,
+    num_io_workers=None,
+    io_readahead=None,
     **kwargs
 ):
     """Asynchronous get function
@@ -400,6 +456,36 @@ def get_async(
         Callbacks are passed in as tuples of length 5. Multiple sets of
         callbacks may be passed in as a list of tuples. For more information,
         see the dask.diagnostics documentation.
+    memory_limit : int or str, optional
+        Maximum number of bytes of intermediate results to hold in memory,
+        e.g. ``"40GB"``.  Least recently used results beyond this limit are
+        spilled to the ``temporary-directory`` and read back when needed.
+        Defaults to the ``local.memory-limit`` configuration value.  Ignored
+        if a ``cache`` is given.
+    chunksize : int, optional
+        Number of ready tasks to send to a worker at once.  Batching many
+        small tasks together reduces per-task scheduling and communication
+        overhead.  Use -1 to adaptively split all ready tasks evenly among
+        the workers.  Defaults to the ``local.chunksize`` configuration
+        value.
+    dependencies : dict, optional
+        Mapping of each key in ``dsk`` to the set of keys it depends on, as
+        already computed by graph optimizations like ``cull`` and ``fuse``.
+        Saves walking all tasks again to find their dependencies.
+    resources : dict, optional
+        Mapping of keys to the abstract resources their tasks need, as set
+        with ``dask.annotate(resources=...)``.  Tasks that need an ``"io"``
+        resource run through ``io_apply_async`` if given.
+    io_apply_async : function, optional
+        Asynchronous apply function for IO tasks, so that reading data
+        overlaps with computing on the data already read.
+    num_io_workers : int, optional
+        The number of IO tasks we should have running at any one time.
+        Defaults to the ``local.io-workers`` configuration value.
+    io_readahead : int, optional
+        Number of finished IO results that may wait in memory for the tasks
+        that consume them before no more IO tasks are started.  Defaults to
+        the ``local.io-readahead`` configuration value.
 
     See Also
     --------
@@ -407,12 +493,37 @@ def get_async(
     """
     queue = Queue()
 
+    if chunksize is None:
+        chunksize = config.get("local.chunksize", 1)
+    if chunksize == 0 or chunksize < -1:
+        raise ValueError(
+            "chunksize must be a positive integer or -1, got %r" % chunksize
+        )
+
+    if num_io_workers is None:
+        num_io_workers = config.get("local.io-workers", 4)
+    if io_apply_async is not None and num_io_workers < 1:
+        raise ValueError(
+            "num_io_workers must be a positive integer, got %r" % num_io_workers
+        )
+    if io_readahead is None:
+        io_readahead = config.get("local.io-readahead", 2)
+
     if isinstance(result, list):
         result_flat = set(flatten(result))
     else:
         result_flat = set([result])
     results = set(result_flat)
 
+    if cache is None:
+        cache = config.get("cache", None)
+    spill = None
+    if cache is None:
+        if memory_limit is None:
+            memory_limit = config.get("local.memory-limit", None)
+        if memory_limit is not None:
+            cache = spill = SpillBuffer(memory_limit)
+
     dsk = dict(dsk)
     with local_callbacks(callbacks) as callbacks:
         _, _, pretask_cbs, posttask_cbs, _ = unpack_callbacks(callbacks)
@@ -427,9 +538,15 @@ def get_async(
                     cb[0](dsk)
                 started_cbs.append(cb)
 
-            keyorder = order(dsk)
+            dsk, dependencies = prepare_graph(
+                dsk, result_flat, cache, started_cbs, dependencies
+            )
+
+            keyorder = order(dsk, dependencies=dependencies)
 
-            state = start_state_from_dask(dsk, cache=cache, sortkey=keyorder.get)
+            state = start_state_from_dask(
+                dsk, cache=cache, sortkey=keyorder.get, dependencies=dependencies
+            )
 
             for _, start_state, _, _, _ in callbacks:
                 if start_state:
@@ -441,67 +558,138 @@ def get_async(
             if state["waiting"] and not state["ready"]:
                 raise ValueError("Found no accessible jobs in dask")
 
-            def fire_task():
-                """ Fire off a task to the thread pool """
-                # Choose a good task to compute
-                key = state["ready"].pop()
+            nbatches = 0
+
+            # IO tasks wait on their own stack and run on their own workers
+            io_keys = set()
+            if resources and io_apply_async is not None:
+                io_keys = {
+                    k for k, v in resources.items() if v and "io" in v and k in dsk
+                }
+            ready_io = []
+            io_running = 0
+            io_held = set()  # finished IO results still waiting for consumers
+
+            def split_io(start):
+                """ Move newly ready IO tasks over to their own stack """
+                ready = state["ready"]
+                new = ready[start:]
+                if io_keys and new:
+                    del ready[start:]
+                    for key in new:
+                        (ready_io if key in io_keys else ready).append(key)
+
+            def prepare_task(key):
                 state["running"].add(key)
                 for f in pretask_cbs:
                     f(key, dsk, state)
 
-                # Prep data to send
                 data = dict(
-                    (dep, state["cache"][dep]) for dep in get_dependencies(dsk, key)
+                    (dep, state["cache"][dep]) for dep in state["dependencies"][key]
                 )
-                # Submit
-                apply_async(
-                    execute_task,
-                    args=(
-                        key,
-                        dumps((dsk[key], data)),
-                        dumps,
-                        loads,
-                        get_id,
-                        pack_exception,
-                    ),
-                    callback=queue.put,
+                return (
+                    key,
+                    dumps((dsk[key], data)),
+                    dumps,
+                    loads,
+                    get_id,
+                    pack_exception,
                 )
 
+            def fire_io_tasks():
+                """ Fire off ready IO tasks, reading ahead a bounded amount """
+                nonlocal io_held, io_running
+                if not ready_io:
+                    return
+                io_held = {
+                    k
+                    for k in io_held
+                    if k not in state["released"] and k not in results
+                }
+                limit = num_io_workers + io_readahead
+                # Never stall when nothing else could release held data, like
+                # a consumer of more reads than the limit
+                idle = not nbatches and not state["ready"]
+                while ready_io and io_running < num_io_workers:
+                    if io_running + len(io_held) >= limit and not idle:
+                        break
+                    key = ready_io.pop()
+                    io_apply_async(
+                        batch_execute_tasks,
+                        args=([prepare_task(key)],),
+                        callback=queue.put,
+                    )
+                    io_running += 1
+
+            def fire_tasks(chunksize):
+                """ Fire off batches of ready tasks to the pool """
+                nonlocal nbatches
+                nready = len(state["ready"])
+                avail_workers = num_workers - nbatches
+                if not nready or avail_workers <= 0:
+                    return
+                if chunksize == -1:
+                    # Adaptive: spread the ready tasks evenly over all workers
+                    chunksize = -(nready // -num_workers)
+                ntasks = min(nready, chunksize * avail_workers)
+
+                # Choose good tasks to compute and prep data to send
+                args = [prepare_task(state["ready"].pop()) for _ in range(ntasks)]
+
+                # Submit
+                for i in range(0, ntasks, chunksize):
+                    apply_async(
+                        batch_execute_tasks,
+                        args=(args[i : i + chunksize],),
+                        callback=queue.put,
+                    )
+                    nbatches += 1
+
             # Seed initial tasks into the thread pool
-            while state["ready"] and len(state["running"]) < num_workers:
-                fire_task()
+            split_io(0)
+            fire_tasks(chunksize)
+            fire_io_tasks()
 
             # Main loop, wait on tasks to finish, insert new ones
-            while state["waiting"] or state["ready"] or state["running"]:
-                key, res_info, failed = queue_get(queue)
-                if failed:
-                    exc, tb = loads(res_info)
-                    if rerun_exceptions_locally:
-                        data = dict(
-                            (dep, state["cache"][dep])
-                            for dep in get_dependencies(dsk, key)
-                        )
-                        task = dsk[key]
-                        _execute_task(task, data)  # Re-execute locally
-                    else:
-                        raise_exception(exc, tb)
-                res, worker_id = loads(res_info)
-                state["cache"][key] = res
-                finish_task(dsk, key, state, results, keyorder.get)
-                for f in posttask_cbs:
-                    f(key, res, dsk, state, worker_id)
-
-                while state["ready"] and len(state["running"]) < num_workers:
-                    fire_task()
+            while state["waiting"] or state["ready"] or state["running"] or ready_io:
+                batch = queue_get(queue)
+                if batch[0][0] in io_keys:
+                    io_running -= 1
+                    io_held.add(batch[0][0])
+                else:
+                    nbatches -= 1
+                nready = len(state["ready"])
+                for key, res_info, failed in batch:
+                    if failed:
+                        exc, tb = loads(res_info)
+                        if rerun_exceptions_locally:
+                            data = dict(
+                                (dep, state["cache"][dep])
+                                for dep in state["dependencies"][key]
+                            )
+                            task = dsk[key]
+                            _execute_task(task, data)  # Re-execute locally
+                        else:
+                            raise_exception(exc, tb)
+                    res, worker_id = loads(res_info)
+                    state["cache"][key] = res
+                    finish_task(dsk, key, state, results, keyorder.get)
+                    for f in posttask_cbs:
+                        f(key, res, dsk, state, worker_id)
+
+                split_io(nready)
+                fire_tasks(chunksize)
+                fire_io_tasks()
 
             succeeded = True
+            return nested_get(result, state["cache"])
 
         finally:
             for _, _, _, _, finish in started_cbs:
                 if finish:
                     finish(dsk, state, not succeeded)
-
-    return nested_get(result, state["cache"])
+            if spill is not None:
+                spill.close()
 
 
 """ Synchronous concrete version of get_async
@@ -1,16 +1,36 @@
+import atexit
 import copyreg
+import mmap
 import multiprocessing
 import os
 import pickle
+import shutil
 import sys
+import tempfile
 import traceback
+import uuid
+from collections import defaultdict
 from functools import partial
+from queue import Queue
+from threading import Lock
 from warnings import warn
 
 from . import config
+from .callbacks import local_callbacks, unpack_callbacks
+from .core import _execute_task, flatten
 from .system import CPU_COUNT
-from .local import reraise, get_async  # TODO: get better get
+from .local import (
+    finish_task,
+    nested_get,
+    queue_get,
+    release_data,
+    reraise,
+    get_async,  # TODO: get better get
+    prepare_graph,
+    start_state_from_dask,
+)
 from .optimization import fuse, cull
+from .order import order
 from .utils import ensure_dict
 
 
@@ -40,6 +60,83 @@ except ImportError:
     _loads = pickle.loads
 
 
+"""
+Out-of-band buffers
+-------------------
+
+Large NumPy and pandas objects expose their memory to pickle protocol 5 as
+out-of-band buffers.  ``dumps_shared`` writes these buffers once into a file
+in shared memory (``/dev/shm`` where available) and only sends the small
+pickle header through the pool's pipes.  ``loads_shared`` memory-maps that file
+copy-on-write, so the receiving process uses the buffers without copying them.
+"""
+
+
+def shared_memory_directory():
+    """ Directory for buffers shared between processes """
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+        return "/dev/shm"
+    return config.get("temporary-directory", None) or tempfile.gettempdir()
+
+
+def dumps_shared(obj, directory, dumps=_dumps, threshold=2 ** 16):
+    """Serialize, placing large buffers in a file in ``directory``
+
+    Buffers of at least ``threshold`` bytes are written to the file instead of
+    the returned pickle.
+
+    See Also
+    --------
+    loads_shared
+    """
+    buffers = []
+
+    def buffer_callback(buf):
+        try:
+            raw = buf.raw()
+        except BufferError:  # non-contiguous buffer
+            return True
+        if raw.nbytes < max(threshold, 1):
+            return True
+        buffers.append(raw)
+        return False
+
+    header = dumps(obj, protocol=5, buffer_callback=buffer_callback)
+    if not buffers:
+        return header, None, ()
+    fn = os.path.join(directory, uuid.uuid4().hex)
+    with open(fn, "wb") as f:
+        for raw in buffers:
+            f.write(raw)
+    return header, fn, tuple(raw.nbytes for raw in buffers)
+
+
+def loads_shared(frames, loads=_loads):
+    """Deserialize the output of ``dumps_shared`` without copying buffers
+
+    See Also
+    --------
+    dumps_shared
+    """
+    header, fn, sizes = frames
+    if fn is None:
+        return loads(header)
+    with open(fn, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+    try:
+        # The mapping stays valid, the file is removed once it is unmapped
+        os.remove(fn)
+    except OSError:  # pragma: no cover
+        pass  # Windows, removed with the directory at the end of ``get``
+    buffers = []
+    view = memoryview(mm)
+    start = 0
+    for size in sizes:
+        buffers.append(view[start : start + size])
+        start += size
+    return loads(header, buffers=buffers)
+
+
 def _process_get_id():
     return multiprocessing.current_process().ident
 
@@ -152,6 +249,18 @@ def get_context():
         return multiprocessing.get_context(context_name)
 
 
+def _set_hash_seed():
+    # In order to get consistent hashing in subprocesses, we need to set a
+    # consistent seed for the Python hash algorithm. Unfortunatley, there
+    # is no way to specify environment variables only for the Pool
+    # processes, so we have to rely on environment variables being
+    # inherited.
+    if os.environ.get("PYTHONHASHSEED") in (None, "0"):
+        # This number is arbitrary; it was chosen to commemorate
+        # https://github.com/dask/dask/issues/6640.
+        os.environ["PYTHONHASHSEED"] = "6640"
+
+
 def get(
     dsk,
     keys,
@@ -160,6 +269,7 @@ def get(
     func_dumps=None,
     optimize_graph=True,
     pool=None,
+    shared_memory=None,
     **kwargs
 ):
     """Multiprocessed get function appropriate for Bags
@@ -180,19 +290,29 @@ def get(
         (defaults to cloudpickle.loads if available, otherwise pickle.loads)
     optimize_graph : bool
         If True [default], `fuse` is applied to the graph before computation.
+    pool : multiprocessing.Pool or WorkerPool, optional
+        Pool of processes to use.  Passing a ``WorkerPool`` keeps
+        intermediate results in the worker processes that produced them, but
+        does not support the ``memory_limit`` and ``chunksize`` options.
+        If not given and the ``multiprocessing.locality`` configuration value
+        is true, a long-lived ``WorkerPool`` is shared between calls.
+    shared_memory : bool, optional
+        If True, large buffers of NumPy and pandas objects are passed between
+        processes in shared memory rather than through pipes, using pickle
+        protocol 5.  Requires Python 3.8 or newer.  Defaults to the
+        ``multiprocessing.shared-memory`` configuration value.
     """
+    if shared_memory is None:
+        shared_memory = config.get("multiprocessing.shared-memory", False)
+    if shared_memory and pickle.HIGHEST_PROTOCOL < 5:
+        raise ValueError("shared_memory=True requires pickle protocol 5")
+
     pool = pool or config.get("pool", None)
     num_workers = num_workers or config.get("num_workers", None) or CPU_COUNT
+    if pool is None and config.get("multiprocessing.locality", False):
+        pool = default_worker_pool(num_workers)
     if pool is None:
-        # In order to get consistent hashing in subprocesses, we need to set a
-        # consistent seed for the Python hash algorithm. Unfortunatley, there
-        # is no way to specify environment variables only for the Pool
-        # processes, so we have to rely on environment variables being
-        # inherited.
-        if os.environ.get("PYTHONHASHSEED") in (None, "0"):
-            # This number is arbitrary; it was chosen to commemorate
-            # https://github.com/dask/dask/issues/6640.
-            os.environ["PYTHONHASHSEED"] = "6640"
+        _set_hash_seed()
         context = get_context()
         pool = context.Pool(num_workers, initializer=initialize_worker_process)
         cleanup = True
@@ -206,35 +326,416 @@ def get(
         dsk3, dependencies = fuse(dsk2, keys, dependencies)
     else:
         dsk3 = dsk2
+        dependencies = {k: set(v) for k, v in dependencies.items()}
 
     # We specify marshalling functions in order to catch serialization
     # errors and report them to the user.
     loads = func_loads or config.get("func_loads", None) or _loads
     dumps = func_dumps or config.get("func_dumps", None) or _dumps
 
+    if shared_memory:
+        directory = tempfile.mkdtemp(prefix="dask-", dir=shared_memory_directory())
+        dumps = partial(dumps_shared, directory=directory, dumps=dumps)
+        loads = partial(loads_shared, loads=loads)
+
     # Note former versions used a multiprocessing Manager to share
     # a Queue between parent and workers, but this is fragile on Windows
     # (issue #1652).
     try:
         # Run
-        result = get_async(
-            pool.apply_async,
-            len(pool._pool),
-            dsk3,
-            keys,
-            get_id=_process_get_id,
-            dumps=dumps,
-            loads=loads,
-            pack_exception=pack_exception,
-            raise_exception=reraise,
-            **kwargs
-        )
+        if isinstance(pool, WorkerPool):
+            result = get_async_locality(
+                pool,
+                dsk3,
+                keys,
+                get_id=_process_get_id,
+                dumps=dumps,
+                loads=loads,
+                pack_exception=pack_exception,
+                raise_exception=reraise,
+                dependencies=dependencies,
+                **kwargs
+            )
+        else:
+            result = get_async(
+                pool.apply_async,
+                len(pool._pool),
+                dsk3,
+                keys,
+                get_id=_process_get_id,
+                dumps=dumps,
+                loads=loads,
+                pack_exception=pack_exception,
+                raise_exception=reraise,
+                dependencies=dependencies,
+                **kwargs
+            )
     finally:
         if cleanup:
             pool.close()
+        if shared_memory:
+            shutil.rmtree(directory, ignore_errors=True)
     return result
 
 
+"""
+Data locality
+-------------
+
+A ``WorkerPool`` runs one single-process pool per worker so that tasks can be
+sent to a chosen worker.  Results stay in the worker process that produced
+them, in ``_worker_data``, and dependents are preferably scheduled on that same
+worker.  Data only moves through the parent when a dependent runs elsewhere or
+when it is one of the requested results.
+"""
+
+# Results held by this worker process :: {run_id: {key: value}}
+_worker_data = defaultdict(dict)
+
+
+def execute_task_local(
+    run_id, key, task_info, local_deps, keep, send, dumps, loads, get_id, pack_exception
+):
+    """Compute task in a worker process using and keeping local data
+
+    Dependencies listed in ``local_deps`` are taken from the data held by this
+    worker.  If ``keep`` the result is held by this worker for later tasks.
+    Only if ``send`` is the result returned to the parent.
+
+    See Also
+    --------
+    dask.local.execute_task
+    """
+    try:
+        task, data = loads(task_info)
+        local = _worker_data[run_id]
+        for dep in local_deps:
+            data[dep] = local[dep]
+        result = _execute_task(task, data)
+        if keep:
+            local[key] = result
+        id = get_id()
+        result = dumps((result if send else None, id))
+        failed = False
+    except BaseException as e:
+        result = pack_exception(e, dumps)
+        failed = True
+    return key, result, failed
+
+
+def gather_local(run_id, keys, dumps):
+    """ Collect data held by this worker process """
+    local = _worker_data[run_id]
+    return dumps({k: local[k] for k in keys})
+
+
+def release_local(run_id, keys=None):
+    """ Release data held by this worker process, all of a run by default """
+    if keys is None:
+        _worker_data.pop(run_id, None)
+    else:
+        local = _worker_data[run_id]
+        for key in keys:
+            local.pop(key, None)
+
+
+class WorkerPool:
+    """A long-lived pool of worker processes that keep results locally
+
+    Use with ``dask.multiprocessing.get`` to schedule dependent tasks on the
+    process that holds their inputs, rather than sending every intermediate
+    result through the parent process.
+
+    Parameters
+    ----------
+    num_workers : int, optional
+        Number of worker processes (defaults to number of cores)
+
+    Examples
+    --------
+    >>> pool = WorkerPool(4)  # doctest: +SKIP
+    >>> with dask.config.set(pool=pool):  # doctest: +SKIP
+    ...     x.compute(scheduler='processes')
+    >>> pool.close()  # doctest: +SKIP
+    """
+
+    def __init__(self, num_workers=None):
+        num_workers = num_workers or CPU_COUNT
+        _set_hash_seed()
+        context = get_context()
+        self.pools = [
+            context.Pool(1, initializer=initialize_worker_process)
+            for _ in range(num_workers)
+        ]
+
+    def __len__(self):
+        return len(self.pools)
+
+    def close(self):
+        for pool in self.pools:
+            pool.close()
+
+    def terminate(self):
+        for pool in self.pools:
+            pool.terminate()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.terminate()
+
+
+default_worker_pools = dict()
+default_worker_pools_lock = Lock()
+
+
+def default_worker_pool(num_workers):
+    """ Long-lived ``WorkerPool`` shared between computations """
+    key = (config.get("multiprocessing.context", "spawn"), num_workers)
+    with default_worker_pools_lock:
+        if key not in default_worker_pools:
+            pool = WorkerPool(num_workers)
+            atexit.register(pool.close)
+            default_worker_pools[key] = pool
+        return default_worker_pools[key]
+
+
+def get_async_locality(
+    pool,
+    dsk,
+    result,
+    cache=None,
+    get_id=_process_get_id,
+    rerun_exceptions_locally=None,
+    pack_exception=pack_exception,
+    raise_exception=reraise,
+    callbacks=None,
+    dumps=_dumps,
+    loads=_loads,
+    memory_limit=None,
+    chunksize=None,
+    dependencies=None,
+    **kwargs
+):
+    """Asynchronous get function that keeps data in worker processes
+
+    A variant of ``dask.local.get_async`` for a ``WorkerPool``.  Each ready
+    task is sent to the idle worker that holds most of its dependencies.
+    Results with dependents stay in the worker that produced them; only the
+    requested results, and any data needed by a task on another worker, are
+    sent to the parent.  If posttask callbacks are active all results are
+    also sent to the parent so that callbacks receive them.
+
+    Spilling with ``memory_limit`` and batching with ``chunksize`` are not
+    supported, as results are held by the workers and tasks are sent to
+    workers one at a time.  Setting either raises a ``ValueError``.
+
+    See Also
+    --------
+    dask.local.get_async
+    """
+    if memory_limit is None:
+        memory_limit = config.get("local.memory-limit", None)
+    if memory_limit is not None:
+        raise ValueError("memory_limit is not supported with a WorkerPool")
+    if chunksize is None:
+        chunksize = config.get("local.chunksize", 1)
+    if chunksize != 1:
+        raise ValueError("chunksize is not supported with a WorkerPool")
+
+    queue = Queue()
+    run_id = uuid.uuid4().hex
+    workers = pool.pools
+
+    if isinstance(result, list):
+        result_flat = set(flatten(result))
+    else:
+        result_flat = set([result])
+    results = set(result_flat)
+
+    dsk = dict(dsk)
+    with local_callbacks(callbacks) as callbacks:
+        _, _, pretask_cbs, posttask_cbs, _ = unpack_callbacks(callbacks)
+        started_cbs = []
+        succeeded = False
+        state = {}
+        try:
+            for cb in callbacks:
+                if cb[0]:
+                    cb[0](dsk)
+                started_cbs.append(cb)
+
+            dsk, dependencies = prepare_graph(
+                dsk, result_flat, cache, started_cbs, dependencies
+            )
+
+            keyorder = order(dsk, dependencies=dependencies)
+
+            state = start_state_from_dask(
+                dsk, cache=cache, sortkey=keyorder.get, dependencies=dependencies
+            )
+
+            for _, start_state, _, _, _ in callbacks:
+                if start_state:
+                    start_state(dsk, state)
+
+            if rerun_exceptions_locally is None:
+                rerun_exceptions_locally = config.get("rerun_exceptions_locally", False)
+
+            if state["waiting"] and not state["ready"]:
+                raise ValueError("Found no accessible jobs in dask")
+
+            idle = set(range(len(workers)))
+            who_has = dict()  # {key: worker} for data held by workers
+            fetching = dict()  # {key: tasks waiting on it} for data in transit
+            missing = dict()  # {task: keys still in transit}
+            assigned = dict()  # {task: worker}
+
+            def put(kind, w, msg):
+                queue.put((kind, w, msg))
+
+            def release(key, state, delete=True):
+                release_data(key, state, delete=False)
+                if delete:
+                    state["cache"].pop(key, None)
+                    w = who_has.pop(key, None)
+                    if w is not None:
+                        workers[w].apply_async(release_local, args=(run_id, [key]))
+
+            def submit(key):
+                w = assigned[key]
+                deps = state["dependencies"][key]
+                local_deps = [dep for dep in deps if who_has.get(dep) == w]
+                data = dict(
+                    (dep, state["cache"][dep]) for dep in deps if who_has.get(dep) != w
+                )
+                keep = bool(state["dependents"][key])
+                send = key in results or bool(posttask_cbs) or not keep
+                workers[w].apply_async(
+                    execute_task_local,
+                    args=(
+                        run_id,
+                        key,
+                        dumps((dsk[key], data)),
+                        local_deps,
+                        keep,
+                        send,
+                        dumps,
+                        loads,
+                        get_id,
+                        pack_exception,
+                    ),
+                    callback=partial(put, "task", w),
+                )
+
+            def fire_task():
+                """ Send the next ready task to the best idle worker """
+                key = state["ready"].pop()
+                state["running"].add(key)
+                for f in pretask_cbs:
+                    f(key, dsk, state)
+
+                deps = state["dependencies"][key]
+                held = defaultdict(int)
+                for dep in deps:
+                    if dep in who_has:
+                        held[who_has[dep]] += 1
+                w = max(sorted(idle), key=lambda w: held[w])
+                idle.remove(w)
+                assigned[key] = w
+
+                # Fetch data held by other workers through the parent
+                remote = defaultdict(list)
+                for dep in deps:
+                    if (
+                        dep in who_has
+                        and who_has[dep] != w
+                        and dep not in state["cache"]
+                    ):
+                        if dep not in fetching:
+                            remote[who_has[dep]].append(dep)
+                            fetching[dep] = []
+                        fetching[dep].append(key)
+                        missing.setdefault(key, set()).add(dep)
+                for holder, keys in remote.items():
+                    workers[holder].apply_async(
+                        gather_local,
+                        args=(run_id, keys, dumps),
+                        callback=partial(put, "data", holder),
+                        error_callback=partial(put, "error", holder),
+                    )
+                if key not in missing:
+                    submit(key)
+
+            def gather(keys):
+                """ Synchronously collect data held by workers """
+                for dep in keys:
+                    if dep not in state["cache"]:
+                        holder = workers[who_has[dep]]
+                        data = loads(
+                            holder.apply(gather_local, args=(run_id, [dep], dumps))
+                        )
+                        state["cache"].update(data)
+
+            # Seed initial tasks into the worker pool
+            while state["ready"] and idle:
+                fire_task()
+
+            # Main loop, wait on tasks to finish, insert new ones
+            while state["waiting"] or state["ready"] or state["running"]:
+                kind, w, msg = queue_get(queue)
+                if kind == "error":
+                    raise msg
+                if kind == "data":
+                    for dep, value in loads(msg).items():
+                        state["cache"][dep] = value
+                        for key in fetching.pop(dep):
+                            missing[key].remove(dep)
+                            if not missing[key]:
+                                del missing[key]
+                                submit(key)
+                    continue
+
+                key, res_info, failed = msg
+                idle.add(w)
+                del assigned[key]
+                if failed:
+                    exc, tb = loads(res_info)
+                    if rerun_exceptions_locally:
+                        deps = state["dependencies"][key]
+                        gather(deps)
+                        data = dict((dep, state["cache"][dep]) for dep in deps)
+                        task = dsk[key]
+                        _execute_task(task, data)  # Re-execute locally
+                    else:
+                        raise_exception(exc, tb)
+                res, worker_id = loads(res_info)
+                if state["dependents"][key]:
+                    who_has[key] = w
+                if key in results or posttask_cbs or not state["dependents"][key]:
+                    state["cache"][key] = res
+                finish_task(
+                    dsk, key, state, results, keyorder.get, release_data=release
+                )
+                for f in posttask_cbs:
+                    f(key, res, dsk, state, worker_id)
+
+                while state["ready"] and idle:
+                    fire_task()
+
+            succeeded = True
+
+        finally:
+            for _, _, _, _, finish in started_cbs:
+                if finish:
+                    finish(dsk, state, not succeeded)
+            for worker in workers:
+                worker.apply_async(release_local, args=(run_id,))
+
+    return nested_get(result, state["cache"])
+
+
 def initialize_worker_process():
     """
     Initialize a worker process before running any tasks in it.
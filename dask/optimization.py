@@ -61,6 +61,67 @@ def cull(dsk, keys):
     return out, dependencies
 
 
+def cse(dsk, keys, dependencies=None):
+    """Common subexpression elimination
+
+    Merge tasks that compute the same thing under different keys, like
+    those of identical pipelines that were built separately.  Tasks are
+    compared by their token after replacing their dependencies with the
+    keys they were merged into, so whole identical subgraphs collapse into
+    one.  Tasks that can't be tokenized deterministically are never merged.
+
+    Only use this on pure tasks: two identical calls of a random number
+    generator are merged as well.
+
+    ``keys`` remain in the returned graph, as aliases if they were merged.
+
+    Examples
+    --------
+    >>> d = {'x': 1, 'a': (inc, 'x'), 'b': (inc, 'x'),
+    ...      'c': (add, 'a', 10), 'd': (add, 'b', 10)}
+    >>> dsk, dependencies = cse(d, ['c', 'd'])
+    >>> dsk  # doctest: +SKIP
+    {'x': 1, 'a': (inc, 'x'), 'c': (add, 'a', 10), 'd': 'c'}
+
+    Returns
+    -------
+    dsk: dict
+        Graph with duplicate tasks merged
+    dependencies: dict
+        ``{key: set-of-keys}`` of the returned graph
+    """
+    from .base import tokenize
+
+    if not isinstance(keys, (list, set)):
+        keys = [keys]
+    if dependencies is None:
+        dependencies = {k: get_dependencies(dsk, k) for k in dsk}
+
+    merged = {}  # key -> key it was merged into
+    seen = {}  # token -> key
+    out = {}
+    out_deps = {}
+    for key in toposort(dsk, dependencies=dependencies):
+        task = dsk[key]
+        deps = set()
+        for dep in dependencies[key]:
+            new = merged[dep]
+            if new != dep:
+                task = subs(task, dep, new)
+            deps.add(new)
+        new = seen.setdefault(tokenize(task), key)
+        merged[key] = new
+        if new == key:
+            out[key] = task
+            out_deps[key] = deps
+
+    for key in flatten(keys):
+        if merged[key] != key:
+            out[key] = merged[key]
+            out_deps[key] = {merged[key]}
+    return out, out_deps
+
+
 def default_fused_linear_keys_renamer(keys):
     """Create new keys for fused tasks"""
     typ = type(keys[0])
@@ -435,6 +496,8 @@ def fuse(
     max_depth_new_edges=_default,
     rename_keys=_default,
     fuse_subgraphs=_default,
+    sizes=None,
+    max_fused_bytes=_default,
 ):
     """Fuse tasks that form reductions; more advanced than ``fuse_linear``
 
@@ -485,6 +548,16 @@ def fuse(
         Set to None to let the default optimizer of individual dask collections decide.
         If no collection-specific default exists, None defaults to False.
         dask.config key: ``optimization.fuse.subgraphs``
+    sizes: dict, optional
+        Estimated number of bytes of the results of tasks, e.g. from
+        ``dask.array.optimization.estimate_nbytes``.  Missing keys count as
+        small.  Used with ``max_fused_bytes``.
+    max_fused_bytes: int, str or None (default None)
+        Don't fuse several tasks into one if it would hold more than this many
+        bytes of their results at once, according to ``sizes``.  Separate
+        tasks may run on different workers and release their results sooner,
+        while a fused task keeps all of them in memory until it finishes.
+        dask.config key: ``optimization.fuse.max-fused-bytes``
 
     Returns
     -------
@@ -524,6 +597,12 @@ def fuse(
         assert fuse_subgraphs is not _default
     if fuse_subgraphs is None:
         fuse_subgraphs = False
+    if max_fused_bytes is _default:
+        max_fused_bytes = config.get("optimization.fuse.max-fused-bytes", None)
+    if isinstance(max_fused_bytes, str):
+        max_fused_bytes = utils.parse_bytes(max_fused_bytes)
+    if sizes is None:
+        max_fused_bytes = None
 
     if not ave_width or not max_height:
         return dsk, dependencies
@@ -768,6 +847,11 @@ def fuse(
                         and
                         # Sanity check; don't go too deep if new levels introduce new edge dependencies
                         (no_new_edges or height < max_depth_new_edges)
+                        and (
+                            max_fused_bytes is None
+                            or sum(sizes.get(info[0], 0) for info in children_info)
+                            <= max_fused_bytes
+                        )
                     ):
                         # Perform substitutions as we go
                         val = dsk[parent]
@@ -967,3 +1051,18 @@ class SubgraphCallable:
 
     def __hash__(self):
         return hash(tuple((self.outkey, tuple(self.inkeys), self.name)))
+
+    def __dask_tokenize__(self):
+        # Tokenize the structure of the subgraph regardless of the names of
+        # its keys, so that those of identical but separately built
+        # collections tokenize the same, e.g. for ``cse``
+        from .base import tokenize
+
+        keys = set(self.dsk) | set(self.inkeys)
+        tokens = {k: ("__input__", i) for i, k in enumerate(self.inkeys)}
+        for key in toposort(self.dsk):
+            task = self.dsk[key]
+            for dep in core.keys_in_tasks(keys, [task]):
+                task = subs(task, dep, tokens[dep])
+            tokens[key] = ("__task__", tokenize(task))
+        return type(self).__name__, tokens[self.outkey], len(self.inkeys)
@@ -111,6 +111,13 @@ def order(dsk, dependencies=None):
         dependencies = {k: get_dependencies(dsk, k) for k in dsk}
 
     dependents = reverse_dict(dependencies)
+    if all(len(v) <= 1 for v in dependencies.values()) and all(
+        len(v) <= 1 for v in dependents.values()
+    ):
+        result = _order_chains(dependencies, dependents)
+        if result is not None:
+            return result
+
     num_needed, total_dependencies = ndependencies(dependencies, dependents)
     metrics = graph_metrics(dependencies, dependents, total_dependencies)
 
@@ -509,6 +516,40 @@ def order(dsk, dependencies=None):
     return result
 
 
+def _order_chains(dependencies, dependents):
+    """Order a graph of independent chains of tasks
+
+    Embarrassingly parallel graphs, like a few blockwise operations on many
+    chunks, consist of chains in which every task has at most one dependency
+    and one dependent.  For these ``order`` runs each chain to completion, the
+    longest chains first and then by the key of the first task, so we do that
+    directly without computing any graph metrics.
+
+    Returns ``None`` if not every task is part of a chain, i.e. for cycles.
+    """
+    chains = []
+    for key, deps in dependencies.items():
+        if not deps:
+            chain = [key]
+            parents = dependents[key]
+            while parents:
+                (parent,) = parents
+                chain.append(parent)
+                parents = dependents[parent]
+            chains.append(chain)
+    if sum(map(len, chains)) != len(dependencies):
+        return None
+
+    chains.sort(key=lambda chain: (-len(chain), StrComparable(chain[0])))
+    result = {}
+    i = 0
+    for chain in chains:
+        for key in chain:
+            result[key] = i
+            i += 1
+    return result
+
+
 def graph_metrics(dependencies, dependents, total_dependencies):
     r"""Useful measures of a graph used by ``dask.order.order``
 
@@ -676,7 +717,7 @@ def ndependencies(dependencies, dependents):
                 current_append(parent)
     while current:
         key = current_pop()
-        result[key] = 1 + sum(result[child] for child in dependencies[key])
+        result[key] = 1 + sum([result[child] for child in dependencies[key]])
         for parent in dependents[key]:
             num_needed[parent] -= 1
             if not num_needed[parent]:
@@ -0,0 +1,194 @@
+"""
+Mappings that move data between memory and local disk.
+
+These are used by the local schedulers to keep the amount of intermediate
+data held in memory below a configured limit.  ``File`` stores pickled values
+in a directory and ``SpillBuffer`` keeps recently used values in memory,
+moving the least recently used ones to a ``File`` once a byte limit is
+exceeded.
+"""
+import os
+import pickle
+import shutil
+import tempfile
+from collections import OrderedDict
+from collections.abc import MutableMapping
+
+from . import config
+from .sizeof import sizeof
+
+
+class File(MutableMapping):
+    """Store pickled values as files in a directory
+
+    Keys may be any hashable object; file names are assigned internally.
+
+    Parameters
+    ----------
+    directory : str, optional
+        Directory in which to store files.  If not given a new temporary
+        directory is created within the ``temporary-directory`` configuration
+        value when the first value is stored, and removed again by ``close``.
+
+    Examples
+    --------
+    >>> f = File()  # doctest: +SKIP
+    >>> f[('x', 0)] = 123  # doctest: +SKIP
+    >>> f[('x', 0)]  # doctest: +SKIP
+    123
+    >>> f.close()  # doctest: +SKIP
+    """
+
+    def __init__(self, directory=None):
+        if directory is None:
+            self._parent = config.get("temporary-directory", None)
+            self._owns_directory = True
+        else:
+            os.makedirs(directory, exist_ok=True)
+            self._owns_directory = False
+        self.directory = directory
+        self.filenames = dict()
+        self._counter = 0
+
+    def _ensure_directory(self):
+        if self.directory is None:
+            self.directory = tempfile.mkdtemp(prefix="dask-spill-", dir=self._parent)
+
+    def __getitem__(self, key):
+        with open(self.filenames[key], "rb") as f:
+            return pickle.load(f)
+
+    def __setitem__(self, key, value):
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if key in self.filenames:
+            fn = self.filenames[key]
+        else:
+            self._ensure_directory()
+            self._counter += 1
+            fn = os.path.join(self.directory, str(self._counter))
+        with open(fn, "wb") as f:
+            f.write(data)
+        self.filenames[key] = fn
+
+    def __delitem__(self, key):
+        os.remove(self.filenames.pop(key))
+
+    def __iter__(self):
+        return iter(self.filenames)
+
+    def __len__(self):
+        return len(self.filenames)
+
+    def __contains__(self, key):
+        return key in self.filenames
+
+    def close(self):
+        """ Remove all stored files """
+        if self._owns_directory:
+            if self.directory is not None:
+                shutil.rmtree(self.directory, ignore_errors=True)
+                self.directory = None
+        else:
+            for fn in self.filenames.values():
+                try:
+                    os.remove(fn)
+                except OSError:
+                    pass
+        self.filenames.clear()
+
+
+class SpillBuffer(MutableMapping):
+    """Keep values in memory up to a byte limit, spilling the rest to disk
+
+    Values are measured with ``dask.sizeof``.  When the total size of values
+    held in memory exceeds ``memory_limit`` the least recently used values are
+    moved to ``slow`` storage, by default a ``File`` store in a temporary
+    directory.  Reading a spilled value loads it back into memory
+    transparently.  Values that cannot be pickled are always kept in memory.
+
+    Parameters
+    ----------
+    memory_limit : int or str
+        Maximum number of bytes to hold in memory, e.g. ``"40GB"``
+    slow : MutableMapping, optional
+        Storage for spilled values, defaults to ``File()``
+
+    Examples
+    --------
+    >>> buf = SpillBuffer("100 MB")  # doctest: +SKIP
+    >>> buf['x'] = np.ones(20000000)  # doctest: +SKIP
+    >>> 'x' in buf.slow  # doctest: +SKIP
+    True
+    >>> buf.close()  # doctest: +SKIP
+    """
+
+    def __init__(self, memory_limit, slow=None):
+        from .utils import parse_bytes
+
+        self.memory_limit = parse_bytes(memory_limit)
+        self.fast = OrderedDict()
+        self.slow = File() if slow is None else slow
+        self.weights = dict()
+        self.total_weight = 0
+
+    def __getitem__(self, key):
+        if key in self.fast:
+            self.fast.move_to_end(key)
+            return self.fast[key]
+        value = self.slow[key]
+        del self.slow[key]
+        self._set_fast(key, value)
+        return value
+
+    def __setitem__(self, key, value):
+        if key in self:
+            del self[key]
+        self._set_fast(key, value)
+
+    def __delitem__(self, key):
+        if key in self.fast:
+            del self.fast[key]
+            self.total_weight -= self.weights.pop(key)
+        else:
+            del self.slow[key]
+
+    def _set_fast(self, key, value):
+        weight = sizeof(value)
+        self.fast[key] = value
+        self.weights[key] = weight
+        self.total_weight += weight
+        self._evict(keep=key)
+
+    def _evict(self, keep):
+        """ Spill least recently used values until under the memory limit """
+        if self.total_weight <= self.memory_limit:
+            return
+        for key in list(self.fast):
+            if self.total_weight <= self.memory_limit:
+                break
+            if key == keep and len(self.fast) > 1:
+                continue
+            try:
+                self.slow[key] = self.fast[key]
+            except (pickle.PicklingError, AttributeError, TypeError):
+                continue
+            del self.fast[key]
+            self.total_weight -= self.weights.pop(key)
+
+    def __iter__(self):
+        yield from self.fast
+        yield from self.slow
+
+    def __len__(self):
+        return len(self.fast) + len(self.slow)
+
+    def __contains__(self, key):
+        return key in self.fast or key in self.slow
+
+    def close(self):
+        """ Drop all values and remove any spilled files """
+        self.fast.clear()
+        self.weights.clear()
+        self.total_weight = 0
+        if hasattr(self.slow, "close"):
+            self.slow.close()
@@ -0,0 +1,135 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from operator import add
+
+import pytest
+
+import dask
+from dask.asyncio import get
+from dask.callbacks import Callback
+from dask.utils_test import inc
+
+
+def run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def test_get():
+    dsk = {"x": 1, "y": 2, "z": (inc, "x"), "w": (add, "z", "y")}
+    assert run(get(dsk, "w")) == 4
+    assert run(get(dsk, ["w", "y"])) == (4, 2)
+    assert run(get(dsk, [["w"], "z"])) == ((4,), 2)
+
+
+def test_get_with_executor():
+    dsk = {("x", i): (inc, i) for i in range(10)}
+    dsk["y"] = (sum, sorted(dsk))
+    with ThreadPoolExecutor(2) as executor:
+        assert run(get(dsk, "y", executor=executor)) == 55
+
+
+def test_get_ignores_pool_config():
+    from multiprocessing.pool import ThreadPool
+
+    # The threaded scheduler's pool is not an executor
+    dsk = {"x": 1, "y": (inc, "x")}
+    with ThreadPool(2) as pool, dask.config.set(pool=pool):
+        assert run(get(dsk, "y")) == 2
+
+
+def test_compute_async():
+    d = dask.delayed(inc)(1)
+    e = dask.delayed(add)(d, 10)
+    assert run(dask.compute_async(d, e, 5)) == (2, 12, 5)
+    assert run(dask.compute_async(1, 2)) == (1, 2)
+
+
+def test_does_not_block_event_loop():
+    def slow(x):
+        time.sleep(0.2)
+        return x
+
+    ticks = []
+
+    async def ticker():
+        for i in range(5):
+            ticks.append(i)
+            await asyncio.sleep(0.02)
+
+    async def main():
+        return await asyncio.gather(
+            get({"x": (slow, 1)}, "x"), ticker(), get({"x": (slow, 2)}, "x")
+        )
+
+    assert run(main()) == [1, None, 2]
+    assert ticks == list(range(5))
+
+
+def test_concurrent_graphs_share_executor():
+    active = []
+    lock = threading.Lock()
+
+    def f(i):
+        with lock:
+            active.append(threading.current_thread())
+        time.sleep(0.01)
+        return i
+
+    async def main():
+        with ThreadPoolExecutor(2) as executor:
+            graphs = [{("x", i): (f, i) for i in range(5)} for _ in range(3)]
+            return await asyncio.gather(
+                *[get(dsk, sorted(dsk), executor=executor) for dsk in graphs]
+            )
+
+    assert run(main()) == [tuple(range(5))] * 3
+    assert len(set(active)) <= 2
+
+
+def test_exceptions_propagate():
+    def bad():
+        raise ValueError("bad")
+
+    with pytest.raises(ValueError, match="bad"):
+        run(get({"x": (bad,), "y": (inc, "x")}, "y"))
+
+
+def test_cancel():
+    started = []
+    event = threading.Event()
+
+    def block(i):
+        started.append(i)
+        event.wait(5)
+        return i
+
+    async def main():
+        with ThreadPoolExecutor(1) as executor:
+            dsk = {("x", i): (block, i) for i in range(10)}
+            task = asyncio.ensure_future(
+                get(dsk, sorted(dsk), executor=executor, num_workers=4)
+            )
+            await asyncio.sleep(0.1)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            event.set()
+
+    finished = []
+    with Callback(finish=lambda dsk, state, failed: finished.append(failed)):
+        run(main())
+    assert len(started) == 1
+    assert finished == [True]
+
+
+def test_callbacks():
+    keys = []
+    with Callback(pretask=lambda key, dsk, state: keys.append(key)):
+        assert run(get({"x": 1, "y": (inc, "x")}, "y")) == 2
+    assert keys == ["y"]
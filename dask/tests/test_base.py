@@ -18,6 +18,7 @@ from dask.base import (
     visualize,
     persist,
     function_cache,
+    array_token_cache,
     is_dask_collection,
     DaskMethodsMixin,
     optimize,
@@ -115,6 +116,71 @@ def test_tokenize_discontiguous_numpy_array():
     tokenize(np.random.random(8)[::2])
 
 
+@pytest.mark.skipif("not np")
+def test_tokenize_numpy_array_cache():
+    data = np.arange(1000).tobytes()
+    x = np.frombuffer(data, dtype=int)
+    token = tokenize(x)
+    assert id(x) in array_token_cache
+    assert tokenize(x) == token == tokenize(np.arange(1000))
+
+    # views of arrays backed by immutable buffers are cached as well
+    y = x[10:]
+    assert tokenize(y) == tokenize(np.arange(1000)[10:])
+    assert id(y) in array_token_cache
+
+    del x, y
+    assert not array_token_cache
+
+    # views that can change through their base are not cached
+    x = np.arange(1000)
+    y = x[10:]
+    y.setflags(write=False)
+    before = tokenize(y)
+    x[500] = -1
+    assert id(y) not in array_token_cache
+    assert tokenize(y) != before
+
+    # arrays owning their data may be made writeable again
+    x = np.arange(1000)
+    x.setflags(write=False)
+    before = tokenize(x)
+    assert id(x) not in array_token_cache
+    x.setflags(write=True)
+    x[500] = -1
+    x.setflags(write=False)
+    assert tokenize(x) != before
+
+    with dask.config.set({"tokenize.cache": False}):
+        x = np.frombuffer(data, dtype=int)
+        tokenize(x)
+        assert id(x) not in array_token_cache
+
+
+@pytest.mark.skipif("not np")
+def test_tokenize_numpy_array_large():
+    x = np.arange(2 ** 23)  # spans several chunks
+    y = x.copy()
+    assert tokenize(x) == tokenize(y)
+    y[-1] = 0
+    assert tokenize(x) != tokenize(y)
+
+
+@pytest.mark.skipif("not np")
+def test_tokenize_numpy_array_sampled():
+    x = np.zeros(2 ** 21)
+    y = x.copy()
+    y[1] = 1  # inside the first sample
+    z = x.copy()
+    z[2 ** 14] = 1  # between samples
+    with dask.config.set({"tokenize.sample-threshold": "1 MiB"}):
+        assert tokenize(x) == tokenize(x.copy())
+        assert tokenize(x) != tokenize(y)
+        assert tokenize(x) == tokenize(z)
+        assert tokenize(x) != tokenize(np.zeros(2 ** 21 + 1))
+    assert tokenize(x) != tokenize(z)
+
+
 @pytest.mark.skipif("not np")
 def test_tokenize_numpy_datetime():
     tokenize(np.array(["2000-01-01T12:00:00"], dtype="M8[ns]"))
@@ -1354,6 +1420,26 @@ def test_optimizations_ctd():
     assert dsk1 == dsk2
 
 
+def test_collections_to_dsk_cse():
+    np = pytest.importorskip("numpy")
+    da = pytest.importorskip("dask.array")
+    from dask.callbacks import Callback
+
+    x = np.arange(10)
+    a = da.from_array(x, chunks=5, name=False) + 1
+    b = da.from_array(x, chunks=5, name=False) + 1
+    assert a.name != b.name
+
+    tasks = []
+    with Callback(pretask=lambda key, dsk, state: tasks.append(key)):
+        assert dask.compute(a.sum(), b.sum()) == (55, 55)
+        n = len(tasks)
+        del tasks[:]
+        with dask.config.set({"optimization.cse.active": True}):
+            assert dask.compute(a.sum(), b.sum()) == (55, 55)
+    assert len(tasks) < n
+
+
 def test_clone_key():
     h = object()  # arbitrary hashable
     assert clone_key("inc-1-2-3", 123) == "inc-27b6e15b795fcaff169e0e0df14af97a"
@@ -1,13 +1,12 @@
 from dask.callbacks import Callback
-from dask.cache import Cache
+from dask.cache import Cache, CacheStore
 from dask.local import get_sync
 from dask.threaded import get
 from operator import add
 from time import sleep
+import os
 import pytest
 
-cachey = pytest.importorskip("cachey")
-
 
 flag = []
 
@@ -18,6 +17,7 @@ def inc(x):
 
 
 def test_cache():
+    cachey = pytest.importorskip("cachey")
     c = cachey.Cache(10000)
     cc = Cache(c)
 
@@ -43,10 +43,107 @@ def test_cache():
 
 def test_cache_with_number():
     c = Cache(10000, limit=1)
-    assert isinstance(c.cache, cachey.Cache)
+    assert isinstance(c.cache, CacheStore)
     assert c.cache.available_bytes == 10000
     assert c.cache.limit == 1
 
+    c = Cache("10 kB", policy="lru")
+    assert c.cache.available_bytes == 10000
+
+
+def test_builtin_cache():
+    while flag:
+        flag.pop()
+    cc = Cache(10000)
+    with cc:
+        assert get({"x": (inc, 1)}, "x") == 2
+    assert flag == [1]
+    assert cc.cache.data["x"] == 2
+
+    while flag:
+        flag.pop()
+    dsk = {"x": (inc, 1), "y": (inc, 2), "z": (add, "x", "y")}
+    with cc:
+        assert get(dsk, "z") == 5
+    assert flag == [2]
+    assert not Callback.active
+
+
+def test_cache_prunes_upstream_tasks():
+    while flag:
+        flag.pop()
+    dsk = {"a": (inc, 1), "b": (inc, "a"), "c": (inc, "b"), "d": (add, "c", "a")}
+    cc = Cache(10000)
+    with cc:
+        assert get_sync(dsk, "c") == 4
+    assert flag == [1, 2, 3]
+
+    while flag:
+        flag.pop()
+    cc.cache.retire("a")
+    with cc:
+        assert get_sync(dsk, ["c", "d"]) == (4, 6)
+    # b is never recomputed as c is cached; a is still needed by d
+    assert flag == [1]
+
+
+def test_cache_store_policies():
+    store = CacheStore(250, policy="lru")
+    store.put("a", b"a", cost=1, nbytes=100)
+    store.put("b", b"b", cost=1, nbytes=100)
+    assert store.data["a"] == b"a"
+    store.put("c", b"c", cost=1, nbytes=100)
+    assert set(store.data) == {"a", "c"}
+    assert store.total_bytes == 200
+
+    store = CacheStore(250, policy="lfu")
+    store.put("a", b"a", cost=1, nbytes=100)
+    store.put("b", b"b", cost=1, nbytes=100)
+    store.get("b")
+    store.get("b")
+    store.get("a")
+    store.put("c", b"c", cost=1, nbytes=100)
+    assert set(store.data) == {"a", "b"}
+
+    store = CacheStore(250, policy="cost")
+    store.put("expensive", 1, cost=10, nbytes=100)
+    store.put("cheap", 2, cost=0.1, nbytes=100)
+    store.put("new", 3, cost=1, nbytes=100)
+    assert set(store.data) == {"expensive", "new"}
+
+    store = CacheStore(250, policy=lambda cost, nbytes, hits, last: -last)
+    store.put("a", 1, cost=1, nbytes=100)
+    store.put("b", 2, cost=1, nbytes=100)
+    store.put("c", 3, cost=1, nbytes=100)
+    assert set(store.data) == {"a", "b"}
+
+    store = CacheStore(1000, limit=1)
+    store.put("a", 1, cost=0.5)
+    assert "a" not in store.data
+    store.put("b", 2, cost=2)
+    assert "b" in store.data
+
+
+def test_cache_store_disk(tmpdir):
+    store = CacheStore(
+        250, policy="lru", directory=str(tmpdir), available_disk_bytes=150
+    )
+    store.put("a", b"a", cost=1, nbytes=100)
+    store.put("b", b"b", cost=1, nbytes=100)
+    store.put("c", b"c", cost=1, nbytes=100)
+    assert set(store.memory) == {"b", "c"}
+    assert set(store.disk) == {"a"}
+    assert store.data["a"] == b"a"
+    assert len(os.listdir(str(tmpdir))) == 1
+
+    # b is spilled, and then evicted as a was read more recently
+    store.put("d", b"d", cost=1, nbytes=100)
+    assert set(store.memory) == {"c", "d"}
+    assert set(store.disk) == {"a"}
+    assert set(store.data) == {"a", "c", "d"}
+    store.close()
+    assert not os.listdir(str(tmpdir))
+
 
 def test_cache_correctness():
     # https://github.com/dask/dask/issues/3631
@@ -72,4 +169,4 @@ def test_prefer_cheap_dependent():
     with c:
         get_sync(dsk, "y")
 
-    assert c.cache.scorer.cost["x"] < c.cache.scorer.cost["y"]
+    assert c.cache.cost["x"] < c.cache.cost["y"]
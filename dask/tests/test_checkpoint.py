@@ -0,0 +1,91 @@
+import os
+from operator import add
+
+import pytest
+
+import dask
+from dask.checkpoint import Checkpoint
+from dask.local import get_sync
+from dask.threaded import get
+from dask.multiprocessing import get as mpget
+
+calls = []
+
+
+def inc(x):
+    calls.append(x)
+    return x + 1
+
+
+def test_checkpoint(tmpdir):
+    del calls[:]
+    dsk = {"a": (inc, 1), "b": (inc, "a"), "c": (inc, "b")}
+    with Checkpoint(str(tmpdir), keys=["b"]) as cp:
+        assert get_sync(dsk, "c") == 4
+    assert calls == [1, 2, 3]
+    assert "b" in cp
+    assert "a" not in cp
+    assert cp["b"] == 3
+
+    # a new callback on the same directory, as in a new process
+    del calls[:]
+    with Checkpoint(str(tmpdir), keys=["b"]):
+        assert get(dsk, "c") == 4
+    assert calls == [3]
+
+    del calls[:]
+    cp.clear()
+    with Checkpoint(str(tmpdir), keys=["b"]):
+        assert get_sync(dsk, "c") == 4
+    assert calls == [1, 2, 3]
+
+
+def test_checkpoint_layers(tmpdir):
+    dsk = {("x", 0): 1, ("x", 1): 2, ("y", 0): (inc, ("x", 0))}
+    dsk[("y", 1)] = (add, ("x", 1), ("y", 0))
+    with Checkpoint(str(tmpdir), layers=["y"]) as cp:
+        assert get_sync(dsk, [("y", 0), ("y", 1)]) == (2, 4)
+    assert ("y", 0) in cp and ("y", 1) in cp
+    assert ("x", 0) not in cp
+
+    cp = Checkpoint(str(tmpdir), keys=lambda k: k == ("x", 1))
+    assert cp.selected(("x", 1))
+    assert not cp.selected(("x", 0))
+
+
+def test_checkpoint_multiprocessing(tmpdir):
+    dsk = {"a": (add, 1, 2), "b": (add, "a", 10)}
+    with Checkpoint(str(tmpdir)) as cp:
+        assert mpget(dsk, ["a", "b"]) == (3, 13)
+    assert cp["a"] == 3 and cp["b"] == 13
+
+    # stored results are loaded in the worker processes
+    dsk = {"a": (sum, None), "b": (add, "a", 10)}
+    with Checkpoint(str(tmpdir), keys=["a"]):
+        assert mpget(dsk, ["a", "b"]) == (3, 13)
+
+
+def test_checkpoint_eviction(tmpdir):
+    cp = Checkpoint(str(tmpdir), available_bytes=500)
+    cp["a"] = b"0" * 200
+    cp["b"] = b"0" * 200
+    os.utime(cp.filename("a"), (0, 0))
+    cp["c"] = b"0" * 200
+    assert "a" not in cp
+    assert "b" in cp and "c" in cp
+
+    cp["big"] = b"0" * 1000
+    assert "big" not in cp
+
+    with pytest.raises(KeyError):
+        cp["a"]
+
+
+def test_checkpoint_delayed(tmpdir):
+    x = dask.delayed(inc)(1)
+    y = dask.delayed(inc)(x)
+    del calls[:]
+    with Checkpoint(str(tmpdir), layers=[x.key]):
+        assert y.compute(scheduler="sync") == 3
+        assert y.compute(scheduler="sync") == 3
+    assert calls == [1, 2, 2]
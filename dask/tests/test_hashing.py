@@ -1,6 +1,11 @@
 import pytest
 
-from dask.hashing import hashers, hash_buffer, hash_buffer_hex
+from dask.hashing import (
+    hashers,
+    hash_buffer,
+    hash_buffer_hex,
+    hash_buffer_chunked_hex,
+)
 
 
 np = pytest.importorskip("numpy")
@@ -41,3 +46,24 @@ def test_hashers(hasher):
     h = hasher(x)
     assert isinstance(h, bytes)
     assert 8 <= len(h) < 32
+
+
+@pytest.mark.parametrize("x", buffers)
+def test_hash_buffer_chunked_hex(x):
+    for chunksize in [2 ** 24, 64]:
+        h = hash_buffer_chunked_hex(x, chunksize=chunksize)
+        assert isinstance(h, str)
+        assert h == hash_buffer_chunked_hex(x, chunksize=chunksize)
+
+
+def test_hash_buffer_chunked_hex_large():
+    x = np.arange(10000, dtype="i8")
+    y = x.copy()
+    assert hash_buffer_chunked_hex(x) == hash_buffer_hex(x)
+    assert hash_buffer_chunked_hex(x, chunksize=1000) == hash_buffer_chunked_hex(
+        y, chunksize=1000
+    )
+    y[-1] = 0
+    assert hash_buffer_chunked_hex(x, chunksize=1000) != hash_buffer_chunked_hex(
+        y, chunksize=1000
+    )
@@ -4,6 +4,7 @@ from collections.abc import Set
 import pytest
 
 import dask
+from dask.core import flatten
 from dask.utils_test import inc
 from dask.highlevelgraph import HighLevelGraph, BasicLayer, Layer
 
@@ -139,6 +140,22 @@ def test_multiple_annotations():
     assert clayer.annotations is None
 
 
+def test_get_annotated_keys():
+    da = pytest.importorskip("dask.array")
+    with dask.annotate(resources={"io": 1}):
+        A = da.ones((10, 10), chunks=(5, 5))
+    with dask.annotate(resources=lambda k: {"GPU": k[1]}):
+        B = A + 1
+    C = B + 1
+
+    resources = C.__dask_graph__().get_annotated_keys("resources")
+    assert resources == {
+        **{k: {"io": 1} for k in flatten(A.__dask_keys__())},
+        **{k: {"GPU": k[1]} for k in flatten(B.__dask_keys__())},
+    }
+    assert C.__dask_graph__().get_annotated_keys("priority") == {}
+
+
 @pytest.mark.parametrize("flat", [True, False])
 def test_blockwise_cull(flat):
     da = pytest.importorskip("dask.array")
@@ -0,0 +1,101 @@
+from unittest import mock
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import dask.array as da
+from dask.array.utils import assert_eq
+from dask.core import flatten, get_deps
+from dask.layers import (
+    ArrayOverlapLayer,
+    ArrayPartialReduceLayer,
+    ArrayRechunkLayer,
+)
+
+
+@pytest.mark.parametrize(
+    "cls,func,expected",
+    [
+        (ArrayRechunkLayer, lambda x: x.rechunk((3, 7)), lambda a: a),
+        (
+            ArrayOverlapLayer,
+            lambda x: da.overlap.overlap(x, {0: 1, 1: 2}, "none"),
+            None,
+        ),
+        (ArrayPartialReduceLayer, lambda x: x.sum(split_every=2), np.sum),
+    ],
+)
+def test_symbolic_layers(cls, func, expected):
+    a = np.arange(400).reshape(20, 20)
+    x = da.from_array(a, chunks=(5, 4))
+    y = func(x)
+    layer = y.dask.layers[y.name]
+    assert isinstance(layer, cls)
+    assert layer.get_output_keys() == set(flatten(y.__dask_keys__()))
+    assert not layer.is_materialized()
+
+    # Dependencies from culling match those of the materialized tasks, and
+    # culling does not build any tasks
+    keys = set(flatten(y.__dask_keys__()))
+    for keep in [keys, set(sorted(keys)[::3])]:
+        with mock.patch.object(cls, "_construct_block", side_effect=AssertionError):
+            culled = y.dask.cull(keep)
+            key_dependencies = culled.key_dependencies
+        dependencies, _ = get_deps(dict(culled))
+        for name, layer in culled.layers.items():
+            if isinstance(layer, cls):
+                for key in layer:
+                    assert key_dependencies[key] == dependencies[key]
+
+    if expected is not None:
+        assert_eq(y, expected(a))
+
+
+def test_rechunk_layer_cull():
+    x = da.ones((1000, 1000), chunks=(10, 10))
+    y = x.rechunk((1000, 1))  # rechunks in two steps
+    layers = [
+        layer
+        for layer in y.dask.layers.values()
+        if isinstance(layer, ArrayRechunkLayer)
+    ]
+    assert len(layers) == 2
+
+    z = y[:, :3]
+    culled = z.dask.cull(set(z.__dask_keys__()[0]))
+    culled_layer = culled.layers[y.name]
+    assert isinstance(culled_layer, ArrayRechunkLayer)
+    assert not culled_layer.is_materialized()
+    assert culled_layer.get_output_keys() == {(y.name, 0, i) for i in range(3)}
+    assert not any(layer.is_materialized() for layer in layers)
+    assert_eq(z, np.ones((1000, 3)))
+
+
+def test_overlap_layer_matches_numpy():
+    a = np.arange(144).reshape(12, 12)
+    x = da.from_array(a, chunks=(4, 3))
+    y = da.overlap.overlap(x, depth={0: 1, 1: 1}, boundary={0: "none", 1: "none"})
+    layer = y.dask.layers[y.name]
+    assert layer.numblocks == x.numblocks
+    assert_eq(y.blocks[1, 1], a[3:9, 2:7])
+    assert_eq(y.blocks[0, 0], a[:5, :4])
+
+
+def test_partial_reduce_layer():
+    a = np.arange(11 * 22).reshape(11, 22)
+    x = da.from_array(a, chunks=(3, 4))
+    for axis in [None, 0, 1, (0, 1)]:
+        for keepdims in [True, False]:
+            assert_eq(
+                x.sum(axis=axis, keepdims=keepdims, split_every=2),
+                a.sum(axis=axis, keepdims=keepdims),
+            )
+    y = x.sum(axis=0, split_every=2)
+    layers = [
+        layer
+        for layer in y.dask.layers.values()
+        if isinstance(layer, ArrayPartialReduceLayer)
+    ]
+    assert len(layers) == 2
+    assert all(not layer.is_materialized() for layer in layers)
@@ -1,3 +1,5 @@
+import pytest
+
 import dask
 
 from dask.local import start_state_from_dask, get_sync, finish_task, sortkey
@@ -39,6 +41,31 @@ def test_start_state_looks_at_cache():
     assert result["ready"] == ["b"]
 
 
+def test_start_state_with_dependencies():
+    dsk = {"x": 1, "y": 2, "z": (inc, "x"), "w": (add, "z", "y")}
+    dependencies = {"x": set(), "y": set(), "z": {"x"}, "w": {"y", "z"}}
+    result = start_state_from_dask(dsk, dependencies=dependencies)
+    assert result == start_state_from_dask(dsk)
+    assert result["dependencies"] is dependencies
+
+
+def test_get_sync_with_dependencies(monkeypatch):
+    import dask.local
+
+    def fail(*args, **kwargs):
+        raise AssertionError("dependencies were computed again")
+
+    dsk = {"x": 1, "y": 2, "z": (inc, "x"), "w": (add, "z", "y")}
+    dependencies = {"x": set(), "y": set(), "z": {"x"}, "w": {"y", "z"}}
+    monkeypatch.setattr(dask.local, "get_dependencies", fail)
+    assert get_sync(dsk, "w", dependencies=dependencies) == 4
+
+
+def test_get_sync_with_cache():
+    dsk = {"b": (inc, "a"), "c": (add, "a", "b")}
+    assert get_sync(dsk, "c", cache={"a": 1}) == 3
+
+
 def test_start_state_with_redirects():
     dsk = {"x": 1, "y": "x", "z": (inc, "y")}
     result = start_state_from_dask(dsk)
@@ -172,3 +199,68 @@ def test_ordering():
     get_sync(dsk, "y")
 
     assert L == sorted(L)
+
+
+@pytest.mark.parametrize("chunksize", [1, 3, -1])
+def test_chunksize(chunksize):
+    from dask.threaded import get
+
+    dsk = {("x", i): (inc, i) for i in range(20)}
+    dsk["y"] = (sum, sorted(dsk))
+    assert get(dsk, "y", chunksize=chunksize) == sum(range(1, 21))
+    assert get_sync(dsk, "y", chunksize=chunksize) == sum(range(1, 21))
+
+    with dask.config.set({"local.chunksize": chunksize}):
+        assert get(dsk, ["y", ("x", 3)]) == (sum(range(1, 21)), 4)
+
+
+def test_chunksize_batches_tasks():
+    from dask.local import get_async
+
+    batches = []
+
+    def apply_async(func, args=(), kwds={}, callback=None):
+        batches.append(len(args[0]))
+        callback(func(*args, **kwds))
+
+    dsk = {("x", i): (inc, i) for i in range(20)}
+    dsk["y"] = (sum, sorted(dsk))
+
+    assert get_async(apply_async, 2, dsk, "y", chunksize=4) == sum(range(1, 21))
+    assert max(batches) == 4
+    assert sum(batches) == 21
+
+    batches.clear()
+    assert get_async(apply_async, 2, dsk, "y", chunksize=-1) == sum(range(1, 21))
+    assert batches[0] == 10
+
+
+def test_chunksize_invalid():
+    with pytest.raises(ValueError, match="chunksize"):
+        get_sync({"x": 1}, "x", chunksize=0)
+
+
+def test_chunksize_exceptions_propagate():
+    from dask.threaded import get
+
+    def bad(x):
+        raise ValueError("bad %d" % x)
+
+    dsk = {("x", i): (inc, i) for i in range(10)}
+    dsk[("x", 5)] = (bad, 5)
+    dsk["y"] = (sum, sorted(dsk))
+    with pytest.raises(ValueError, match="bad 5"):
+        get(dsk, "y", chunksize=4)
+
+
+def test_io_apply_async_default_io_workers():
+    from dask.local import apply_sync, get_async
+
+    dsk = {("read", i): (inc, i) for i in range(4)}
+    dsk["y"] = (sum, sorted(dsk))
+    resources = {("read", i): {"io": 1} for i in range(4)}
+    with dask.config.set({"local.io-workers": 1}):
+        result = get_async(
+            apply_sync, 1, dsk, "y", resources=resources, io_apply_async=apply_sync
+        )
+    assert result == 10
@@ -1,4 +1,5 @@
 from distutils.version import LooseVersion
+import os
 import sys
 import multiprocessing
 from operator import add
@@ -7,7 +8,15 @@ import pickle
 import pytest
 import dask
 from dask import compute, delayed
-from dask.multiprocessing import get, _dumps, _loads, get_context, remote_exception
+from dask.multiprocessing import (
+    get,
+    _dumps,
+    _loads,
+    get_context,
+    remote_exception,
+    WorkerPool,
+    default_worker_pool,
+)
 from dask.utils_test import inc
 
 
@@ -180,6 +189,13 @@ def test_reuse_pool():
             assert get({"x": (inc, 1)}, "x") == 2
 
 
+@pytest.mark.parametrize("chunksize", [3, -1])
+def test_chunksize(chunksize):
+    dsk = {("x", i): (inc, i) for i in range(10)}
+    dsk["y"] = (sum, sorted(dsk))
+    assert get(dsk, "y", chunksize=chunksize, optimize_graph=False) == 55
+
+
 def test_dumps_loads():
     with dask.config.set(func_dumps=pickle.dumps, func_loads=pickle.loads):
         assert get({"x": 1, "y": (add, "x", 2)}, "y") == 3
@@ -243,6 +259,147 @@ def test_random_seeds(random):
     assert len(set(results)) == N
 
 
+@pytest.mark.skipif(pickle.HIGHEST_PROTOCOL < 5, reason="requires pickle protocol 5")
+def test_dumps_loads_shared(tmpdir):
+    np = pytest.importorskip("numpy")
+    from dask.multiprocessing import dumps_shared, loads_shared
+
+    x = np.arange(100000)
+    frames = dumps_shared((x, "hello"), str(tmpdir))
+    header, fn, sizes = frames
+    assert sizes == (x.nbytes,)
+    assert len(header) < 1000
+    assert os.path.exists(fn)
+
+    y, s = loads_shared(frames)
+    assert s == "hello"
+    assert (x == y).all()
+    assert not os.path.exists(fn)
+    y[0] = 10  # copy-on-write
+    assert x[0] == 0
+
+    assert dumps_shared(np.arange(10), str(tmpdir))[1] is None
+    assert (
+        loads_shared(dumps_shared(np.arange(10), str(tmpdir))) == np.arange(10)
+    ).all()
+    assert not os.listdir(str(tmpdir))
+
+
+def make_array(n):
+    import numpy as np
+
+    return np.arange(n)
+
+
+@pytest.mark.skipif(pickle.HIGHEST_PROTOCOL < 5, reason="requires pickle protocol 5")
+def test_shared_memory():
+    np = pytest.importorskip("numpy")
+    dsk = {("x", i): (make_array, 100000 + i) for i in range(4)}
+    dsk["y"] = (np.concatenate, sorted(dsk))
+    dsk["z"] = (np.sum, "y")
+    result = get(dsk, ["y", "z"], shared_memory=True, optimize_graph=False)
+    assert result[1] == sum(make_array(100000 + i).sum() for i in range(4))
+    assert len(result[0]) == 400006
+
+    with dask.config.set({"multiprocessing.shared-memory": True}):
+        with WorkerPool(2) as pool:
+            y, z = get(dsk, ["y", "z"], pool=pool, optimize_graph=False)
+    assert z == result[1]
+    assert (y == result[0]).all()
+
+
+def worker_data():
+    from dask.multiprocessing import _worker_data
+
+    return {k: v for k, v in _worker_data.items() if v}
+
+
+def first_pid(i):
+    return (os.getpid(), i)
+
+
+def same_pid(x):
+    pid, i = x
+    assert os.getpid() == pid
+    return (pid, i + 1)
+
+
+def combine_pids(*args):
+    return sum(i for _, i in args)
+
+
+def test_worker_pool():
+    dsk = {("x", i): (inc, i) for i in range(20)}
+    dsk.update({("y", i): (add, ("x", i), ("x", (i + 1) % 20)) for i in range(20)})
+    dsk["z"] = (sum, [("y", i) for i in range(20)])
+
+    with WorkerPool(3) as pool:
+        assert len(pool) == 3
+        assert get(dsk, "z", pool=pool) == 420
+        assert get(dsk, ["z", ("y", 2)], pool=pool, optimize_graph=False) == (420, 7)
+        with dask.config.set(pool=pool):
+            assert get(dsk, "z") == 420
+        for p in pool.pools:
+            assert p.apply(worker_data) == {}
+
+
+def test_worker_pool_locality():
+    dsk = {}
+    for j in range(4):
+        dsk[("a", j, 0)] = (first_pid, 0)
+        for i in range(1, 5):
+            dsk[("a", j, i)] = (same_pid, ("a", j, i - 1))
+    dsk["b"] = (combine_pids,) + tuple(("a", j, 4) for j in range(4))
+
+    with WorkerPool(2) as pool:
+        assert get(dsk, "b", pool=pool, optimize_graph=False) == 16
+
+
+def test_worker_pool_errors_propagate():
+    dsk = {"x": (inc, 1), "y": (bad,), "z": (add, "x", "y")}
+    with WorkerPool(2) as pool:
+        with pytest.raises(ValueError) as e:
+            get(dsk, "z", pool=pool, optimize_graph=False)
+        assert "12345" in str(e.value)
+        for p in pool.pools:
+            assert p.apply(worker_data) == {}
+
+
+def test_worker_pool_callbacks():
+    from dask.callbacks import Callback
+
+    dsk = {"x": (inc, 1), "y": (inc, "x"), "z": (add, "x", "y")}
+    results = {}
+
+    def posttask(key, result, dsk, state, id):
+        results[key] = result
+
+    with WorkerPool(2) as pool, Callback(posttask=posttask):
+        assert get(dsk, "z", pool=pool, optimize_graph=False) == 5
+    assert results == {"x": 2, "y": 3, "z": 5}
+
+
+def test_worker_pool_unsupported_options():
+    dsk = {"x": (inc, 1), "y": (inc, "x")}
+    with WorkerPool(2) as pool:
+        with pytest.raises(ValueError, match="memory_limit"):
+            get(dsk, "y", pool=pool, memory_limit="1GB")
+        with pytest.raises(ValueError, match="chunksize"):
+            get(dsk, "y", pool=pool, chunksize=4)
+        with dask.config.set({"local.chunksize": -1}):
+            with pytest.raises(ValueError, match="chunksize"):
+                get(dsk, "y", pool=pool)
+
+
+def test_locality_config_uses_long_lived_pool():
+    dsk = {"x": (os.getpid,)}
+    with dask.config.set({"multiprocessing.locality": True}):
+        pid = get(dsk, "x", num_workers=1)
+        assert get(dsk, "x", num_workers=1) == pid
+    assert default_worker_pool(1) is default_worker_pool(1)
+    assert get(dsk, "x", num_workers=1) != pid
+
+
 def check_for_pytest():
     """We check for spawn by ensuring subprocess doesn't have modules only
     parent process should have:
@@ -9,6 +9,7 @@ from dask.utils_test import add, inc
 from dask.core import get_dependencies
 from dask.local import get_sync
 from dask.optimization import (
+    cse,
     cull,
     fuse,
     inline,
@@ -37,6 +38,31 @@ def test_cull():
     pytest.raises(KeyError, lambda: cull(d, "badkey"))
 
 
+def test_cse():
+    d = {
+        "x": 1,
+        "a": (inc, "x"),
+        "b": (inc, "x"),
+        "c": (add, "a", 10),
+        "d": (add, "b", 10),
+        "e": (add, "d", "c"),
+    }
+    dsk, dependencies = cse(d, "e")
+    assert dsk == {"x": 1, "a": (inc, "x"), "c": (add, "a", 10), "e": (add, "c", "c")}
+    assert dependencies == {"x": set(), "a": {"x"}, "c": {"a"}, "e": {"c"}}
+    assert dask.get(dsk, "e") == dask.get(d, "e")
+
+    # Requested keys remain as aliases
+    dsk, dependencies = cse(d, ["c", "d"])
+    assert dsk["d"] == "c"
+    assert dask.get(dsk, ["c", "d"]) == (12, 12)
+
+    # Objects that can't be tokenized deterministically are not merged
+    o1, o2 = object(), object()
+    d = {"a": (id, o1), "b": (id, o2), ("c", 0): (id, o1), "out": (add, "a", "b")}
+    assert cse(d, ["out", ("c", 0)])[0] == d
+
+
 def fuse2(*args, **kwargs):
     """Run both ``fuse`` and ``fuse_linear`` and compare results"""
     rv1 = fuse_linear(*args, **kwargs)
@@ -1137,6 +1163,16 @@ def test_SubgraphCallable():
     assert f2(1, 2) == f(1, 2)
 
 
+def test_SubgraphCallable_tokenize():
+    from dask.base import tokenize
+
+    f1 = SubgraphCallable({"c": (inc, "a"), "d": (add, "c", "b")}, "d", ["a", "b"])
+    f2 = SubgraphCallable({"z": (inc, "x"), "w": (add, "z", "y")}, "w", ["x", "y"])
+    f3 = SubgraphCallable({"z": (inc, "y"), "w": (add, "z", "x")}, "w", ["x", "y"])
+    assert tokenize(f1) == tokenize(f2)
+    assert tokenize(f1) != tokenize(f3)
+
+
 def test_SubgraphCallable_with_numpy():
     np = pytest.importorskip("numpy")
 
@@ -1338,6 +1374,35 @@ def test_fuse_config():
         assert fuse(d, "b", dependencies=dependencies) == (d, dependencies)
 
 
+def test_fuse_max_fused_bytes():
+    def f(*args):
+        return args
+
+    d = {"a": 1, "b1": (f, "a"), "b2": (f, "a", "a"), "c": (f, "b1", "b2")}
+    fused = with_deps({"a": 1, "c": (f, (f, "a"), (f, "a", "a"))})
+    sizes = {"a": 10, "b1": 100, "b2": 100, "c": 10}
+    assert fuse(d, ave_width=2, rename_keys=False, sizes=sizes) == fused
+    assert (
+        fuse(d, ave_width=2, rename_keys=False, sizes=sizes, max_fused_bytes=200)
+        == fused
+    )
+    assert fuse(
+        d, ave_width=2, rename_keys=False, sizes=sizes, max_fused_bytes=150
+    ) == with_deps(d)
+    # Unknown sizes don't prevent fusion
+    assert fuse(d, ave_width=2, rename_keys=False, max_fused_bytes=150) == fused
+
+    with dask.config.set({"optimization.fuse.max-fused-bytes": "150B"}):
+        assert fuse(d, ave_width=2, rename_keys=False, sizes=sizes) == with_deps(d)
+
+    # Linear chains are still fused
+    d = {"a": 1, "b": (f, "a"), "c": (f, "b")}
+    sizes = {"a": 1000, "b": 1000, "c": 1000}
+    assert fuse(d, rename_keys=False, sizes=sizes, max_fused_bytes=10) == fuse(
+        d, rename_keys=False
+    )
+
+
 def test_fused_keys_max_length():  # generic fix for gh-5999
     d = {
         "u-looooooooooooooooooooooooooooooooooooooooooooooooooooooooooooooooooooooooooooooooooong": (
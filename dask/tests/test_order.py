@@ -877,3 +877,34 @@ def test_array_store_final_order(tmpdir):
     connected_max = max([v for k, v in o.items() if k in connected_stores])
     disconnected_min = min([v for k, v in o.items() if k in disconnected_stores])
     assert connected_max < disconnected_min
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_order_independent_chains(seed, monkeypatch):
+    import random
+
+    import dask.order
+
+    rng = random.Random(seed)
+    dsk = {}
+    for i in range(rng.randint(1, 50)):
+        name = rng.choice(["a", "b", ("c", i % 3)])
+        prev = None
+        for j in range(rng.randint(1, 5)):
+            key = (name, i, j) if not isinstance(name, tuple) else name + (i, j)
+            dsk[key] = (inc, prev) if prev is not None else 1
+            prev = key
+    dsk["x"] = 1  # an isolated task with a different type of key
+
+    o = order(dsk)
+    assert sorted(o.values()) == list(range(len(dsk)))
+
+    # The fast path gives the same ordering as the general algorithm
+    monkeypatch.setattr(dask.order, "_order_chains", lambda *args: None)
+    assert order(dsk) == o
+
+
+def test_order_chains_cycle():
+    dsk = {"a": (inc, "b"), "b": (inc, "a")}
+    with pytest.raises(RuntimeError, match="Cycle detected"):
+        order(dsk)
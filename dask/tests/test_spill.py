@@ -0,0 +1,133 @@
+import os
+
+import pytest
+
+import dask
+from dask.callbacks import Callback
+from dask.local import get_sync
+from dask.sizeof import sizeof
+from dask.spill import File, SpillBuffer
+from dask.threaded import get as threaded_get
+
+
+def test_file(tmpdir):
+    f = File(str(tmpdir))
+    f[("x", 0)] = 123
+    f["y"] = [1, 2, 3]
+    assert f[("x", 0)] == 123
+    assert set(f) == {("x", 0), "y"}
+    assert len(os.listdir(str(tmpdir))) == 2
+
+    f["y"] = "hello"
+    assert f["y"] == "hello"
+    assert len(os.listdir(str(tmpdir))) == 2
+
+    del f[("x", 0)]
+    assert ("x", 0) not in f
+    assert len(f) == 1
+
+    f.close()
+    assert not os.listdir(str(tmpdir))
+
+
+def test_file_temporary_directory(tmpdir):
+    with dask.config.set(temporary_directory=str(tmpdir)):
+        f = File()
+    assert not os.listdir(str(tmpdir))  # created on first use
+    f["x"] = 1
+    directory = f.directory
+    assert directory.startswith(str(tmpdir))
+    f.close()
+    assert not os.path.exists(directory)
+
+
+def test_spill_buffer():
+    a = b"a" * 100
+    b = b"b" * 100
+    c = b"c" * 100
+    buf = SpillBuffer(250)
+    buf["a"] = a
+    buf["b"] = b
+    assert set(buf.fast) == {"a", "b"}
+    assert buf.total_weight == sizeof(a) + sizeof(b)
+
+    buf["c"] = c
+    assert set(buf.fast) == {"b", "c"}
+    assert set(buf.slow) == {"a"}
+    assert set(buf) == {"a", "b", "c"}
+
+    # Reading a spilled value moves it back to memory, evicting the least
+    # recently used value
+    assert buf["a"] == a
+    assert set(buf.fast) == {"c", "a"}
+    assert set(buf.slow) == {"b"}
+
+    del buf["b"]
+    del buf["c"]
+    assert set(buf) == {"a"}
+    assert buf.total_weight == sizeof(a)
+    buf.close()
+    assert not buf
+
+
+def test_spill_buffer_large_value():
+    buf = SpillBuffer("100 B")
+    buf["x"] = b"x" * 1000
+    assert "x" in buf.slow
+    assert buf.total_weight == 0
+    assert buf["x"] == b"x" * 1000
+    buf.close()
+
+
+def test_spill_buffer_unpicklable():
+    buf = SpillBuffer(10)
+    f = lambda: None  # noqa: E731
+    buf["f"] = f
+    buf["x"] = b"x" * 100
+    assert "f" in buf.fast
+    assert buf["f"] is f
+    buf.close()
+
+
+@pytest.mark.parametrize("get", [get_sync, threaded_get])
+def test_compute_with_memory_limit(get, tmpdir):
+    def make(i):
+        return b"x" * 1000 + bytes([i])
+
+    def combine(*args):
+        return b"".join(args)
+
+    dsk = {("a", i): (make, i) for i in range(10)}
+    dsk["b"] = (combine,) + tuple(sorted(dsk))
+
+    spilled = []
+
+    class Spilled(Callback):
+        def _posttask(self, key, value, dsk, state, id):
+            spilled.append(len(state["cache"].slow))
+
+    with dask.config.set(
+        {"local.memory-limit": "2kB", "temporary-directory": str(tmpdir)}
+    ), Spilled():
+        result = get(dsk, "b")
+
+    assert result == b"".join(make(i) for i in range(10))
+    assert max(spilled) > 0
+    assert not os.listdir(str(tmpdir))
+
+
+@pytest.mark.parametrize("get", [get_sync, threaded_get])
+def test_compute_with_memory_limit_error(get, tmpdir):
+    def make(i):
+        return b"x" * 1000 + bytes([i])
+
+    def bad(*args):
+        raise ValueError("bad")
+
+    dsk = {("a", i): (make, i) for i in range(10)}
+    dsk["b"] = (bad,) + tuple(sorted(dsk))
+
+    with dask.config.set({"temporary-directory": str(tmpdir)}):
+        with pytest.raises(ValueError, match="bad"):
+            get(dsk, "b", memory_limit="1kB")
+    assert not os.listdir(str(tmpdir))
@@ -123,6 +123,101 @@ def test_dont_spawn_too_many_threads_CPU_COUNT():
     assert after <= before + CPU_COUNT * 2
 
 
+def test_io_resources():
+    io_threads = set()
+    compute_threads = set()
+
+    def read(i):
+        io_threads.add(threading.current_thread())
+        return i
+
+    def compute(x):
+        compute_threads.add(threading.current_thread())
+        return x + 1
+
+    dsk = {("read", i): (read, i) for i in range(10)}
+    dsk.update({("compute", i): (compute, ("read", i)) for i in range(10)})
+    resources = {("read", i): {"io": 1} for i in range(10)}
+    keys = [("compute", i) for i in range(10)]
+
+    result = get(dsk, keys, num_workers=2, resources=resources, io_workers=2)
+    assert result == tuple(range(1, 11))
+    assert len(io_threads) <= 2
+    assert not io_threads & compute_threads
+
+
+def test_io_readahead():
+    lock = threading.Lock()
+    waiting = [0]
+    most_waiting = [0]
+
+    def read(i):
+        with lock:
+            waiting[0] += 1
+            most_waiting[0] = max(most_waiting[0], waiting[0])
+        return i
+
+    def compute(x):
+        sleep(0.01)
+        with lock:
+            waiting[0] -= 1
+        return x
+
+    dsk = {("read", i): (read, i) for i in range(20)}
+    dsk.update({("compute", i): (compute, ("read", i)) for i in range(20)})
+    dsk["total"] = (sum, [("compute", i) for i in range(20)])
+    resources = {("read", i): {"io": 1} for i in range(20)}
+
+    with dask.config.set({"local.io-readahead": 1}):
+        assert get(dsk, "total", num_workers=1, resources=resources, io_workers=2)
+    # Reads run, or wait for compute, at most io-workers + io-readahead ahead
+    assert most_waiting[0] <= 4
+
+
+def test_io_readahead_fan_in():
+    # Both IO workers keep reading for a consumer of more reads than the limit
+    barrier = threading.Barrier(2, timeout=5)
+
+    def read(i):
+        barrier.wait()
+        return i
+
+    dsk = {("read", i): (read, i) for i in range(10)}
+    dsk["total"] = (sum, [("read", i) for i in range(10)])
+    resources = {("read", i): {"io": 1} for i in range(10)}
+
+    with dask.config.set({"local.io-readahead": 1}):
+        assert get(dsk, "total", resources=resources, io_workers=2) == 45
+
+
+def test_io_workers_invalid():
+    dsk = {"x": (inc, 1)}
+    resources = {"x": {"io": 1}}
+    with pytest.raises(ValueError, match="io_workers"):
+        get(dsk, "x", resources=resources, io_workers=0)
+    with dask.config.set({"local.io-workers": 0}):
+        with pytest.raises(ValueError, match="io_workers"):
+            get(dsk, "x", resources=resources)
+
+
+def test_io_resources_compute():
+    delayed = dask.delayed
+    io_threads = set()
+
+    def read(i):
+        io_threads.add(threading.current_thread())
+        return i
+
+    with dask.annotate(resources={"io": 1}):
+        parts = [delayed(read)(i) for i in range(4)]
+    total = delayed(sum)([delayed(inc)(p) for p in parts])
+
+    assert total.compute(scheduler="threads") == 10
+    io_workers = dask.config.get("local.io-workers")
+    io_pool = dask.threaded.pools[threading.current_thread()][("io", io_workers)]
+    assert io_threads and io_threads <= set(io_pool._pool)
+
+
 def test_thread_safety():
     def f(x):
         return 1
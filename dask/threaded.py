@@ -30,7 +30,9 @@ def pack_exception(e, dumps):
     return e, sys.exc_info()[2]
 
 
-def get(dsk, result, cache=None, num_workers=None, pool=None, **kwargs):
+def get(
+    dsk, result, cache=None, num_workers=None, pool=None, io_workers=None, **kwargs
+):
     """Threaded cached implementation of dask.get
 
     Parameters
@@ -44,6 +46,10 @@ def get(dsk, result, cache=None, num_workers=None, pool=None, **kwargs):
         The number of threads to use in the ThreadPool that will actually execute tasks
     cache: dict-like (optional)
         Temporary storage of results
+    io_workers: integer (optional)
+        The number of threads in a separate ThreadPool for tasks that need an
+        ``"io"`` resource, as set with ``dask.annotate(resources={"io": 1})``.
+        Defaults to the ``local.io-workers`` configuration value.
 
     Examples
     --------
@@ -73,6 +79,21 @@ def get(dsk, result, cache=None, num_workers=None, pool=None, **kwargs):
                 atexit.register(pool.close)
                 pools[thread][num_workers] = pool
 
+        io_pool = None
+        resources = kwargs.get("resources") or {}
+        if any(v and "io" in v for v in resources.values()):
+            if io_workers is None:
+                io_workers = config.get("local.io-workers", 4)
+            if io_workers < 1:
+                raise ValueError(
+                    "io_workers must be a positive integer, got %r" % io_workers
+                )
+            io_pool = pools[thread].get(("io", io_workers))
+            if io_pool is None:
+                io_pool = ThreadPool(io_workers)
+                atexit.register(io_pool.close)
+                pools[thread][("io", io_workers)] = io_pool
+
     results = get_async(
         pool.apply_async,
         len(pool._pool),
@@ -81,6 +102,8 @@ def get(dsk, result, cache=None, num_workers=None, pool=None, **kwargs):
         cache=cache,
         get_id=_thread_get_id,
         pack_exception=pack_exception,
+        io_apply_async=io_pool.apply_async if io_pool is not None else None,
+        num_io_workers=io_workers,
         **kwargs
     )
 